@@ -87,6 +87,15 @@ def run_bulk_comparison(csv_path: str, output_dir: str = './reports/bulk', verbo
     dest_connector = DremioConnector(**dremio_config)
     
     print("   ✅ Connections established\n")
+
+    # Resolve all table schemas with one catalog query per side
+    for connector, key, label in ((source_connector, 'hana_table', 'HANA'), (dest_connector, 'dremio_table', 'Dremio')):
+        try:
+            found = connector.prefetch_table_schemas([pair[key] for pair in table_pairs])
+            print(f"   ✅ Prefetched {found} {label} table schemas")
+        except Exception as e:
+            print(f"   ⚠️  {label} schema prefetch skipped: {str(e)}")
+    print()
     
     # Initialize comparator and report generator
     comparator = TableComparator(source_connector, dest_connector, app_config)
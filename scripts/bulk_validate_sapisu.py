@@ -8,20 +8,33 @@ organizing outputs by date into reports/ and logs/ directories.
 Usage:
     python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18
     python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --csv sapisu_tables.csv
+    python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --csv sapisu_tables.csv rfn_sapisu_tables.csv
     python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --parallel 4
+    python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --resume
+    python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --distributed coordinator
+    python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --distributed worker --parallel 4
 """
 
 import csv
-import subprocess
+import os
+import socket
 import sys
 import logging
 from pathlib import Path
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict, Any
 import argparse
-from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.stat_validator.bulk import BulkRunner, BulkTask, TaskHistory, WorkQueue
+from src.stat_validator.connectors.dremio_connector import DremioConnector
+from src.stat_validator.connectors.hana_connector import HanaConnector
+from src.stat_validator.utils.config_loader import ConfigLoader
+from src.stat_validator.utils.temporal_filters import build_date_filter, TIMESTAMP, EPOCH_MS
+
 
 # ============================================================================
 # Summary Report Generation Functions (from summarize_validation_results.py)
@@ -197,43 +210,13 @@ def generate_summary_report_content(reports: List[Dict[str, Any]], filter_date:
 # ============================================================================
 
 
-def setup_logging(log_dir: Path, table_name: str) -> logging.Logger:
-    """Setup logging for a specific table validation."""
-    log_file = log_dir / f"{table_name}.log"
-
-    # Create logger
-    logger = logging.getLogger(f"bulk_validator.{table_name}")
-    logger.setLevel(logging.DEBUG)
-
-    # Remove existing handlers to avoid duplicates
-    logger.handlers.clear()
-
-    # File handler
-    fh = logging.FileHandler(log_file)
-    fh.setLevel(logging.DEBUG)
-
-    # Console handler
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.INFO)
-
-    # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    fh.setFormatter(formatter)
-    ch.setFormatter(formatter)
-
-    logger.addHandler(fh)
-    logger.addHandler(ch)
-
-    return logger
-
-
 def read_tables_csv(csv_path: Path) -> List[Tuple[str, str, str, str]]:
     """
     Read tables from CSV file.
 
+    The Dremio table column is 'ulysses1' in sapisu_tables.csv and 'Ulysses'
+    in rfn_sapisu_tables.csv; both are accepted.
+
     Returns:
         List of tuples: (dremio_schema, dremio_table, sap_schema, sap_table)
     """
@@ -243,7 +226,7 @@ def read_tables_csv(csv_path: Path) -> List[Tuple[str, str, str, str]]:
         reader = csv.DictReader(f)
         for row in reader:
             dremio_schema = row['schema']
-            dremio_table = row['ulysses1']
+            dremio_table = row['ulysses1'] if 'ulysses1' in row else row['Ulysses']
             sap_schema = row['schema.1']
             sap_table = row['SAP EIM']
 
@@ -252,129 +235,113 @@ def read_tables_csv(csv_path: Path) -> List[Tuple[str, str, str, str]]:
     return tables
 
 
-def validate_table(
-    dremio_schema: str,
-    dremio_table: str,
-    sap_schema: str,
-    sap_table: str,
-    filter_date: str,
-    report_dir: Path,
+def prefetch_schemas(
+    tables: List[Tuple[str, str, str, str]],
+    dremio_prefix: str,
     log_dir: Path,
-    dremio_prefix: str = "ulysses1"
-) -> dict:
+    logger: logging.Logger
+) -> None:
     """
-    Run validation for a single table.
+    Load the schemas of all SAP and Dremio tables before the run.
 
-    Returns:
-        dict with validation results and metadata
+    Each side needs one catalog query (SYS.TABLE_COLUMNS on HANA,
+    INFORMATION_SCHEMA."COLUMNS" on Dremio). The schemas are saved to the log
+    directory and exposed to the per-table validation processes through
+    HANA_SCHEMA_CACHE_PATH / DREMIO_SCHEMA_CACHE_PATH, so none of them needs its
+    own schema lookups. Failures only cost the optimization, never the run.
     """
-    # Setup logging for this table
-    logger = setup_logging(log_dir, dremio_table)
-
-    # Build table names
-    dremio_full = f'{dremio_prefix}.{dremio_schema}."{dremio_table}"'
-    sap_full = f'"{sap_schema}"."{sap_table}"'
-
-    logger.info(f"Starting validation: {sap_full} → {dremio_full}")
-    logger.info(f"Filter date: {filter_date}")
-
-    # Build command
-    cmd = [
-        'python3', '-m', 'src.stat_validator.cli', 'compare-cross',
-        sap_full,
-        dremio_full,
-        '--filter-date', filter_date,
-        '--output-dir', str(report_dir),
-        '--formats', 'json',
-        '--formats', 'html'
-    ]
+    config_loader = ConfigLoader()
 
-    logger.debug(f"Command: {' '.join(cmd)}")
+    hana_cache_path = log_dir / '_hana_schemas.json'
+    try:
+        hana_config = config_loader.get_hana_config()
+        hana_config['schema_cache_path'] = str(hana_cache_path)
+        connector = HanaConnector(**hana_config)
+        try:
+            found = connector.prefetch_table_schemas(
+                [f'"{sap_schema}"."{sap_table}"' for _, _, sap_schema, sap_table in tables]
+            )
+        finally:
+            connector.close()
 
-    # Run validation
-    start_time = datetime.now()
+        os.environ['HANA_SCHEMA_CACHE_PATH'] = str(hana_cache_path)
+        logger.info(f"Prefetched {found}/{len(tables)} SAP table schemas to {hana_cache_path}")
+    except Exception as e:
+        logger.warning(f"SAP schema prefetch skipped: {str(e)}")
 
+    dremio_cache_path = log_dir / '_dremio_schemas.json'
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1 hour timeout per table
-        )
+        dremio_config = config_loader.get_dremio_config()
+        dremio_config['schema_cache_path'] = str(dremio_cache_path)
+        connector = DremioConnector(**dremio_config)
+        try:
+            found = connector.prefetch_table_schemas(
+                [f'{dremio_prefix}.{dremio_schema}."{dremio_table}"' for dremio_schema, dremio_table, _, _ in tables]
+            )
+        finally:
+            connector.close()
 
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
-
-        # Log output
-        if result.stdout:
-            logger.info("STDOUT:")
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    logger.info(f"  {line}")
-
-        if result.stderr:
-            logger.warning("STDERR:")
-            for line in result.stderr.split('\n'):
-                if line.strip():
-                    logger.warning(f"  {line}")
-
-        # Check exit code
-        if result.returncode == 0:
-            logger.info(f"✅ Validation PASSED (duration: {duration:.1f}s)")
-            status = 'PASS'
-        elif result.returncode == 1:
-            logger.error(f"❌ Validation FAILED (duration: {duration:.1f}s)")
-            status = 'FAIL'
-        else:
-            logger.error(f"⚠️  Validation ERROR (exit code: {result.returncode}, duration: {duration:.1f}s)")
-            status = 'ERROR'
+        os.environ['DREMIO_SCHEMA_CACHE_PATH'] = str(dremio_cache_path)
+        logger.info(f"Prefetched {found}/{len(tables)} Dremio table schemas to {dremio_cache_path}")
+    except Exception as e:
+        logger.warning(f"Dremio schema prefetch skipped: {str(e)}")
 
-        return {
-            'table': dremio_table,
-            'sap_table': sap_full,
-            'dremio_table': dremio_full,
-            'status': status,
-            'exit_code': result.returncode,
-            'duration': duration,
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat()
-        }
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"❌ Validation TIMEOUT (exceeded 1 hour)")
-        return {
-            'table': dremio_table,
-            'sap_table': sap_full,
-            'dremio_table': dremio_full,
-            'status': 'TIMEOUT',
-            'exit_code': -1,
-            'duration': 3600,
-            'start_time': start_time.isoformat(),
-            'end_time': datetime.now().isoformat()
-        }
+def estimate_table_sizes(
+    tasks: List[BulkTask],
+    history_path: str,
+    logger: logging.Logger
+) -> Dict[str, int]:
+    """
+    Get metadata row counts of the tables the bulk history knows nothing about.
+
+    Used to size new tables for longest-first scheduling. Only Iceberg
+    metadata is read (no scans); failures only cost the estimate.
+    """
+    known = TaskHistory(history_path).get_all()
+    unknown = [t for t in tasks if TaskHistory.task_key(t.source_table, t.dest_table) not in known]
+    if not unknown:
+        return {}
 
+    sizes = {}
+    try:
+        connector = DremioConnector(**ConfigLoader().get_dremio_config())
+        try:
+            for task in unknown:
+                rows = connector.estimate_row_count(task.dest_table)
+                if rows is not None:
+                    sizes[task.name] = rows
+        finally:
+            connector.close()
+        logger.info(f"Sized {len(sizes)}/{len(unknown)} tables without history from metadata row counts")
     except Exception as e:
-        logger.error(f"❌ Validation EXCEPTION: {str(e)}")
-        return {
-            'table': dremio_table,
-            'sap_table': sap_full,
-            'dremio_table': dremio_full,
-            'status': 'EXCEPTION',
-            'exit_code': -1,
-            'duration': 0,
-            'error': str(e),
-            'start_time': start_time.isoformat(),
-            'end_time': datetime.now().isoformat()
-        }
+        logger.warning(f"Table size estimation skipped: {str(e)}")
+
+    return sizes
 
 
 def run_bulk_validation(
-    csv_path: Path,
+    csv_paths: List[Path],
     filter_date: str,
     dremio_prefix: str = "ulysses1",
-    parallel: int = 1
+    parallel: int = 1,
+    use_cache: bool = True,
+    resume: bool = False,
+    distributed: Optional[str] = None,
+    queue_path: Optional[str] = None,
+    prefetch_depth: Optional[int] = None
 ):
-    """Run bulk validation for all tables in CSV."""
+    """
+    Run bulk validation for all tables in the CSVs (resume=True skips tables already done).
+
+    Tables of several CSVs (e.g. the raw and refined layers) run as one bulk
+    run, so comparisons reading the same SAP table can share its source scans.
+
+    With distributed='coordinator' the tables are put in a shared work queue
+    and the results of all workers are merged into the summary; with
+    distributed='worker' this host validates tables from that queue until
+    it is drained.
+    """
 
     # Parse filter date to create directory structure
     try:
@@ -393,8 +360,11 @@ def run_bulk_validation(
     base_report_dir.mkdir(parents=True, exist_ok=True)
     base_log_dir.mkdir(parents=True, exist_ok=True)
 
-    # Setup main logger
-    main_log_file = base_log_dir / '_bulk_validation.log'
+    # Setup main logger (one log per worker host in distributed runs)
+    if distributed == 'worker':
+        main_log_file = base_log_dir / f'_worker_{socket.gethostname()}.log'
+    else:
+        main_log_file = base_log_dir / '_bulk_validation.log'
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
@@ -406,62 +376,117 @@ def run_bulk_validation(
 
     logger = logging.getLogger('bulk_validator')
 
+    def log_result(result: Dict[str, Any]):
+        if result.get('resumed'):
+            logger.info(f"Already done: {result['table']} - {result['status']}")
+        elif result['status'] in ('ERROR', 'EXCEPTION', 'TIMEOUT'):
+            logger.error(f"Completed: {result['table']} - {result['status']} ({result.get('error')})")
+        else:
+            cached = ", cached" if result.get('cached') else ""
+            logger.info(f"Completed: {result['table']} - {result['status']} ({result['duration']:.1f}s{cached})")
+
+    config = ConfigLoader().get_all()
+    bulk_config = config.get('bulk', {})
+    queue = None
+    if distributed:
+        queue = WorkQueue(
+            queue_path or str(base_log_dir / '_queue.sqlite'),
+            lease_seconds=bulk_config.get('queue_lease_seconds', 300),
+            max_attempts=bulk_config.get('queue_max_attempts', 3)
+        )
+
+    if distributed == 'worker':
+        # The coordinator prefetched the schemas into the shared log directory
+        for variable, cache_file in (
+            ('HANA_SCHEMA_CACHE_PATH', '_hana_schemas.json'),
+            ('DREMIO_SCHEMA_CACHE_PATH', '_dremio_schemas.json')
+        ):
+            if (base_log_dir / cache_file).exists():
+                os.environ[variable] = str(base_log_dir / cache_file)
+
+        logger.info(f"Working on queue {queue.path} (workers: {parallel})")
+        runner = BulkRunner(
+            report_dir=str(base_report_dir),
+            log_dir=str(base_log_dir),
+            parallel=parallel,
+            use_cache=use_cache,
+            prefetch_depth=prefetch_depth
+        )
+        results = runner.run_queue(queue, on_result=log_result)
+        logger.info(f"Queue drained: this host validated {len(results)} tables in {runner.makespan['actual']:.1f}s")
+        return
+
     # Read tables
-    logger.info(f"Reading tables from {csv_path}")
-    tables = read_tables_csv(csv_path)
+    tables = []
+    for csv_path in csv_paths:
+        logger.info(f"Reading tables from {csv_path}")
+        tables.extend(table for table in read_tables_csv(csv_path) if table not in tables)
     logger.info(f"Found {len(tables)} tables to validate")
 
-    # Run validations
-    results = []
-
-    if parallel > 1:
-        logger.info(f"Running validations in parallel (workers: {parallel})")
-
-        with ProcessPoolExecutor(max_workers=parallel) as executor:
-            futures = {}
-
-            for dremio_schema, dremio_table, sap_schema, sap_table in tables:
-                future = executor.submit(
-                    validate_table,
-                    dremio_schema, dremio_table, sap_schema, sap_table,
-                    filter_date, base_report_dir, base_log_dir, dremio_prefix
-                )
-                futures[future] = dremio_table
-
-            # Process results as they complete
-            for future in as_completed(futures):
-                table_name = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    logger.info(f"Completed: {table_name} - {result['status']}")
-                except Exception as e:
-                    logger.error(f"Failed to process {table_name}: {str(e)}")
-                    results.append({
-                        'table': table_name,
-                        'status': 'EXCEPTION',
-                        'error': str(e)
-                    })
-    else:
-        logger.info("Running validations sequentially")
+    # Resolve all table schemas up front (one catalog query per side for the whole run)
+    prefetch_schemas(tables, dremio_prefix, base_log_dir, logger)
+
+    # Same temporal filters as compare-cross --filter-date
+    temporal_config = config.get('temporal_filters', {})
+    source_where = build_date_filter(temporal_config.get('sap', {}), filter_date, 'REFRESH_DT', TIMESTAMP)
+    dest_where = build_date_filter(temporal_config.get('dremio', {}), filter_date, 'refresh_dt', EPOCH_MS)
+    logger.info(f"SAP filter: WHERE {source_where}")
+    logger.info(f"Dremio filter: WHERE {dest_where}")
+
+    # Run validations in-process: each worker logs in once and reuses its connectors
+    tasks = [
+        BulkTask(
+            name=dremio_table,
+            source_table=f'"{sap_schema}"."{sap_table}"',
+            dest_table=f'{dremio_prefix}.{dremio_schema}."{dremio_table}"',
+            source_where=source_where,
+            dest_where=dest_where
+        )
+        for dremio_schema, dremio_table, sap_schema, sap_table in tables
+    ]
 
-        for idx, (dremio_schema, dremio_table, sap_schema, sap_table) in enumerate(tables, 1):
-            logger.info(f"\n{'='*80}")
-            logger.info(f"Processing table {idx}/{len(tables)}: {dremio_table}")
-            logger.info(f"{'='*80}")
+    # Longest tables first, by their duration in previous runs
+    history_path = bulk_config.get('history_path')
+    size_hints = estimate_table_sizes(tasks, history_path, logger) if history_path else {}
+
+    if distributed == 'coordinator':
+        logger.info(f"Coordinating queue {queue.path}: start workers with --distributed worker")
+        runner = BulkRunner(
+            report_dir=str(base_report_dir),
+            log_dir=str(base_log_dir),
+            parallel=parallel,
+            use_cache=use_cache,
+            history_path=history_path
+        )
 
-            result = validate_table(
-                dremio_schema, dremio_table, sap_schema, sap_table,
-                filter_date, base_report_dir, base_log_dir, dremio_prefix
-            )
-            results.append(result)
+        def log_progress(counts: Dict[str, int]):
+            logger.info("Queue: " + ", ".join(f"{state} {count}" for state, count in sorted(counts.items())))
+
+        results = runner.coordinate(queue, tasks, size_hints=size_hints, resume=resume, on_progress=log_progress)
+        for result in results:
+            log_result(result)
+    else:
+        if parallel > 1:
+            logger.info(f"Running validations in parallel (workers: {parallel})")
+        else:
+            logger.info("Running validations sequentially")
+        runner = BulkRunner(
+            report_dir=str(base_report_dir),
+            log_dir=str(base_log_dir),
+            parallel=parallel,
+            use_cache=use_cache,
+            history_path=history_path,
+            manifest_path=str(base_log_dir / '_manifest.sqlite'),
+            prefetch_depth=prefetch_depth
+        )
+        results = runner.run(tasks, on_result=log_result, size_hints=size_hints, resume=resume)
 
     # Generate summary
     logger.info(f"\n{'='*80}")
     logger.info("BULK VALIDATION SUMMARY")
     logger.info(f"{'='*80}")
 
-    passed = sum(1 for r in results if r['status'] == 'PASS')
+    passed = sum(1 for r in results if r['status'] in ['PASS', 'WARNING'])
     failed = sum(1 for r in results if r['status'] == 'FAIL')
     errors = sum(1 for r in results if r['status'] in ['ERROR', 'EXCEPTION', 'TIMEOUT'])
 
@@ -473,6 +498,29 @@ def run_bulk_validation(
     total_duration = sum(r.get('duration', 0) for r in results)
     logger.info(f"Total duration: {total_duration:.1f}s ({total_duration/60:.1f} minutes)")
 
+    # Time spent waiting for a HANA / Dremio slot (concurrency caps in config.yaml)
+    queue_wait = {}
+    for r in results:
+        for source, stats in r.get('queue_wait', {}).items():
+            totals = queue_wait.setdefault(source, {'queries': 0, 'wait_seconds': 0.0})
+            totals['queries'] += stats['queries']
+            totals['wait_seconds'] = round(totals['wait_seconds'] + stats['wait_seconds'], 3)
+    for source, totals in queue_wait.items():
+        logger.info(f"Queue wait ({source}): {totals['wait_seconds']:.1f}s over {totals['queries']} queries")
+
+    # Source queries answered from another comparison of the same SAP table
+    shared_scans = sum(r.get('shared_scans', 0) for r in results)
+    if shared_scans:
+        logger.info(f"Shared source scans: {shared_scans} SAP queries reused across comparisons")
+
+    predicted, actual = runner.makespan['predicted'], runner.makespan['actual']
+    if predicted is not None:
+        logger.info(f"Makespan: {actual:.1f}s actual, {predicted:.1f}s predicted")
+    elif distributed:
+        logger.info(f"Makespan: {actual:.1f}s (distributed run)")
+    else:
+        logger.info(f"Makespan: {actual:.1f}s (no prediction: no table history yet)")
+
     # List failed tables
     if failed > 0:
         logger.info(f"\n❌ Failed tables:")
@@ -497,6 +545,10 @@ def run_bulk_validation(
             'failed': failed,
             'errors': errors,
             'total_duration': total_duration,
+            'makespan': runner.makespan,
+            'workers': sorted({r['worker'] for r in results if r.get('worker')}),
+            'queue_wait': queue_wait,
+            'shared_scans': shared_scans,
             'results': results
         }, f, indent=2)
 
@@ -581,11 +633,24 @@ Examples:
   # Use custom CSV file
   python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --csv custom_tables.csv
 
+  # Validate the raw and refined layers together (each SAP table is scanned once)
+  python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --csv sapisu_tables.csv rfn_sapisu_tables.csv
+
   # Run validations in parallel (4 workers)
   python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --parallel 4
 
   # Use different Dremio prefix
   python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --dremio-prefix ulysses12
+
+  # Compare every table again, even those unchanged since the last run
+  python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --no-cache
+
+  # Continue an interrupted run: skip finished tables, retry failed/interrupted ones
+  python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --resume
+
+  # Spread a run over several hosts sharing the reports/ and logs/ directories
+  python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --distributed coordinator
+  python scripts/bulk_validate_sapisu.py --filter-date 2025-10-18 --distributed worker --parallel 4  # on each host
         """
     )
 
@@ -597,8 +662,9 @@ Examples:
 
     parser.add_argument(
         '--csv',
-        default='sapisu_tables.csv',
-        help='Path to CSV file with table mappings (default: sapisu_tables.csv)'
+        nargs='+',
+        default=['sapisu_tables.csv'],
+        help='Path(s) to CSV files with table mappings, validated as one run (default: sapisu_tables.csv)'
     )
 
     parser.add_argument(
@@ -614,20 +680,56 @@ Examples:
         help='Number of parallel workers (default: 1 = sequential)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached results of unchanged tables and compare everything again'
+    )
+
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume the last run for this date: skip tables already done, retry failed or interrupted ones'
+    )
+
+    parser.add_argument(
+        '--prefetch-depth',
+        type=int,
+        help='Tables each worker fetches ahead while it tests the current one (default: bulk.prefetch_depth; 0 = off)'
+    )
+
+    parser.add_argument(
+        '--distributed',
+        choices=['coordinator', 'worker'],
+        help='Multi-host run: the coordinator queues the tables and merges the results, '
+             'workers (any number, on any host) validate tables from the queue'
+    )
+
+    parser.add_argument(
+        '--queue',
+        help='Work queue file on the shared filesystem (default: <logs dir>/_queue.sqlite)'
+    )
+
     args = parser.parse_args()
 
-    # Validate CSV exists
-    csv_path = Path(args.csv)
-    if not csv_path.exists():
-        print(f"❌ CSV file not found: {csv_path}")
-        sys.exit(1)
+    # Validate CSVs exist
+    csv_paths = [Path(csv) for csv in args.csv]
+    for csv_path in csv_paths:
+        if not csv_path.exists():
+            print(f"❌ CSV file not found: {csv_path}")
+            sys.exit(1)
 
     # Run bulk validation
     run_bulk_validation(
-        csv_path=csv_path,
+        csv_paths=csv_paths,
         filter_date=args.filter_date,
         dremio_prefix=args.dremio_prefix,
-        parallel=args.parallel
+        parallel=args.parallel,
+        use_cache=not args.no_cache,
+        resume=args.resume,
+        distributed=args.distributed,
+        queue_path=args.queue,
+        prefetch_depth=args.prefetch_depth
     )
 
 
@@ -8,6 +8,9 @@ for a specific month and year.
 Usage:
     python3 scripts/dbt_validate_monthly.py --year 2025 --month 7 --table rfn_but000
     python3 scripts/dbt_validate_monthly.py --year 2025 --month 7  # All tables from CSV
+    python3 scripts/dbt_validate_monthly.py --year 2025 --month 7 --parallel 8  # 8 tables at a time
+    python3 scripts/dbt_validate_monthly.py --year 2025 --month 7 --resume  # Continue an interrupted run
+    python3 scripts/dbt_validate_monthly.py --from 2024-08 --to 2025-07  # Backfill a year in one pass
 """
 
 import argparse
@@ -15,19 +18,26 @@ import csv
 import json
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, List, Dict, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.stat_validator.bulk.manifest import DONE, FAILED, RunManifest
+from src.stat_validator.comparison.comparator import TableComparator
 from src.stat_validator.connectors.dremio_connector import DremioConnector
 from src.stat_validator.connectors.hana_connector import HanaConnector
 from src.stat_validator.comparison.dbt_comparator import DBTComparator
 from src.stat_validator.parsers.dbt_sql_parser import DBTSQLParser
 from src.stat_validator.utils.config_loader import ConfigLoader
+from src.stat_validator.utils.result_cache import ResultCache
 from src.stat_validator.reporting.excel_generator import ExcelGenerator
+from src.stat_validator.utils.admission import SourceLimiter
+from src.stat_validator.utils.temporal_filters import months_in_range
 
 
 # Configure logging
@@ -38,6 +48,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def parse_month(value: str) -> Tuple[int, int]:
+    """Parse a 'YYYY-MM' command line argument into (year, month)."""
+    try:
+        parsed = datetime.strptime(value, '%Y-%m')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid month: {value}. Expected YYYY-MM (e.g., 2025-07).")
+    return parsed.year, parsed.month
+
+
 def load_table_mappings(csv_path: str) -> List[Dict[str, str]]:
     """
     Load table mappings from CSV file.
@@ -133,6 +152,198 @@ def format_text_report(result) -> str:
     return "\n".join(lines)
 
 
+class MonthlyResults:
+    """Thread-safe collector of the table results of a monthly run, kept in table order."""
+
+    def __init__(self, table_names: List[str]):
+        """
+        Initialize the collector.
+
+        Args:
+            table_names: Tables of the run, in the order the reports list them
+        """
+        self._order = {name: index for index, name in enumerate(table_names)}
+        self._lock = threading.Lock()
+        self._results = {}
+        self._daily_breakdowns = {}
+
+    def add(self, table_name: str, result, daily_breakdown: Dict[str, Any]):
+        """Record the result and daily breakdown of one table (callable from any thread)."""
+        with self._lock:
+            self._results[table_name] = result
+            self._daily_breakdowns[table_name] = daily_breakdown
+
+    @property
+    def results(self) -> List[Any]:
+        """ComparisonResults of the finished tables, in table order."""
+        with self._lock:
+            return [self._results[name] for name in sorted(self._results, key=self._order.get)]
+
+    @property
+    def daily_breakdowns(self) -> Dict[str, Dict[str, Any]]:
+        """Daily breakdowns of the finished tables, by table name."""
+        with self._lock:
+            return dict(self._daily_breakdowns)
+
+
+def attach_source_limiters(config: Dict[str, Any], dremio_engine: Optional[str], connectors: Dict[str, Any]):
+    """
+    Cap the concurrent queries of all validation threads against each source.
+
+    Uses the same 'concurrency' config section as bulk runs (per Dremio engine
+    via 'dremio_engines'); sources without a cap are left unlimited.
+
+    Args:
+        config: Configuration dictionary
+        dremio_engine: Dremio engine the queries run on (from DREMIO_ENGINE)
+        connectors: Connector of each source ('hana', 'dremio')
+    """
+    concurrency = config.get('concurrency', {})
+    limits = {
+        'hana': concurrency.get('hana'),
+        'dremio': concurrency.get('dremio'),
+    }
+    engine_limits = concurrency.get('dremio_engines') or {}
+    if dremio_engine in engine_limits:
+        limits['dremio'] = engine_limits[dremio_engine]
+
+    for source, limit in limits.items():
+        if limit:
+            connectors[source].limiter = SourceLimiter(source, threading.BoundedSemaphore(int(limit)))
+            logger.info(f"At most {int(limit)} concurrent {source} queries")
+
+
+def validate_table(
+    table_info: Dict[str, str],
+    comparator: DBTComparator,
+    manifests: Dict[Tuple[int, int], RunManifest],
+    output_dirs: Dict[Tuple[int, int], Path],
+    months: List[Tuple[int, int]],
+    timestamp: str
+) -> List[Tuple[Tuple[int, int], Any, Dict[str, Any]]]:
+    """
+    Validate one table for each month: stats comparison with daily breakdown, and reports.
+
+    Args:
+        table_info: Table mapping (as returned by load_table_mappings())
+        comparator: DBT comparator (shared by all validation threads)
+        manifests: Run manifest of each month, recording the table's progress
+        output_dirs: Directory for the reports of each month
+        months: (year, month) tuples to validate, oldest first
+        timestamp: Timestamp of the run, used in report file names
+
+    Returns:
+        List of ((year, month), ComparisonResult, daily breakdown), one per month
+    """
+    table_name = table_info['dremio_table']
+    for month_key in months:
+        manifests[month_key].start(table_name)
+
+    logger.info(f"Validating {table_name}...")
+
+    table_args = {key: table_info[key] for key in ('dremio_schema', 'dremio_table', 'sap_schema', 'sap_table')}
+    try:
+        # One scan per side gives every month's stats and the daily breakdowns for the Excel reports
+        compared = comparator.compare_table_months(months=months, **table_args)
+    except Exception as e:
+        # Continue without daily breakdowns: compare each month with the ungrouped stats query
+        logger.warning(f"  Could not fetch daily breakdown of {table_name}: {e}")
+        compared = [
+            (
+                comparator.compare_table(year=year, month=month, **table_args),
+                {'table_name': table_name, 'year': year, 'month': month, 'daily_data': []}
+            )
+            for year, month in months
+        ]
+
+    validated = []
+    for (year, month), (result, daily_breakdown) in zip(months, compared):
+        period = f"{table_name} {year}-{month:02d}"
+        logger.info(f"  {period} status: {result.overall_status}")
+        logger.info(f"  {period} row count: SAP={result.sap_stats.row_count:,}, Dremio={result.dremio_stats.row_count:,}")
+
+        drift_days = sum(1 for day in daily_breakdown['daily_data'] if day['null_drift'])
+        if drift_days:
+            logger.info(f"  {period} null rate drift on {drift_days} day(s)")
+
+        # Save individual reports (text and JSON)
+        output_dir = output_dirs[(year, month)]
+        txt_file = output_dir / f"{table_name}_{year}{month:02d}_{timestamp}.txt"
+        with open(txt_file, 'w') as f:
+            f.write(format_text_report(result))
+        logger.info(f"  Text report: {txt_file}")
+
+        json_file = output_dir / f"{table_name}_{year}{month:02d}_{timestamp}.json"
+        with open(json_file, 'w') as f:
+            json.dump(comparator.to_dict(result), f, indent=2)
+        logger.info(f"  JSON report: {json_file}")
+
+        manifests[(year, month)].finish(
+            table_name, DONE, result_path=str(json_file),
+            outcome={'result': comparator.to_dict(result), 'daily_breakdown': daily_breakdown}
+        )
+        validated.append(((year, month), result, daily_breakdown))
+
+    return validated
+
+
+def write_month_summary(
+    output_dir: Path,
+    year: int,
+    month: int,
+    results: List[Any],
+    daily_breakdowns: Dict[str, Dict[str, Any]],
+    timestamp: str
+):
+    """
+    Write the text and Excel summaries of one month.
+
+    Args:
+        output_dir: Directory for the month's reports
+        year: Year validated
+        month: Month validated
+        results: ComparisonResults of the month's tables
+        daily_breakdowns: Daily breakdown of each table, by table name
+        timestamp: Timestamp of the run, used in report file names
+    """
+    summary_file = output_dir / f"summary_{year}{month:02d}_{timestamp}.txt"
+    with open(summary_file, 'w') as f:
+        f.write("=" * 80 + "\n")
+        f.write(f"DBT MONTHLY VALIDATION SUMMARY\n")
+        f.write("=" * 80 + "\n")
+        f.write(f"Period: {year}-{month:02d}\n")
+        f.write(f"Total tables: {len(results)}\n")
+        f.write(f"Passed: {sum(1 for r in results if r.overall_status == 'PASS')}\n")
+        f.write(f"Failed: {sum(1 for r in results if r.overall_status == 'FAIL')}\n")
+        f.write("\n")
+        f.write("-" * 80 + "\n")
+        f.write(f"{'Table':<40} {'Status':>10} {'Row Diff %':>15}\n")
+        f.write("-" * 80 + "\n")
+        # Sort by absolute row difference percentage (largest first)
+        sorted_results = sorted(results, key=lambda r: abs(r.row_count_diff_pct), reverse=True)
+        for result in sorted_results:
+            f.write(f"{result.table_name:<40} {result.overall_status:>10} {result.row_count_diff_pct:>14.2f}%\n")
+        f.write("=" * 80 + "\n")
+
+    logger.info(f"\nSummary report: {summary_file}")
+
+    # Generate Excel report with summary and daily breakdowns
+    try:
+        excel_file = output_dir / f"summary_{year}{month:02d}_{timestamp}.xlsx"
+        logger.info(f"\nGenerating Excel report...")
+        excel_generator = ExcelGenerator()
+        excel_generator.generate_validation_report(
+            output_path=excel_file,
+            results=results,
+            daily_breakdowns=daily_breakdowns,
+            year=year,
+            month=month
+        )
+        logger.info(f"Excel report: {excel_file}")
+    except Exception as e:
+        logger.error(f"Error generating Excel report: {e}", exc_info=True)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate SAP source tables (with DBT filters) against Dremio refined tables"
@@ -140,15 +351,25 @@ def main():
     parser.add_argument(
         '--year',
         type=int,
-        required=True,
         help='Year to validate (e.g., 2025)'
     )
     parser.add_argument(
         '--month',
         type=int,
-        required=True,
         help='Month to validate (1-12)'
     )
+    parser.add_argument(
+        '--from',
+        dest='from_month',
+        type=parse_month,
+        help='First month of a range to validate in one pass, as YYYY-MM (instead of --year/--month)'
+    )
+    parser.add_argument(
+        '--to',
+        dest='to_month',
+        type=parse_month,
+        help='Last month of the range, as YYYY-MM (inclusive)'
+    )
     parser.add_argument(
         '--table',
         type=str,
@@ -172,21 +393,49 @@ def main():
         default='config/config.yaml',
         help='Configuration file path (default: config/config.yaml)'
     )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Resume the last run for these months: skip tables already done, retry failed or interrupted ones'
+    )
+    parser.add_argument(
+        '--parallel', '-p',
+        type=int,
+        default=1,
+        help='Number of tables validated at once (default: 1 = sequential); '
+             'queries are capped per source by the concurrency config'
+    )
 
     args = parser.parse_args()
 
-    # Validate month
-    if not 1 <= args.month <= 12:
-        logger.error(f"Invalid month: {args.month}. Must be between 1 and 12.")
+    # Validate the period: one month, or a range of months
+    if args.from_month or args.to_month:
+        if not (args.from_month and args.to_month) or args.year or args.month:
+            parser.error("--from and --to go together, instead of --year/--month")
+        months = months_in_range(args.from_month, args.to_month)
+        if not months:
+            logger.error("Invalid range: --to is before --from.")
+            sys.exit(1)
+    else:
+        if args.year is None or args.month is None:
+            parser.error("either --year and --month, or --from and --to, are required")
+        if not 1 <= args.month <= 12:
+            logger.error(f"Invalid month: {args.month}. Must be between 1 and 12.")
+            sys.exit(1)
+        months = [(args.year, args.month)]
+    if args.parallel < 1:
+        logger.error(f"Invalid --parallel: {args.parallel}. Must be at least 1.")
         sys.exit(1)
 
     # Load configuration
     config_loader = ConfigLoader(args.config)
     config = config_loader.get_all()
 
-    # Create output directory with hierarchical structure: sap/year/month
-    output_dir = Path(args.output_dir) / "sap" / str(args.year) / f"{args.month:02d}"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    # Create output directories with hierarchical structure: sap/year/month
+    output_dirs = {}
+    for year, month in months:
+        output_dirs[(year, month)] = Path(args.output_dir) / "sap" / str(year) / f"{month:02d}"
+        output_dirs[(year, month)].mkdir(parents=True, exist_ok=True)
 
     # Load table mappings
     csv_path = Path(args.csv)
@@ -203,7 +452,7 @@ def main():
             logger.error(f"Table {args.table} not found in {csv_path}")
             sys.exit(1)
 
-    logger.info(f"Loaded {len(tables)} table(s) to validate")
+    logger.info(f"Loaded {len(tables)} table(s) to validate over {len(months)} month(s)")
 
     # Initialize connectors
     logger.info("Connecting to Dremio...")
@@ -214,112 +463,81 @@ def main():
     hana_config = config_loader.get_hana_config()
     sap_connector = HanaConnector(**hana_config)
 
+    # All validation threads share the connectors; cap their queries per source
+    attach_source_limiters(config, dremio_config.get('engine'), {'hana': sap_connector, 'dremio': dremio_connector})
+
     # Initialize comparator
     dbt_parser = DBTSQLParser()
     comparator = DBTComparator(dremio_connector, sap_connector, dbt_parser)
 
-    # Run validations
-    results = []
-    daily_breakdowns = {}
+    # Run manifest of each month: per-table state, so an interrupted run can be resumed with --resume
+    # (a range run records every month, so each can also be resumed on its own)
+    settings_digest = TableComparator.settings_digest(config)
+    manifests = {}
+    done = {}
+    for year, month in months:
+        manifest = RunManifest(str(output_dirs[(year, month)] / '_manifest.sqlite'))
+        if not args.resume:
+            manifest.reset()
+        done[(year, month)] = manifest.register({
+            t['dremio_table']: ResultCache.digest({'table': t, 'year': year, 'month': month, 'config': settings_digest})
+            for t in tables
+        })
+        manifests[(year, month)] = manifest
+
+    # Run validations (tables in parallel; results are collected in table order, per month)
+    collected = {month_key: MonthlyResults([t['dremio_table'] for t in tables]) for month_key in months}
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    # A table is skipped only if every month is done; otherwise its single scan covers all of them again
+    pending = []
     for table_info in tables:
+        table_name = table_info['dremio_table']
+        if all(table_name in done[month_key] for month_key in months):
+            for month_key in months:
+                outcome = done[month_key][table_name]['outcome']
+                collected[month_key].add(table_name, comparator.from_dict(outcome['result']), outcome['daily_breakdown'])
+            logger.info(f"Already done: {table_name}")
+        else:
+            pending.append(table_info)
+    if len(pending) < len(tables):
+        logger.info(f"Resuming: {len(tables) - len(pending)} of {len(tables)} table(s) already done")
+
+    def run(table_info: Dict[str, str]):
+        table_name = table_info['dremio_table']
         try:
-            logger.info(f"Validating {table_info['dremio_table']}...")
-
-            result = comparator.compare_table(
-                dremio_schema=table_info['dremio_schema'],
-                dremio_table=table_info['dremio_table'],
-                sap_schema=table_info['sap_schema'],
-                sap_table=table_info['sap_table'],
-                year=args.year,
-                month=args.month
+            for month_key, result, daily_breakdown in validate_table(
+                table_info, comparator, manifests, output_dirs, months, timestamp
+            ):
+                collected[month_key].add(table_name, result, daily_breakdown)
+        except Exception as e:
+            logger.error(f"Error validating {table_name}: {e}", exc_info=True)
+            for manifest in manifests.values():
+                manifest.finish(table_name, FAILED)
+
+    started = datetime.now()
+    workers = min(args.parallel, len(pending)) or 1
+    if workers > 1:
+        logger.info(f"Validating {len(pending)} table(s) with {workers} parallel workers")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dbt-table') as executor:
+        list(executor.map(run, pending))
+    logger.info(f"Validated {len(pending)} table(s) in {(datetime.now() - started).total_seconds():.1f}s")
+
+    for connector in (sap_connector, dremio_connector):
+        if connector.limiter is not None:
+            stats = connector.limiter.stats()
+            logger.info(
+                f"Queue wait ({connector.limiter.name}): {stats['wait_seconds']:.1f}s "
+                f"over {stats['queries']} queries (max {stats['max_wait_seconds']:.1f}s)"
             )
 
-            results.append(result)
-
-            logger.info(f"  Status: {result.overall_status}")
-            logger.info(f"  Row count: SAP={result.sap_stats.row_count:,}, Dremio={result.dremio_stats.row_count:,}")
-
-            # Save individual reports
-            table_name = table_info['dremio_table']
-
-            # Save text report
-            txt_file = output_dir / f"{table_name}_{args.year}{args.month:02d}_{timestamp}.txt"
-            with open(txt_file, 'w') as f:
-                f.write(format_text_report(result))
-            logger.info(f"  Text report: {txt_file}")
-
-            # Save JSON report
-            json_file = output_dir / f"{table_name}_{args.year}{args.month:02d}_{timestamp}.json"
-            with open(json_file, 'w') as f:
-                json.dump(comparator.to_dict(result), f, indent=2)
-            logger.info(f"  JSON report: {json_file}")
-
-            # Get daily breakdown for Excel report
-            try:
-                logger.info(f"  Fetching daily breakdown...")
-                daily_breakdown = comparator.get_daily_breakdown(
-                    dremio_schema=table_info['dremio_schema'],
-                    dremio_table=table_info['dremio_table'],
-                    sap_schema=table_info['sap_schema'],
-                    sap_table=table_info['sap_table'],
-                    year=args.year,
-                    month=args.month
-                )
-                daily_breakdowns[table_name] = daily_breakdown
-            except Exception as e:
-                logger.warning(f"  Could not fetch daily breakdown: {e}")
-                # Continue even if daily breakdown fails
-                daily_breakdowns[table_name] = {
-                    'table_name': table_name,
-                    'year': args.year,
-                    'month': args.month,
-                    'daily_data': []
-                }
-
-        except Exception as e:
-            logger.error(f"Error validating {table_info['dremio_table']}: {e}", exc_info=True)
-            continue
-
-    # Generate summary report
-    if results:
-        summary_file = output_dir / f"summary_{args.year}{args.month:02d}_{timestamp}.txt"
-        with open(summary_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write(f"DBT MONTHLY VALIDATION SUMMARY\n")
-            f.write("=" * 80 + "\n")
-            f.write(f"Period: {args.year}-{args.month:02d}\n")
-            f.write(f"Total tables: {len(results)}\n")
-            f.write(f"Passed: {sum(1 for r in results if r.overall_status == 'PASS')}\n")
-            f.write(f"Failed: {sum(1 for r in results if r.overall_status == 'FAIL')}\n")
-            f.write("\n")
-            f.write("-" * 80 + "\n")
-            f.write(f"{'Table':<40} {'Status':>10} {'Row Diff %':>15}\n")
-            f.write("-" * 80 + "\n")
-            # Sort by absolute row difference percentage (largest first)
-            sorted_results = sorted(results, key=lambda r: abs(r.row_count_diff_pct), reverse=True)
-            for result in sorted_results:
-                f.write(f"{result.table_name:<40} {result.overall_status:>10} {result.row_count_diff_pct:>14.2f}%\n")
-            f.write("=" * 80 + "\n")
-
-        logger.info(f"\nSummary report: {summary_file}")
-
-        # Generate Excel report with summary and daily breakdowns
-        try:
-            excel_file = output_dir / f"summary_{args.year}{args.month:02d}_{timestamp}.xlsx"
-            logger.info(f"\nGenerating Excel report...")
-            excel_generator = ExcelGenerator()
-            excel_generator.generate_validation_report(
-                output_path=excel_file,
-                results=results,
-                daily_breakdowns=daily_breakdowns,
-                year=args.year,
-                month=args.month
+    # Generate summary reports (one per month)
+    for (year, month), month_results in collected.items():
+        results = month_results.results
+        if results:
+            write_month_summary(
+                output_dirs[(year, month)], year, month, results, month_results.daily_breakdowns, timestamp
             )
-            logger.info(f"Excel report: {excel_file}")
-        except Exception as e:
-            logger.error(f"Error generating Excel report: {e}", exc_info=True)
 
     # Close connectors
     dremio_connector.close()
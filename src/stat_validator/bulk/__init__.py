@@ -0,0 +1,8 @@
+"""In-process bulk validation of many table pairs."""
+
+from .manifest import RunManifest
+from .runner import BulkRunner, BulkTask
+from .scheduler import TaskHistory, plan_schedule
+from .work_queue import WorkQueue
+
+__all__ = ['BulkRunner', 'BulkTask', 'RunManifest', 'TaskHistory', 'plan_schedule', 'WorkQueue']
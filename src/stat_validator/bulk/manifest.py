@@ -0,0 +1,156 @@
+"""Durable per-table state of a bulk run, so an interrupted run can be resumed."""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger('run_manifest')
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class RunManifest:
+    """
+    SQLite journal of the tables of one bulk run.
+
+    Every table moves from pending to running to done or failed, together
+    with the config hash it was validated with and its result (report path
+    and outcome). A resumed run skips the tables that are done under the same
+    config hash and retries the rest; a table left 'running' was interrupted.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the manifest, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS run_tasks (
+                    task_name TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    config_hash TEXT NOT NULL,
+                    result_path TEXT,
+                    outcome TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from any thread or process)."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    def reset(self):
+        """Forget all tables (start a fresh run)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM run_tasks")
+
+    def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every table.
+
+        Returns:
+            Dictionary mapping table name to its 'state', 'config_hash',
+            'result_path', 'outcome', 'attempts' and 'updated_at'
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT task_name, state, config_hash, result_path, outcome, attempts, updated_at "
+                "FROM run_tasks"
+            ).fetchall()
+
+        return {
+            row[0]: {
+                'state': row[1],
+                'config_hash': row[2],
+                'result_path': row[3],
+                'outcome': json.loads(row[4]) if row[4] else None,
+                'attempts': row[5],
+                'updated_at': row[6]
+            }
+            for row in rows
+        }
+
+    def register(self, config_hashes: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Add the tables of a run, keeping what is still valid from an earlier attempt.
+
+        Tables that are new, or whose config hash changed, start over as
+        pending; the others keep their state.
+
+        Args:
+            config_hashes: Config hash of each table of the run, by table name
+
+        Returns:
+            Tables that are already done under the same config hash, as returned
+            by get_all()
+        """
+        existing = self.get_all()
+        now = datetime.now().isoformat()
+
+        with closing(self._connect()) as conn, conn:
+            for name, config_hash in config_hashes.items():
+                entry = existing.get(name)
+                if entry is None or entry['config_hash'] != config_hash:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO run_tasks (task_name, state, config_hash, updated_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        (name, PENDING, config_hash, now)
+                    )
+
+        return {
+            name: entry for name, entry in existing.items()
+            if entry['state'] == DONE and entry['config_hash'] == config_hashes.get(name)
+        }
+
+    def start(self, name: str):
+        """Mark a table as running (a new attempt)."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE run_tasks SET state = ?, attempts = attempts + 1, updated_at = ? WHERE task_name = ?",
+                (RUNNING, datetime.now().isoformat(), name)
+            )
+
+    def finish(
+        self,
+        name: str,
+        state: str,
+        result_path: Optional[str] = None,
+        outcome: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Mark a table as done or failed.
+
+        Args:
+            name: Table name
+            state: DONE or FAILED
+            result_path: Path of the table's result report
+            outcome: Structured result of the table (returned again on resume)
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE run_tasks SET state = ?, result_path = ?, outcome = ?, updated_at = ? WHERE task_name = ?",
+                (
+                    state, result_path,
+                    json.dumps(outcome, default=str) if outcome is not None else None,
+                    datetime.now().isoformat(), name
+                )
+            )
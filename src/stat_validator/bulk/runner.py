@@ -0,0 +1,1091 @@
+"""In-process bulk validation engine: long-lived workers with their own connectors."""
+
+import contextlib
+import contextvars
+import itertools
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..comparison.comparator import TableComparator
+from ..connectors.dremio_connector import DremioConnector
+from ..connectors.hana_connector import HanaConnector
+from ..reporting.report_generator import ReportGenerator
+from ..utils.admission import SourceLimiter
+from ..utils.config_loader import ConfigLoader
+from ..utils.logger import get_logger
+from ..utils.result_cache import ResultCache
+from ..utils.scan_share import ScanShare
+from .manifest import DONE, FAILED, RunManifest
+from .scheduler import TaskHistory, plan_schedule
+from .work_queue import LEASED, WorkQueue
+
+logger = get_logger('bulk_runner')
+
+# Per-process worker state, created once by _init_worker
+_worker: Dict[str, Any] = {}
+
+# Log file of the table the current context works on (see _table_output)
+_table_log: contextvars.ContextVar = contextvars.ContextVar('table_log', default=None)
+
+# Distinct cache namespaces for the comparisons a worker has in flight
+_namespaces = itertools.count()
+
+
+@dataclass
+class BulkTask:
+    """One table pair to validate in a bulk run."""
+    name: str
+    source_table: str
+    dest_table: str
+    source_where: Optional[str] = None
+    dest_where: Optional[str] = None
+    columns: Optional[List[str]] = None
+
+
+def _init_worker(
+    config_path: Optional[str],
+    env_path: Optional[str],
+    cache_dir: str,
+    semaphores: Optional[Dict[str, Any]] = None,
+    scan_share: Optional[ScanShare] = None
+):
+    """
+    Connect to HANA and Dremio once for the lifetime of a worker.
+
+    Each worker gets its own DuckDB cache file, so concurrent comparisons never
+    contend for the same database. Semaphores shared by all workers (by
+    source name) cap the queries the run sends to each source at once. A
+    scan share lets comparisons that read the same source table run each
+    source query once.
+    """
+    config_loader = ConfigLoader(config_path=config_path, env_path=env_path)
+    cache_db = os.path.join(cache_dir, f"_bulk_worker_{os.getpid()}.duckdb")
+
+    hana_config = config_loader.get_hana_config()
+    hana_config['db'] = cache_db
+    dremio_config = config_loader.get_dremio_config()
+    dremio_config['db'] = cache_db
+
+    _worker['config'] = config_loader.get_all()
+    _worker['source_connector'] = HanaConnector(**hana_config)
+    _worker['dest_connector'] = DremioConnector(**dremio_config)
+
+    semaphores = semaphores or {}
+    for source, key in (('hana', 'source_connector'), ('dremio', 'dest_connector')):
+        if semaphores.get(source) is not None:
+            _worker[key].limiter = SourceLimiter(source, semaphores[source])
+    _worker['source_connector'].scan_share = scan_share
+    logger.info(f"Bulk worker {os.getpid()} connected (cache: {cache_db})")
+
+
+def _close_worker():
+    """Close the worker's connectors (sequential runs only; pool workers exit with the pool)."""
+    for key in ('source_connector', 'dest_connector'):
+        connector = _worker.pop(key, None)
+        if connector is not None:
+            connector.close()
+    _worker.clear()
+
+
+def _scan_volume(result: Dict[str, Any]) -> Dict[str, Optional[int]]:
+    """Rows counted and bytes cached by a comparison, for the task history."""
+    rows_scanned = None
+    for test in result.get('tests', []):
+        details = test.get('details') or {}
+        if test.get('test_name') == 'row_count' and 'source_count' in details:
+            rows_scanned = details['source_count'] + details['dest_count']
+
+    cache = result.get('timings', {}).get('cache', {})
+    side_bytes = [cache.get('source_bytes'), cache.get('dest_bytes')]
+    bytes_transferred = sum(side_bytes) if None not in side_bytes else None
+
+    return {'rows_scanned': rows_scanned, 'bytes_transferred': bytes_transferred}
+
+
+def _queue_wait() -> Dict[str, Dict[str, Any]]:
+    """Cumulative queue-wait statistics of the worker's limited sources."""
+    return {
+        connector.limiter.name: connector.limiter.stats()
+        for connector in (_worker['source_connector'], _worker['dest_connector'])
+        if connector.limiter is not None
+    }
+
+
+class _RoutedStdout:
+    """Stand-in for sys.stdout that writes to the log file of the calling context's table."""
+
+    def __init__(self, fallback: Any):
+        self.fallback = fallback
+
+    def write(self, text: str) -> int:
+        return (_table_log.get() or self.fallback).write(text)
+
+    def flush(self):
+        (_table_log.get() or self.fallback).flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fallback, name)
+
+
+class _UnroutedRecords(logging.Handler):
+    """Passes package log records that belong to no table on to the root logger (the run's main log)."""
+
+    def emit(self, record: logging.LogRecord):
+        if _table_log.get() is None:
+            logging.getLogger().handle(record)
+
+
+@contextlib.contextmanager
+def _routed_output(log_dir: Optional[str]):
+    """
+    Keep per-table detail out of the run's main log while a worker validates tables.
+
+    Progress output and package log records go to the log file of the table
+    the emitting context works on (see _table_output), so tables fetched and
+    tested at the same time never mix their logs; everything else still
+    reaches the main log.
+    """
+    if not log_dir:
+        yield
+        return
+
+    package_logger = logging.getLogger('stat_validator')
+    forwarder = _UnroutedRecords()
+    propagate = package_logger.propagate
+    package_logger.addHandler(forwarder)
+    package_logger.propagate = False
+    try:
+        with contextlib.redirect_stdout(_RoutedStdout(sys.stdout)):
+            yield
+    finally:
+        package_logger.propagate = propagate
+        package_logger.removeHandler(forwarder)
+
+
+@contextlib.contextmanager
+def _table_output(log_dir: Optional[str], name: str):
+    """Send the calling context's progress output and log records to log_dir/<name>.log."""
+    if not log_dir:
+        yield
+        return
+
+    with open(Path(log_dir) / f"{name}.log", 'a') as log_file:
+        handler = logging.StreamHandler(log_file)
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        handler.addFilter(lambda record: _table_log.get() is log_file)
+        package_logger = logging.getLogger('stat_validator')
+        package_logger.addHandler(handler)
+        token = _table_log.set(log_file)
+        try:
+            yield
+        finally:
+            _table_log.reset(token)
+            package_logger.removeHandler(handler)
+
+
+def _prepare_task(
+    task: BulkTask,
+    log_dir: Optional[str],
+    use_cache: bool,
+    manifest_path: Optional[str] = None,
+    checkpoint_root: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    First stage of a task: everything that queries the sources (TableComparator.prepare()).
+
+    The samples are cached under a namespace of their own, so several
+    prepared tasks can wait in the worker's DuckDB cache. Time the task's
+    queries spent waiting for a source slot is reported per source. With a
+    run manifest the task is marked running when it starts, and its phases
+    are checkpointed under checkpoint_root/<name> until it finishes or fails.
+
+    Returns:
+        Stage for _finish_task(): the task, its outcome so far, the comparator
+        and its prepared state, and the bytes of cached samples (never raises)
+    """
+    start_time = datetime.now()
+    stage = {
+        'task': task,
+        'started': time.perf_counter(),
+        'outcome': {
+            'table': task.name,
+            'source_table': task.source_table,
+            'dest_table': task.dest_table,
+            'start_time': start_time.isoformat()
+        },
+        'comparator': None,
+        'prepared': None,
+        'bytes': 0,
+        'checkpoint_dir': str(Path(checkpoint_root) / task.name) if checkpoint_root else None
+    }
+    wait_before = _queue_wait()
+    scan_share = _worker['source_connector'].scan_share
+    reused_before = scan_share.reused if scan_share else 0
+    if manifest_path:
+        RunManifest(manifest_path).start(task.name)
+
+    comparator = TableComparator(
+        _worker['source_connector'], _worker['dest_connector'], _worker['config'],
+        cache_namespace=f"w{os.getpid()}_{next(_namespaces)}"
+    )
+    with _table_output(log_dir, task.name):
+        try:
+            stage['prepared'] = comparator.prepare(
+                task.source_table, task.dest_table, task.columns,
+                task.source_where, task.dest_where, use_cache=use_cache,
+                checkpoint_dir=stage['checkpoint_dir']
+            )
+            stage['comparator'] = comparator
+        except Exception as e:
+            logger.error(f"Validation of {task.name} failed: {str(e)}")
+            stage['outcome'].update({'status': 'ERROR', 'error': str(e)})
+            comparator.drop_cache_tables()
+
+    cache = comparator.timings.get('cache', {})
+    stage['bytes'] = (cache.get('source_bytes') or 0) + (cache.get('dest_bytes') or 0)
+    stage['outcome']['queue_wait'] = {
+        source: {
+            'queries': stats['queries'] - wait_before[source]['queries'],
+            'wait_seconds': round(stats['wait_seconds'] - wait_before[source]['wait_seconds'], 3)
+        }
+        for source, stats in _queue_wait().items()
+    }
+    if scan_share:
+        stage['outcome']['shared_scans'] = scan_share.reused - reused_before
+    return stage
+
+
+def _finish_task(
+    stage: Dict[str, Any],
+    report_dir: str,
+    log_dir: Optional[str],
+    formats: List[str]
+) -> Dict[str, Any]:
+    """
+    Second stage of a task: column tests on the cached samples and the reports.
+
+    Returns:
+        Structured result (never raises)
+    """
+    task, outcome, comparator = stage['task'], stage['outcome'], stage['comparator']
+
+    if comparator is not None:
+        with _table_output(log_dir, task.name):
+            try:
+                result = comparator.finish(stage['prepared'])
+                report_files = ReportGenerator(report_dir).generate_report(result, formats=formats)
+
+                outcome.update({
+                    'status': result['overall_status'],
+                    'summary': result['summary'],
+                    'cached': bool(result.get('cached')),
+                    'report_files': report_files,
+                    **_scan_volume(result)
+                })
+            except Exception as e:
+                logger.error(f"Validation of {task.name} failed: {str(e)}")
+                outcome.update({'status': 'ERROR', 'error': str(e)})
+            finally:
+                comparator.drop_cache_tables()
+
+    if outcome.get('status') == 'ERROR' and stage['checkpoint_dir']:
+        # A retry starts over: the failure may have come from the checkpointed state itself
+        shutil.rmtree(stage['checkpoint_dir'], ignore_errors=True)
+
+    outcome['duration'] = round(time.perf_counter() - stage['started'], 3)
+    outcome['end_time'] = datetime.now().isoformat()
+    return outcome
+
+
+def _run_task(
+    task: BulkTask,
+    report_dir: str,
+    log_dir: Optional[str],
+    formats: List[str],
+    use_cache: bool,
+    manifest_path: Optional[str] = None,
+    checkpoint_root: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Compare one table pair with the worker's connectors.
+
+    Progress output and log records of the comparison go to the table's log
+    file (log_dir/<name>.log) when a log directory is given. See
+    _prepare_task() for queue waits, the run manifest and checkpoints.
+
+    Returns:
+        Structured result (never raises)
+    """
+    with _routed_output(log_dir):
+        stage = _prepare_task(task, log_dir, use_cache, manifest_path, checkpoint_root)
+        return _finish_task(stage, report_dir, log_dir, formats)
+
+
+def _run_pipelined(
+    tasks: Iterable[BulkTask],
+    task_args: tuple,
+    depth: int = 0,
+    memory_bytes: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Validate tasks in order, fetching up to `depth` upcoming tables while the current one is tested.
+
+    A prefetch thread runs the source stage (_prepare_task) of the next
+    tasks, while this thread runs the column tests and reports of the
+    current one (_finish_task), so network transfers overlap with the
+    statistics. Prefetching pauses while the samples of prepared but
+    unfinished tasks hold more than memory_bytes. Tasks are taken from the
+    iterable only when they are about to be fetched. With depth 0 each task
+    is fetched and tested in turn.
+
+    Args:
+        tasks: Tasks to validate (may be a lazy iterator)
+        task_args: _run_task() arguments after the task
+        depth: Number of tables fetched ahead of the one being tested
+        memory_bytes: Optional cap on the cached samples held by prepared tasks
+
+    Yields:
+        Structured results, in task order
+    """
+    report_dir, log_dir, formats, use_cache, manifest_path, checkpoint_root = task_args
+
+    if depth < 1:
+        for task in tasks:
+            stage = _prepare_task(task, log_dir, use_cache, manifest_path, checkpoint_root)
+            yield _finish_task(stage, report_dir, log_dir, formats)
+        return
+
+    ready: Queue = Queue()
+    condition = threading.Condition()
+    held = {'waiting': 0, 'bytes': 0}  # prepared stages not yet taken / not yet finished
+    stopped = threading.Event()
+
+    def can_prefetch() -> bool:
+        if stopped.is_set():
+            return True
+        if held['waiting'] >= depth:
+            return False
+        return not memory_bytes or held['bytes'] < memory_bytes
+
+    def prefetch():
+        try:
+            iterator = iter(tasks)
+            while True:
+                with condition:
+                    condition.wait_for(can_prefetch)
+                if stopped.is_set():
+                    return
+                task = next(iterator, None)
+                if task is None:
+                    break
+                stage = _prepare_task(task, log_dir, use_cache, manifest_path, checkpoint_root)
+                with condition:
+                    held['waiting'] += 1
+                    held['bytes'] += stage['bytes']
+                ready.put(stage)
+        except Exception as e:
+            ready.put(e)
+            return
+        ready.put(None)
+
+    prefetcher = threading.Thread(target=prefetch, name='bulk-prefetch', daemon=True)
+    prefetcher.start()
+    try:
+        while True:
+            stage = ready.get()
+            if stage is None:
+                break
+            if isinstance(stage, Exception):
+                raise stage
+            with condition:
+                held['waiting'] -= 1
+                condition.notify_all()
+
+            outcome = _finish_task(stage, report_dir, log_dir, formats)
+            with condition:
+                held['bytes'] -= stage['bytes']
+                condition.notify_all()
+            yield outcome
+    finally:
+        stopped.set()
+        with condition:
+            condition.notify_all()
+        prefetcher.join()
+
+        # Tables fetched but never tested (the consumer stopped early)
+        while not ready.empty():
+            stage = ready.get()
+            if isinstance(stage, dict) and stage['comparator'] is not None:
+                stage['comparator'].discard(stage['prepared'])
+
+
+def _pipeline_loop(
+    task_queue: Any,
+    result_queue: Any,
+    task_args: tuple,
+    depth: int,
+    memory_bytes: Optional[int]
+):
+    """
+    Validate tasks from a queue shared by the run's workers until its end marker (None), pipelined.
+
+    Each task is announced on the result queue ({'started': name, 'pid': pid})
+    when the worker takes it, so the parent can time it and tell which tasks
+    a crashed worker left unfinished.
+    """
+    def announced() -> Iterator[BulkTask]:
+        for task in iter(task_queue.get, None):
+            result_queue.put({'started': task.name, 'pid': os.getpid()})
+            yield task
+
+    with _routed_output(task_args[1]):
+        for outcome in _run_pipelined(announced(), task_args, depth, memory_bytes):
+            result_queue.put(outcome)
+
+
+def _record_history(history: TaskHistory, outcome: Dict[str, Any], size_hint: Optional[int]):
+    """Record what a task cost (cache hits and failures say nothing about it)."""
+    if 'summary' in outcome and not outcome['cached']:
+        history.record(
+            TaskHistory.task_key(outcome['source_table'], outcome['dest_table']),
+            outcome['duration'],
+            outcome.get('rows_scanned'),
+            outcome.get('bytes_transferred'),
+            size_hint
+        )
+
+
+def _queue_loop(
+    queue_args: tuple,
+    task_args: tuple,
+    poll_seconds: float,
+    depth: int = 0,
+    memory_bytes: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Lease and validate tasks from a shared work queue until it is drained.
+
+    The leases this worker holds are renewed from a heartbeat thread. When
+    nothing is queued but other workers still hold leases, the worker keeps
+    polling, since a dead worker's task is queued again once its lease
+    expires. With a prefetch depth, the next tasks are leased and fetched
+    while the current one is tested (see _run_pipelined).
+
+    Returns:
+        Outcomes of the tasks this worker completed
+    """
+    queue = WorkQueue(*queue_args)
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    held = set()  # leased by this worker and not completed yet
+    lock = threading.Lock()
+    stop = threading.Event()
+    outcomes = []
+
+    def renew():
+        while not stop.wait(queue.lease_seconds / 3):
+            with lock:
+                names = list(held)
+            for name in names:
+                if not queue.heartbeat(name, worker_id):
+                    logger.warning(f"{worker_id} lost the lease of {name}")
+
+    def leased_tasks() -> Iterator[BulkTask]:
+        while True:
+            fields = queue.lease(worker_id)
+            if fields is None:
+                with lock:
+                    own = len(held)
+                if queue.counts().get(LEASED, 0) <= own:
+                    return
+                time.sleep(poll_seconds)
+                continue
+
+            task = BulkTask(**fields)
+            with lock:
+                held.add(task.name)
+            logger.info(f"{worker_id} leased {task.name}")
+            yield task
+
+    heartbeat = threading.Thread(target=renew, name='queue-heartbeat', daemon=True)
+    heartbeat.start()
+    try:
+        with _routed_output(task_args[1]):
+            for outcome in _run_pipelined(leased_tasks(), task_args, depth, memory_bytes):
+                outcome['worker'] = worker_id
+                queue.complete(outcome['table'], worker_id, outcome, succeeded='summary' in outcome)
+                with lock:
+                    held.discard(outcome['table'])
+                outcomes.append(outcome)
+    finally:
+        stop.set()
+        heartbeat.join()
+
+    logger.info(f"{worker_id} found the queue drained after {len(outcomes)} tasks")
+    return outcomes
+
+
+class BulkRunner:
+    """
+    Validates many table pairs in one process tree instead of one CLI process per table.
+
+    Workers are started once per run. Each creates its HANA and Dremio
+    connectors (and DuckDB cache file) once and then runs
+    TableComparator.compare() directly for every table it is given, so the
+    per-table overhead is a task hand-off instead of interpreter start-up,
+    imports, config parsing and two logins.
+
+    The 'concurrency' config section caps the queries all workers together
+    send to HANA and to Dremio; a worker waiting for a slot of one source does
+    not hold up the others, which keep running their local tests.
+
+    With bulk.share_source_scans set, comparisons that read the same source
+    table with the same filter (e.g. the raw and refined layers of one SAP
+    table) run each source query once and share its result (see ScanShare).
+
+    With bulk.prefetch_depth set, each worker fetches the samples of its next
+    tables while the current one is tested, so its network transfers and
+    statistics overlap instead of taking turns.
+
+    To spread one run over several hosts, a coordinator fills a WorkQueue on
+    a shared filesystem (coordinate()) and every host runs run_queue().
+    """
+
+    def __init__(
+        self,
+        report_dir: str,
+        log_dir: Optional[str] = None,
+        parallel: int = 1,
+        config_path: Optional[str] = None,
+        env_path: Optional[str] = None,
+        formats: Optional[List[str]] = None,
+        use_cache: bool = True,
+        history_path: Optional[str] = None,
+        manifest_path: Optional[str] = None,
+        prefetch_depth: Optional[int] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            report_dir: Directory for the per-table reports
+            log_dir: Optional directory for per-table log files (also holds the
+                     workers' DuckDB cache files; default: report_dir)
+            parallel: Number of worker processes (1 = run in this process)
+            config_path: Path to config YAML file
+            env_path: Path to .env file
+            formats: Report formats (default: json and html)
+            use_cache: Set to False to ignore cached results
+            history_path: Optional SQLite file of per-table costs; when given,
+                          tasks run longest-first by their last duration and
+                          each run's costs are recorded for the next one
+            manifest_path: Optional SQLite file recording each table's state,
+                           so an interrupted run can be resumed (see run())
+            prefetch_depth: Tables each worker fetches ahead of the one it
+                            tests (default: bulk.prefetch_depth; 0 = none)
+        """
+        self.report_dir = report_dir
+        self.log_dir = log_dir
+        self.parallel = max(1, parallel)
+        self.config_path = config_path
+        self.env_path = env_path
+        self.formats = list(formats) if formats else ['json', 'html']
+        self.use_cache = use_cache
+        self.cache_dir = log_dir or report_dir
+        self.history = TaskHistory(history_path) if history_path else None
+        self.manifest = RunManifest(manifest_path) if manifest_path else None
+        self.checkpoint_root = os.path.join(self.cache_dir, '_checkpoints') if manifest_path else None
+
+        config_loader = ConfigLoader(config_path=config_path, env_path=env_path)
+        self.concurrency = config_loader.get_all().get('concurrency', {})
+        bulk_config = config_loader.get_all().get('bulk', {})
+        self.prefetch_depth = max(0, bulk_config.get('prefetch_depth', 0) if prefetch_depth is None else prefetch_depth)
+        prefetch_memory_mb = bulk_config.get('prefetch_memory_mb')
+        self.prefetch_memory = int(prefetch_memory_mb * 1024 * 1024) if prefetch_memory_mb else None
+        self.share_source_scans = bulk_config.get('share_source_scans', False)
+        self.task_timeout = bulk_config.get('task_timeout_seconds', 3600)
+        self.task_max_attempts = max(1, bulk_config.get('task_max_attempts', 3))
+        self.settings_digest = TableComparator.settings_digest(config_loader.get_all())
+        self.dremio_engine = config_loader.get_dremio_config().get('engine')
+
+        # Predicted and actual seconds of the last run (see run())
+        self.makespan: Dict[str, Optional[float]] = {'predicted': None, 'actual': None}
+
+    def _source_semaphores(self) -> Dict[str, Any]:
+        """
+        Create the semaphores holding each source's query budget for one run.
+
+        Returns:
+            Dictionary mapping source name to a semaphore shared by all workers
+            (sources without a cap are left out)
+        """
+        limits = {
+            'hana': self.concurrency.get('hana'),
+            'dremio': self.concurrency.get('dremio'),
+        }
+        engine_limits = self.concurrency.get('dremio_engines') or {}
+        if self.dremio_engine in engine_limits:
+            limits['dremio'] = engine_limits[self.dremio_engine]
+
+        semaphores = {}
+        for source, limit in limits.items():
+            if limit:
+                semaphores[source] = multiprocessing.BoundedSemaphore(int(limit))
+                logger.info(f"At most {int(limit)} concurrent {source} queries")
+        return semaphores
+
+    def _scan_share(self, tasks: List[BulkTask], clear: bool = True) -> Optional[ScanShare]:
+        """
+        Share the source queries of comparisons that read the same source table with the same filter.
+
+        Args:
+            tasks: Tasks of the run
+            clear: Start from an empty share (False for workers joining a
+                   distributed run)
+
+        Returns:
+            ScanShare for the run, or None if sharing is off or no source
+            table is read more than once
+        """
+        if not self.share_source_scans:
+            return None
+
+        readers = Counter((task.source_table, task.source_where) for task in tasks)
+        tables = {source_table for (source_table, _), count in readers.items() if count > 1}
+        if not tables:
+            return None
+
+        scan_share = ScanShare(os.path.join(self.cache_dir, '_shared_scans'), tables)
+        if clear:
+            scan_share.clear()
+        logger.info(f"{len(tables)} source tables are read by more than one comparison; querying each once")
+        return scan_share
+
+    def _config_hash(self, task: BulkTask) -> str:
+        """Digest of a task and the config it is validated with, for the run manifest."""
+        return ResultCache.digest({'task': asdict(task), 'config': self.settings_digest})
+
+    def run(
+        self,
+        tasks: List[BulkTask],
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        size_hints: Optional[Dict[str, int]] = None,
+        resume: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate all tasks.
+
+        With a task history, tasks are submitted longest-processing-time first
+        so the biggest tables never start last and leave the other workers
+        idle. The predicted and actual makespan are kept in self.makespan.
+
+        With a run manifest and resume=True, tables that are done under the
+        same config are not validated again (their recorded results are
+        returned with 'resumed' set), and interrupted tables continue from
+        their last checkpointed phase. Without resume the manifest and the
+        checkpoints start over, so no samples of an earlier run are reused.
+
+        Args:
+            tasks: Table pairs to validate
+            on_result: Optional callback invoked with each result as it completes
+            size_hints: Optional metadata row counts by task name, used to size
+                        tables that have no history yet
+            resume: Skip tables the manifest records as done
+
+        Returns:
+            One structured result per task (status, summary, duration, report
+            files or error), in completion order
+        """
+        for directory in (self.report_dir, self.log_dir):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        size_hints = size_hints or {}
+        self.makespan = {'predicted': None, 'actual': None}
+        results = []
+
+        if self.manifest:
+            if not resume:
+                self.manifest.reset()
+                shutil.rmtree(self.checkpoint_root, ignore_errors=True)
+            done = self.manifest.register({task.name: self._config_hash(task) for task in tasks})
+            if done:
+                logger.info(f"Resuming: {len(done)} of {len(tasks)} tables already done")
+            for task in tasks:
+                if task.name in done:
+                    outcome = dict(done[task.name]['outcome'], resumed=True)
+                    results.append(outcome)
+                    if on_result:
+                        on_result(outcome)
+            tasks = [task for task in tasks if task.name not in done]
+            if not tasks:
+                self.makespan['actual'] = 0.0
+                return results
+
+        if self.history:
+            tasks, predictions, predicted = plan_schedule(
+                tasks, self.history.get_all(), self.parallel, size_hints
+            )
+            if predicted is not None:
+                self.makespan['predicted'] = round(predicted, 3)
+            logger.info(
+                f"Scheduled {len(tasks)} validations longest-first "
+                f"({len(predictions)} with a predicted duration)"
+            )
+
+        task_args = (
+            self.report_dir, self.log_dir, self.formats, self.use_cache,
+            self.manifest.path if self.manifest else None, self.checkpoint_root
+        )
+        scan_share = self._scan_share(tasks)
+        init_args = (self.config_path, self.env_path, self.cache_dir, self._source_semaphores(), scan_share)
+        readers = Counter(task.source_table for task in tasks)
+
+        def collect(outcome: Dict[str, Any]):
+            results.append(outcome)
+            readers[outcome['source_table']] -= 1
+            if scan_share and readers[outcome['source_table']] == 0:
+                scan_share.release(outcome['source_table'])
+            if self.manifest:
+                self.manifest.finish(
+                    outcome['table'],
+                    DONE if 'summary' in outcome else FAILED,
+                    result_path=outcome.get('report_files', {}).get('json'),
+                    outcome=outcome
+                )
+            if self.history:
+                _record_history(self.history, outcome, size_hints.get(outcome['table']))
+            if on_result:
+                on_result(outcome)
+
+        started = time.perf_counter()
+        try:
+            self._dispatch(tasks, task_args, init_args, collect)
+        finally:
+            if scan_share:
+                scan_share.clear()
+
+        self.makespan['actual'] = round(time.perf_counter() - started, 3)
+        return results
+
+    def _dispatch(
+        self,
+        tasks: List[BulkTask],
+        task_args: tuple,
+        init_args: tuple,
+        collect: Callable[[Dict[str, Any]], None]
+    ):
+        """Run tasks in this process or on worker processes, passing each result to collect."""
+        if self.parallel == 1:
+            logger.info(f"Running {len(tasks)} validations in-process")
+            _init_worker(*init_args)
+            try:
+                with _routed_output(self.log_dir):
+                    for outcome in _run_pipelined(tasks, task_args, self.prefetch_depth, self.prefetch_memory):
+                        collect(outcome)
+            finally:
+                _close_worker()
+            return
+
+        self._run_pipelined_pool(tasks, task_args, init_args, collect)
+
+    def _run_pipelined_pool(
+        self,
+        tasks: List[BulkTask],
+        task_args: tuple,
+        init_args: tuple,
+        collect: Callable[[Dict[str, Any]], None]
+    ):
+        """
+        Run tasks on worker processes that each prefetch their next tables.
+
+        A worker can only fetch ahead if it knows its next tasks, so instead of
+        being handed one task at a time, workers pull tasks (in scheduled
+        order) from a shared queue and send their results back through another.
+
+        A worker that crashes (or is killed for exceeding
+        bulk.task_timeout_seconds) breaks the pool, and the pool is started
+        again for the tasks that have no result yet. The crash cannot be
+        pinned on one of several tasks in flight, so those are then retried
+        one at a time on a single worker; a task that breaks the pool on its
+        own is retried up to bulk.task_max_attempts times.
+        """
+        logger.info(
+            f"Running {len(tasks)} validations on {self.parallel} workers"
+            + (f" (prefetching {self.prefetch_depth} table(s) ahead)" if self.prefetch_depth else "")
+        )
+        attempts: Counter = Counter()
+        suspects: List[BulkTask] = []
+        with multiprocessing.Manager() as manager:
+            while tasks or suspects:
+                isolated = bool(suspects)
+                batch, workers, depth = (suspects, 1, 0) if isolated else (tasks, self.parallel, self.prefetch_depth)
+                unfinished, started = self._run_pool_once(
+                    manager, batch, workers, depth, task_args, init_args, collect
+                )
+                if not unfinished:
+                    if isolated:
+                        suspects = []
+                    else:
+                        tasks = []
+                    continue
+
+                if not started:
+                    # The workers could not take a single task (e.g. failed to connect)
+                    for task in unfinished + (tasks if isolated else suspects):
+                        collect(self._failed_outcome(task, 'EXCEPTION', 'Worker failed before reporting a result'))
+                    return
+
+                in_flight = [task for task in unfinished if task.name in started]
+                not_taken = [task for task in unfinished if task.name not in started]
+                if isolated:
+                    suspects = not_taken
+                else:
+                    tasks = not_taken
+
+                if len(in_flight) > 1 and not isolated:
+                    suspects.extend(in_flight)
+                    continue
+
+                for task in in_flight:
+                    attempts[task.name] += 1
+                    if attempts[task.name] >= self.task_max_attempts:
+                        collect(self._failed_outcome(
+                            task, 'EXCEPTION', f"Worker failed {attempts[task.name]} time(s) on this table"
+                        ))
+                    else:
+                        suspects.append(task)
+                logger.warning(
+                    f"Restarting the worker pool for {len(tasks) + len(suspects)} unfinished validation(s)"
+                )
+
+    def _run_pool_once(
+        self,
+        manager: Any,
+        tasks: List[BulkTask],
+        workers: int,
+        depth: int,
+        task_args: tuple,
+        init_args: tuple,
+        collect: Callable[[Dict[str, Any]], None]
+    ) -> tuple:
+        """
+        Run tasks on one pool of `workers` processes until they are done or the pool breaks.
+
+        Returns:
+            Tuple of (tasks without a result, names of the tasks the workers took)
+        """
+        task_queue, result_queue = manager.Queue(), manager.Queue()
+        for task in tasks:
+            task_queue.put(task)
+        for _ in range(workers):
+            task_queue.put(None)
+
+        remaining = {task.name: task for task in tasks}
+        running: Dict[str, tuple] = {}  # task name -> (worker pid, start time)
+        started = set()
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=init_args
+        ) as executor:
+            futures = [
+                executor.submit(_pipeline_loop, task_queue, result_queue, task_args, depth, self.prefetch_memory)
+                for _ in range(workers)
+            ]
+            while remaining:
+                self._stop_overdue(running, remaining, collect)
+                try:
+                    message = result_queue.get(timeout=5)
+                except Empty:
+                    # Results are queued before a worker returns, so none are missed here
+                    if all(future.done() for future in futures) and result_queue.empty():
+                        break
+                    continue
+
+                if 'started' in message:
+                    if message['started'] in remaining:
+                        running[message['started']] = (message['pid'], time.monotonic())
+                        started.add(message['started'])
+                    continue
+                running.pop(message['table'], None)
+                if remaining.pop(message['table'], None) is not None:
+                    collect(message)
+
+            for future in futures:
+                error = future.exception()
+                if isinstance(error, BrokenProcessPool):
+                    logger.error(f"Worker pool broken (a worker crashed or was killed): {str(error)}")
+                    break
+                if error is not None:
+                    logger.error(f"Worker failed: {str(error)}")
+
+        return list(remaining.values()), started
+
+    def _stop_overdue(
+        self,
+        running: Dict[str, tuple],
+        remaining: Dict[str, BulkTask],
+        collect: Callable[[Dict[str, Any]], None]
+    ):
+        """Kill the worker of every task running longer than bulk.task_timeout_seconds (a hung query never returns)."""
+        if not self.task_timeout:
+            return
+
+        for name, (pid, started) in list(running.items()):
+            if time.monotonic() - started < self.task_timeout:
+                continue
+            logger.error(f"Validation of {name} exceeded {self.task_timeout}s, stopping worker {pid}")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            del running[name]
+            outcome = self._failed_outcome(remaining.pop(name), 'TIMEOUT', f"Exceeded {self.task_timeout}s")
+            outcome['duration'] = self.task_timeout
+            collect(outcome)
+
+    @staticmethod
+    def _failed_outcome(task: BulkTask, status: str, error: str) -> Dict[str, Any]:
+        """Result of a task whose worker never reported one."""
+        return {
+            'table': task.name,
+            'source_table': task.source_table,
+            'dest_table': task.dest_table,
+            'status': status,
+            'error': error,
+            'duration': 0
+        }
+
+    def run_queue(
+        self,
+        queue: WorkQueue,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+        poll_seconds: float = 30
+    ) -> List[Dict[str, Any]]:
+        """
+        Work on a shared queue filled by a coordinator (see WorkQueue).
+
+        Each of this host's workers leases one task at a time until the queue
+        is drained. Phase checkpoints are kept in the (shared) log directory,
+        so a task re-queued after its worker died continues on another host
+        from its last finished phase. Concurrency caps apply per host. With a
+        prefetch depth, workers lease their next tasks early to fetch them
+        while the current one is tested.
+
+        Args:
+            queue: Shared work queue
+            on_result: Optional callback invoked with each result of this host
+            poll_seconds: Seconds between checks while other workers hold the
+                          remaining tasks
+
+        Returns:
+            Structured results of the tasks this host completed
+        """
+        for directory in (self.report_dir, self.log_dir):
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        queue_args = (queue.path, queue.lease_seconds, queue.max_attempts)
+        task_args = (
+            self.report_dir, self.log_dir, self.formats, self.use_cache,
+            None, os.path.join(self.cache_dir, '_checkpoints')
+        )
+        loop_args = (queue_args, task_args, poll_seconds, self.prefetch_depth, self.prefetch_memory)
+        scan_share = self._scan_share([BulkTask(**fields) for fields in queue.tasks()], clear=False)
+        init_args = (self.config_path, self.env_path, self.cache_dir, self._source_semaphores(), scan_share)
+
+        started = time.perf_counter()
+        if self.parallel == 1:
+            logger.info(f"Working on queue {queue.path} in-process")
+            _init_worker(*init_args)
+            try:
+                results = _queue_loop(*loop_args)
+            finally:
+                _close_worker()
+        else:
+            logger.info(f"Working on queue {queue.path} with {self.parallel} workers")
+            results = []
+            with ProcessPoolExecutor(
+                max_workers=self.parallel, initializer=_init_worker, initargs=init_args
+            ) as executor:
+                futures = [executor.submit(_queue_loop, *loop_args) for _ in range(self.parallel)]
+                for future in as_completed(futures):
+                    try:
+                        results.extend(future.result())
+                    except Exception as e:
+                        # Its leased task is queued again once the lease expires
+                        logger.error(f"Queue worker failed: {str(e)}")
+
+        self.makespan = {'predicted': None, 'actual': round(time.perf_counter() - started, 3)}
+        if on_result:
+            for outcome in results:
+                on_result(outcome)
+        return results
+
+    def coordinate(
+        self,
+        queue: WorkQueue,
+        tasks: List[BulkTask],
+        size_hints: Optional[Dict[str, int]] = None,
+        resume: bool = False,
+        on_progress: Optional[Callable[[Dict[str, int]], None]] = None,
+        poll_seconds: float = 30
+    ) -> List[Dict[str, Any]]:
+        """
+        Fill a shared queue and wait for the workers of all hosts to drain it.
+
+        Tasks are queued longest-first (see run()), so whichever worker is
+        idle picks up the biggest remaining table. The coordinator validates
+        nothing itself; it records the task history from the merged outcomes
+        and removes the source scans the workers shared once all are done.
+
+        Args:
+            queue: Shared work queue
+            tasks: Table pairs to validate
+            size_hints: Optional metadata row counts by task name
+            resume: Keep the outcomes of tasks already done in the queue
+            on_progress: Optional callback invoked with the queue's counts
+                         by state while waiting
+            poll_seconds: Seconds between progress checks
+
+        Returns:
+            One structured result per task, merged from all workers, in
+            completion order
+        """
+        size_hints = size_hints or {}
+        priorities = {}
+        if self.history:
+            tasks, _, _ = plan_schedule(tasks, self.history.get_all(), self.parallel, size_hints)
+            priorities = {task.name: len(tasks) - index for index, task in enumerate(tasks)}
+
+        scan_share = self._scan_share(tasks)
+        started = time.perf_counter()
+        queued = set(queue.enqueue(tasks, priorities, resume=resume))
+        queue.wait(poll_seconds, on_progress)
+        if scan_share:
+            scan_share.clear()
+        self.makespan = {'predicted': None, 'actual': round(time.perf_counter() - started, 3)}
+
+        results = []
+        for outcome in queue.outcomes():
+            if outcome['table'] not in queued:
+                outcome['resumed'] = True
+            elif self.history:
+                _record_history(self.history, outcome, size_hints.get(outcome['table']))
+            results.append(outcome)
+        return results
@@ -0,0 +1,197 @@
+"""Cost-based ordering of bulk validations from their historical durations."""
+
+import heapq
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger('bulk_scheduler')
+
+
+class TaskHistory:
+    """
+    SQLite store of what each table pair cost the last time it was validated.
+
+    For every pair it keeps the wall-clock duration, the rows scanned (source
+    plus destination row counts), the bytes transferred into the DuckDB cache
+    and the metadata row count the table had at the time, which together are
+    used to predict the cost of the next run.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS task_history (
+                    task_key TEXT PRIMARY KEY,
+                    duration REAL NOT NULL,
+                    rows_scanned INTEGER,
+                    bytes_transferred INTEGER,
+                    size_hint INTEGER,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from any thread or process)."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def task_key(source_table: str, dest_table: str) -> str:
+        """Identifier of a table pair in the history."""
+        return f"{source_table} -> {dest_table}"
+
+    def get_all(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the latest recorded cost of every table pair.
+
+        Returns:
+            Dictionary mapping task key to its 'duration', 'rows_scanned',
+            'bytes_transferred', 'size_hint' and 'updated_at'
+        """
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT task_key, duration, rows_scanned, bytes_transferred, size_hint, updated_at "
+                    "FROM task_history"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read task history: {str(e)}")
+            return {}
+
+        return {
+            row[0]: {
+                'duration': row[1],
+                'rows_scanned': row[2],
+                'bytes_transferred': row[3],
+                'size_hint': row[4],
+                'updated_at': row[5]
+            }
+            for row in rows
+        }
+
+    def record(
+        self,
+        task_key: str,
+        duration: float,
+        rows_scanned: Optional[int] = None,
+        bytes_transferred: Optional[int] = None,
+        size_hint: Optional[int] = None
+    ):
+        """
+        Record the cost of a completed validation.
+
+        Args:
+            task_key: Table pair identifier (see task_key())
+            duration: Wall-clock seconds the validation took
+            rows_scanned: Source plus destination rows counted
+            bytes_transferred: Bytes fetched into the DuckDB cache
+            size_hint: Metadata row count of the source table at the time
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                # Keep the previous size hint when the table was not sized this time
+                conn.execute(
+                    "INSERT OR REPLACE INTO task_history "
+                    "(task_key, duration, rows_scanned, bytes_transferred, size_hint, updated_at) "
+                    "VALUES (?, ?, ?, ?, COALESCE(?, (SELECT size_hint FROM task_history WHERE task_key = ?)), ?)",
+                    (
+                        task_key, duration, rows_scanned, bytes_transferred,
+                        size_hint, task_key, datetime.now().isoformat()
+                    )
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record history for {task_key}: {str(e)}")
+
+
+def predict_makespan(costs: Iterable[float], workers: int) -> float:
+    """
+    Simulate greedy list scheduling: each task, in order, goes to the first free worker.
+
+    Args:
+        costs: Predicted seconds per task, in submission order
+        workers: Number of workers
+
+    Returns:
+        Predicted seconds until the last worker finishes
+    """
+    loads = [0.0] * max(1, workers)
+    for cost in costs:
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+def plan_schedule(
+    tasks: List[Any],
+    history: Dict[str, Dict[str, Any]],
+    workers: int,
+    size_hints: Optional[Dict[str, int]] = None
+) -> Tuple[List[Any], Dict[str, float], Optional[float]]:
+    """
+    Order tasks longest-processing-time first.
+
+    A table pair with history is predicted to take as long as it did last
+    time. A pair without history is sized from its metadata row count (size
+    hint) at the average seconds per metadata row of the pairs that have both;
+    if that is not possible it is assumed to be as long as the longest
+    predicted pair, so an unknown table is never left to the tail of the run.
+
+    Args:
+        tasks: Objects with 'name', 'source_table' and 'dest_table' attributes
+        history: Output of TaskHistory.get_all()
+        workers: Number of workers the tasks will run on
+        size_hints: Optional metadata row counts by task name
+
+    Returns:
+        Tuple of (ordered tasks, predicted seconds by task name, predicted
+        makespan or None when nothing is known about any task)
+    """
+    size_hints = size_hints or {}
+
+    known = {}
+    for task in tasks:
+        entry = history.get(TaskHistory.task_key(task.source_table, task.dest_table))
+        if entry is not None:
+            known[task.name] = entry
+
+    sized = [entry for entry in history.values() if entry.get('size_hint')]
+    seconds_per_row = (
+        sum(entry['duration'] for entry in sized) / sum(entry['size_hint'] for entry in sized)
+        if sized else None
+    )
+    predictions = {}
+    for task in tasks:
+        if task.name in known:
+            predictions[task.name] = known[task.name]['duration']
+        elif seconds_per_row is not None and size_hints.get(task.name) is not None:
+            predictions[task.name] = size_hints[task.name] * seconds_per_row
+
+    # Everything else is assumed to be as long as the longest predicted pair
+    longest = max(predictions.values(), default=None)
+    if longest is not None:
+        for task in tasks:
+            predictions.setdefault(task.name, longest)
+
+    if not predictions:
+        # No history yet: metadata row counts are the only size signal
+        ordered = sorted(tasks, key=lambda task: -(size_hints.get(task.name) or 0))
+        return ordered, predictions, None
+
+    ordered = sorted(tasks, key=lambda task: -predictions[task.name])
+    return ordered, predictions, predict_makespan([predictions[task.name] for task in ordered], workers)
@@ -0,0 +1,274 @@
+"""Shared work queue for bulk validations spread over several hosts."""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..utils.logger import get_logger
+
+logger = get_logger('work_queue')
+
+QUEUED = 'queued'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class WorkQueue:
+    """
+    SQLite queue of bulk validation tasks with leases, on a filesystem shared by all hosts.
+
+    A coordinator enqueues the tasks; any number of workers lease them one at
+    a time. A leased task belongs to its worker until the lease expires;
+    workers renew it with heartbeats while the task runs. A task whose lease
+    expired (its worker died) is queued again, up to max_attempts leases,
+    after which it is failed. Outcomes are stored with the tasks, so the
+    coordinator can merge them into one summary. No broker is needed, only
+    a filesystem with working file locks.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 300, max_attempts: int = 3):
+        """
+        Initialize the queue, creating the database file if needed.
+
+        Args:
+            path: SQLite database file on the shared filesystem
+            lease_seconds: How long a lease lasts without a heartbeat
+            max_attempts: Leases a task gets before an expired lease fails it
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS queue_tasks (
+                    task_name TEXT PRIMARY KEY,
+                    task TEXT NOT NULL,
+                    priority REAL NOT NULL DEFAULT 0,
+                    state TEXT NOT NULL,
+                    worker_id TEXT,
+                    lease_expires REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    outcome TEXT,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a short-lived connection.
+
+        Rollback journaling (not WAL) is used because WAL needs shared memory,
+        which does not work across hosts on network filesystems.
+        """
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        return conn
+
+    def enqueue(self, tasks: List[Any], priorities: Optional[Dict[str, float]] = None, resume: bool = False) -> List[str]:
+        """
+        Put tasks in the queue.
+
+        Args:
+            tasks: BulkTask objects (stored as their fields)
+            priorities: Optional priority by task name (higher is leased first)
+            resume: Keep the outcomes of tasks that are already done and queue
+                    only the others again; by default the queue starts over
+
+        Returns:
+            Names of the tasks that were queued
+        """
+        priorities = priorities or {}
+        now = datetime.now().isoformat()
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if not resume:
+                    conn.execute("DELETE FROM queue_tasks")
+                done = {row[0] for row in conn.execute("SELECT task_name FROM queue_tasks WHERE state = ?", (DONE,))}
+                queued = []
+                for task in tasks:
+                    if task.name in done:
+                        continue
+                    queued.append(task.name)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO queue_tasks (task_name, task, priority, state, attempts, updated_at) "
+                        "VALUES (?, ?, ?, ?, 0, ?)",
+                        (task.name, json.dumps(asdict(task)), priorities.get(task.name, 0), QUEUED, now)
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        logger.info(f"Queued {len(queued)} of {len(tasks)} tasks in {self.path}")
+        return queued
+
+    def _expire_leases(self, conn: sqlite3.Connection):
+        """Queue again (or fail) tasks whose worker stopped renewing the lease; caller holds the write lock."""
+        now = datetime.now().isoformat()
+        expired = conn.execute(
+            "SELECT task_name, task, worker_id, attempts FROM queue_tasks WHERE state = ? AND lease_expires < ?",
+            (LEASED, time.time())
+        ).fetchall()
+
+        for name, task_json, worker_id, attempts in expired:
+            if attempts >= self.max_attempts:
+                task = json.loads(task_json)
+                outcome = {
+                    'table': name,
+                    'source_table': task['source_table'],
+                    'dest_table': task['dest_table'],
+                    'status': 'EXCEPTION',
+                    'error': f"Lease expired {attempts} times (last worker: {worker_id})",
+                    'duration': 0
+                }
+                conn.execute(
+                    "UPDATE queue_tasks SET state = ?, outcome = ?, updated_at = ? WHERE task_name = ?",
+                    (FAILED, json.dumps(outcome), now, name)
+                )
+                logger.error(f"Giving up on {name}: lease expired {attempts} times")
+            else:
+                conn.execute(
+                    "UPDATE queue_tasks SET state = ?, worker_id = NULL, lease_expires = NULL, updated_at = ? "
+                    "WHERE task_name = ?",
+                    (QUEUED, now, name)
+                )
+                logger.warning(f"Lease of {name} by {worker_id} expired, queued again")
+
+    def lease(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Lease the queued task with the highest priority.
+
+        Args:
+            worker_id: Identifier of the leasing worker (e.g., host:pid)
+
+        Returns:
+            The task's fields (as stored by enqueue()), or None if nothing is queued
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire_leases(conn)
+                row = conn.execute(
+                    "SELECT task_name, task FROM queue_tasks WHERE state = ? "
+                    "ORDER BY priority DESC, task_name LIMIT 1",
+                    (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE queue_tasks SET state = ?, worker_id = ?, lease_expires = ?, "
+                        "attempts = attempts + 1, updated_at = ? WHERE task_name = ?",
+                        (LEASED, worker_id, time.time() + self.lease_seconds, datetime.now().isoformat(), row[0])
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        return json.loads(row[1]) if row else None
+
+    def heartbeat(self, name: str, worker_id: str) -> bool:
+        """
+        Renew the lease of a running task.
+
+        Returns:
+            False if the worker no longer holds the lease
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE queue_tasks SET lease_expires = ? WHERE task_name = ? AND state = ? AND worker_id = ?",
+                (time.time() + self.lease_seconds, name, LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, name: str, worker_id: str, outcome: Dict[str, Any], succeeded: bool = True):
+        """
+        Store the outcome of a task.
+
+        An outcome is kept even if the lease was lost meanwhile (the work is
+        done), unless another worker already completed the task.
+
+        Args:
+            name: Task name
+            worker_id: Identifier of the worker
+            outcome: Structured result of the task
+            succeeded: False to mark the task failed
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE queue_tasks SET state = ?, worker_id = ?, lease_expires = NULL, outcome = ?, updated_at = ? "
+                "WHERE task_name = ? AND state != ?",
+                (
+                    DONE if succeeded else FAILED, worker_id, json.dumps(outcome, default=str),
+                    datetime.now().isoformat(), name, DONE
+                )
+            )
+        if cursor.rowcount == 0:
+            logger.warning(f"{name} was already completed by another worker; outcome of {worker_id} dropped")
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count tasks by state, after expiring stale leases.
+
+        Returns:
+            Dictionary mapping state to number of tasks
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire_leases(conn)
+                rows = conn.execute("SELECT state, COUNT(*) FROM queue_tasks GROUP BY state").fetchall()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return dict(rows)
+
+    def wait(
+        self,
+        poll_seconds: float = 30,
+        on_progress: Optional[Callable[[Dict[str, int]], None]] = None
+    ) -> Tuple[int, int]:
+        """
+        Block until no task is queued or leased.
+
+        Args:
+            poll_seconds: Seconds between checks
+            on_progress: Optional callback invoked with counts() at every check
+
+        Returns:
+            Tuple of (done, failed) task counts
+        """
+        while True:
+            counts = self.counts()
+            if on_progress:
+                on_progress(counts)
+            if not counts.get(QUEUED) and not counts.get(LEASED):
+                return counts.get(DONE, 0), counts.get(FAILED, 0)
+            time.sleep(poll_seconds)
+
+    def tasks(self) -> List[Dict[str, Any]]:
+        """Fields of every task in the queue, whatever its state."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT task FROM queue_tasks ORDER BY task_name").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def outcomes(self) -> List[Dict[str, Any]]:
+        """Outcomes of all finished tasks, in completion order."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT outcome FROM queue_tasks WHERE outcome IS NOT NULL ORDER BY updated_at"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
@@ -2,10 +2,12 @@
 
 import click
 import sys
+from datetime import date
 from pathlib import Path
 from typing import Optional, List
 from .utils.config_loader import ConfigLoader
 from .utils.logger import setup_logging, get_logger
+from .utils.temporal_filters import build_date_filter, TemporalColumn, TIMESTAMP, EPOCH_MS
 from .connectors.dremio_connector import DremioConnector
 from .connectors.hana_connector import HanaConnector
 from .comparison.comparator import TableComparator
@@ -26,6 +28,10 @@ def cli():
 @click.option('--env', '-e', help='Path to .env file')
 @click.option('--columns', '-col', multiple=True, help='Specific columns to test')
 @click.option('--filter-date', '-d', help='Filter date for incremental validation (YYYY-MM-DD)')
+@click.option('--date-range', help='Validate every day of a range in one pass (YYYY-MM-DD:YYYY-MM-DD, inclusive)')
+@click.option('--incremental', is_flag=True,
+              help='Skip days whose data is unchanged since their last validation (with --filter-date or --date-range)')
+@click.option('--no-cache', is_flag=True, help='Ignore the cached result even if both tables are unchanged')
 @click.option('--output-dir', '-o', default='./reports', help='Output directory for reports')
 @click.option('--formats', '-f', multiple=True, default=['json', 'html'],
               help='Report formats (json, html, csv)')
@@ -37,6 +43,9 @@ def compare_cross(
     env: Optional[str],
     columns: tuple,
     filter_date: Optional[str],
+    date_range: Optional[str],
+    incremental: bool,
+    no_cache: bool,
     output_dir: str,
     formats: tuple,
     verbose: bool
@@ -50,7 +59,24 @@ def compare_cross(
 
         # Incremental validation (filter by date)
         stat-validator compare-cross '"SAP_RISE_1"."T_RISE_ADCP"' 'ulysses1.sapisu."rfn_adcp"' --filter-date 2025-11-04
+
+        # Backfill a month (one report per day under reports/YYYY/MM/DD)
+        stat-validator compare-cross '"SAP_RISE_1"."T_RISE_ADCP"' 'ulysses1.sapisu."rfn_adcp"' --date-range 2025-11-01:2025-11-30
+
+        # Re-run the backfill, only comparing days whose data changed since
+        stat-validator compare-cross '"SAP_RISE_1"."T_RISE_ADCP"' 'ulysses1.sapisu."rfn_adcp"' --date-range 2025-11-01:2025-11-30 --incremental
     """
+    # Usage errors are reported by click (exit code 2) before connecting to either source
+    if filter_date and date_range:
+        raise click.UsageError("Use either --filter-date or --date-range, not both")
+    if incremental and not (filter_date or date_range):
+        raise click.UsageError("--incremental needs --filter-date or --date-range")
+    day_range = None
+    if date_range:
+        day_range = _parse_date_range(date_range, '--date-range')
+    elif incremental:
+        day_range = _parse_date_range(f"{filter_date}:{filter_date}", '--filter-date')
+
     try:
         # Setup logging
         log_level = 'DEBUG' if verbose else 'INFO'
@@ -74,6 +100,14 @@ def compare_cross(
         click.echo("Connecting to Dremio (destination)...")
         dremio_config = config_loader.get_dremio_config()
         dest_connector = DremioConnector(**dremio_config)
+
+        if day_range:
+            # An incremental single day is a one-day range, reported directly in output_dir
+            _compare_cross_date_range(
+                source_connector, dest_connector, app_config, hana_table, dremio_table,
+                day_range[0], day_range[1], list(columns) if columns else None,
+                output_dir, list(formats), incremental=incremental, nest_by_day=bool(date_range)
+            )
         
         # Build temporal filter WHERE clauses if filter_date is provided
         source_where = None
@@ -83,17 +117,9 @@ def compare_cross(
             click.echo(f"\n📅 Applying temporal filter: {filter_date}")
             temporal_config = app_config.get('temporal_filters', {})
 
-            # Build SAP HANA WHERE clause
-            sap_config = temporal_config.get('sap', {})
-            sap_column = sap_config.get('column', 'REFRESH_DT')
-            sap_template = sap_config.get('sql_template', "TO_DATE({column}) = TO_DATE('{date}')")
-            source_where = sap_template.format(column=sap_column, date=filter_date)
-
-            # Build Dremio WHERE clause
-            dremio_config = temporal_config.get('dremio', {})
-            dremio_column = dremio_config.get('column', 'refresh_dt')
-            dremio_template = dremio_config.get('sql_template', "TO_DATE({column} / 1000) = DATE '{date}'")
-            dest_where = dremio_template.format(column=dremio_column, date=filter_date)
+            # Half-open range on the raw columns, so both sides can prune
+            source_where = build_date_filter(temporal_config.get('sap', {}), filter_date, 'REFRESH_DT', TIMESTAMP)
+            dest_where = build_date_filter(temporal_config.get('dremio', {}), filter_date, 'refresh_dt', EPOCH_MS)
 
             click.echo(f"  SAP filter: WHERE {source_where}")
             click.echo(f"  Dremio filter: WHERE {dest_where}")
@@ -106,7 +132,9 @@ def compare_cross(
         comparator = TableComparator(source_connector, dest_connector, app_config)
 
         columns_list = list(columns) if columns else None
-        result = comparator.compare(hana_table, dremio_table, columns_list, source_where, dest_where)
+        result = comparator.compare(
+            hana_table, dremio_table, columns_list, source_where, dest_where, use_cache=not no_cache
+        )
         
         # Generate reports
         click.echo(f"\nGenerating reports...")
@@ -136,6 +164,77 @@ def compare_cross(
         sys.exit(1)
 
 
+def _parse_date_range(date_range: str, param_hint: str) -> tuple:
+    """Split and check a START:END date range (YYYY-MM-DD, inclusive)."""
+    try:
+        start_date, end_date = [part.strip() for part in date_range.split(':')]
+        start, end = date.fromisoformat(start_date), date.fromisoformat(end_date)
+    except ValueError:
+        raise click.BadParameter(f"Expected YYYY-MM-DD:YYYY-MM-DD, got {date_range!r}", param_hint=param_hint)
+    if start > end:
+        raise click.BadParameter(f"Start {start_date} is after end {end_date}", param_hint=param_hint)
+    return start_date, end_date
+
+
+def _compare_cross_date_range(
+    source_connector: HanaConnector,
+    dest_connector: DremioConnector,
+    app_config: dict,
+    hana_table: str,
+    dremio_table: str,
+    start_date: str,
+    end_date: str,
+    columns: Optional[List[str]],
+    output_dir: str,
+    formats: List[str],
+    incremental: bool = False,
+    nest_by_day: bool = True
+):
+    """Run compare-cross for every day of a date range and exit with the worst status."""
+    temporal_config = app_config.get('temporal_filters', {})
+    source_temporal = TemporalColumn.from_config(temporal_config.get('sap', {}), 'REFRESH_DT', TIMESTAMP)
+    dest_temporal = TemporalColumn.from_config(temporal_config.get('dremio', {}), 'refresh_dt', EPOCH_MS)
+
+    click.echo(f"\n📅 Validating {start_date} to {end_date} in one pass")
+    click.echo(f"  SAP days by: {source_temporal.column} ({source_temporal.encoding})")
+    click.echo(f"  Dremio days by: {dest_temporal.column} ({dest_temporal.encoding})")
+
+    click.echo(f"\nComparing tables (Cross-Source):")
+    click.echo(f"  Source (HANA): {hana_table}")
+    click.echo(f"  Destination (Dremio): {dremio_table}")
+
+    comparator = TableComparator(source_connector, dest_connector, app_config)
+    result = comparator.compare_date_range(
+        hana_table, dremio_table, start_date, end_date, source_temporal, dest_temporal, columns, incremental
+    )
+
+    # One report per day, in the same layout as the bulk runs (YYYY/MM/DD)
+    click.echo(f"\nGenerating reports...")
+    for day_result in result['days']:
+        if day_result.get('carried_forward'):
+            click.echo(f"  {day_result['filter_date']} ({day_result['overall_status']}): "
+                       f"unchanged since {day_result['validated_at']}, report not regenerated")
+            continue
+
+        year, month, day = day_result['filter_date'].split('-')
+        day_dir = Path(output_dir) / year / month / day if nest_by_day else Path(output_dir)
+        report_gen = ReportGenerator(str(day_dir))
+        report_files = report_gen.generate_report(day_result, formats=formats)
+        click.echo(f"  {day_result['filter_date']} ({day_result['overall_status']}): "
+                   f"{', '.join(report_files.values())}")
+
+    summary = result['summary']
+    if result['overall_status'] == 'FAIL':
+        click.echo(f"\n❌ Validation FAILED on {summary['failed_days']}/{summary['total_days']} days")
+        sys.exit(1)
+    elif result['overall_status'] == 'WARNING':
+        click.echo(f"\n⚠️  Validation completed with WARNINGS on {summary['warning_days']}/{summary['total_days']} days")
+        sys.exit(0)
+    else:
+        click.echo(f"\n✅ Validation PASSED for all {summary['total_days']} days")
+        sys.exit(0)
+
+
 @cli.command('key-count')
 @click.argument('hana_table')
 @click.argument('dremio_table')
@@ -204,17 +303,9 @@ def key_count(
             click.echo(f"\n📅 Applying temporal filter: {filter_date}")
             temporal_config = app_config.get('temporal_filters', {})
 
-            # Build SAP HANA WHERE clause
-            sap_config = temporal_config.get('sap', {})
-            sap_column = sap_config.get('column', 'REFRESH_DT')
-            sap_template = sap_config.get('sql_template', "TO_DATE({column}) = TO_DATE('{date}')")
-            source_where = sap_template.format(column=sap_column, date=filter_date)
-
-            # Build Dremio WHERE clause
-            dremio_config_filter = temporal_config.get('dremio', {})
-            dremio_column = dremio_config_filter.get('column', 'refresh_dt')
-            dremio_template = dremio_config_filter.get('sql_template', "TO_DATE({column} / 1000) = DATE '{date}'")
-            dest_where = dremio_template.format(column=dremio_column, date=filter_date)
+            # Half-open range on the raw columns, so both sides can prune
+            source_where = build_date_filter(temporal_config.get('sap', {}), filter_date, 'REFRESH_DT', TIMESTAMP)
+            dest_where = build_date_filter(temporal_config.get('dremio', {}), filter_date, 'refresh_dt', EPOCH_MS)
 
             click.echo(f"  SAP filter: WHERE {source_where}")
             click.echo(f"  Dremio filter: WHERE {dest_where}")
@@ -383,5 +474,84 @@ def key_count(
         sys.exit(1)
 
 
+@cli.command('rescore')
+@click.argument('reports', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+@click.option('--config', '-c', help='Path to config YAML file with the new thresholds')
+@click.option('--output-dir', '-o', default='./reports/rescored', help='Output directory for reports')
+@click.option('--formats', '-f', multiple=True, default=['json', 'html'],
+              help='Report formats (json, html, csv)')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+def rescore(
+    reports: tuple,
+    config: Optional[str],
+    output_dir: str,
+    formats: tuple,
+    verbose: bool
+):
+    """
+    Re-score previous comparisons with new thresholds, without querying HANA or Dremio.
+
+    Reads the samples persisted by compare-cross (sample_store.path in the config)
+    for each JSON report and re-runs the statistical tests, FDR correction and
+    overall status with the current config.
+
+    Examples:
+        # Re-score one report after editing thresholds in config/config.yaml
+        stat-validator rescore reports/sap/2025/11/04/validation_T_RISE_ADCP_20251105_010203.json
+
+        # Re-score a whole bulk run with an alternative config
+        stat-validator rescore reports/sap/2025/11/04/*.json -c config/strict.yaml -o reports/strict
+    """
+    try:
+        import json
+
+        log_level = 'DEBUG' if verbose else 'INFO'
+        logger = setup_logging()
+        logger.setLevel(log_level)
+
+        click.echo(f"\n🔍 Statistical Validation Tool - Offline Re-scoring")
+        click.echo(f"{'='*60}\n")
+
+        app_config = ConfigLoader(config_path=config).get_all()
+        report_gen = ReportGenerator(output_dir)
+
+        statuses = []
+        for report_path in reports:
+            with open(report_path, 'r') as f:
+                previous = json.load(f)
+
+            sample_dir = previous.get('sample_dir')
+            if not sample_dir or not Path(sample_dir, 'sample.json').exists():
+                click.echo(f"\n⚠️  {report_path}: no persisted samples (run with sample_store.path set), skipped")
+                statuses.append('ERROR')
+                continue
+
+            comparator = TableComparator.from_samples(sample_dir, app_config)
+            try:
+                result = comparator.rescore(previous)
+            finally:
+                comparator.source_connector.close()
+                comparator.dest_connector.close()
+
+            report_files = report_gen.generate_report(result, formats=list(formats))
+            click.echo(f"\n  {previous['overall_status']} → {result['overall_status']}: "
+                       f"{', '.join(report_files.values())}")
+            statuses.append(result['overall_status'])
+
+        if 'FAIL' in statuses or 'ERROR' in statuses:
+            click.echo(f"\n❌ Re-scoring finished: {statuses.count('FAIL')} failed, "
+                       f"{statuses.count('ERROR')} without samples, {len(statuses)} total")
+            sys.exit(1)
+        click.echo(f"\n✅ Re-scoring finished: {len(statuses)} reports, none failed")
+        sys.exit(0)
+
+    except Exception as e:
+        click.echo(f"\n❌ Error: {str(e)}", err=True)
+        if verbose:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+
 if __name__ == '__main__':
     cli()
\ No newline at end of file
@@ -3,5 +3,6 @@
 from .comparator import TableComparator
 from .statistical_tests import StatisticalTests, TestResult
 from .schema_validator import SchemaValidator
+from .async_runner import AsyncComparisonRunner
 
-__all__ = ['TableComparator', 'StatisticalTests', 'TestResult', 'SchemaValidator']
+__all__ = ['TableComparator', 'StatisticalTests', 'TestResult', 'SchemaValidator', 'AsyncComparisonRunner']
@@ -0,0 +1,132 @@
+"""Run many table comparisons on one asyncio event loop."""
+
+import asyncio
+import uuid
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+from ..connectors.base_connector import BaseConnector
+from ..utils.logger import get_logger
+from .comparator import TableComparator
+
+
+logger = get_logger('async_runner')
+
+
+class AsyncComparisonRunner:
+    """
+    Drives table comparisons from asyncio with bounded concurrency.
+
+    All comparisons share the same connectors and one executor sized to the
+    concurrency limit, so hundreds of tables can be queued without a thread per
+    table. Each comparison gets its own TableComparator and cache namespace, so
+    concurrent comparisons never overwrite each other's DuckDB cache tables.
+    """
+
+    def __init__(
+        self,
+        source_connector: BaseConnector,
+        dest_connector: Optional[BaseConnector] = None,
+        config: Dict[str, Any] = None,
+        max_concurrency: int = 4,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            source_connector: Connector for source data (shared by all comparisons)
+            dest_connector: Optional connector for destination data (shared by all comparisons)
+            config: Configuration dictionary from ConfigLoader
+            max_concurrency: Maximum number of comparisons running at once
+            executor: Executor for blocking comparison phases (default: a thread pool
+                      with max_concurrency workers, owned by the runner)
+        """
+        self.source_connector = source_connector
+        self.dest_connector = dest_connector
+        self.config = config or {}
+        self.max_concurrency = max_concurrency
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='comparison'
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Create the semaphore lazily so it binds to the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def compare(
+        self,
+        source_table: str,
+        dest_table: str,
+        columns_to_test: Optional[List[str]] = None,
+        source_where: Optional[str] = None,
+        dest_where: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Compare one table pair, waiting for a free concurrency slot first.
+
+        Args:
+            source_table: Fully qualified source table name
+            dest_table: Fully qualified destination table name
+            columns_to_test: Optional list of specific columns to test
+            source_where: Optional WHERE clause for source table
+            dest_where: Optional WHERE clause for destination table
+
+        Returns:
+            Dictionary with comparison results
+        """
+        async with self._get_semaphore():
+            comparator = TableComparator(
+                self.source_connector,
+                self.dest_connector,
+                self.config,
+                cache_namespace=uuid.uuid4().hex[:12]
+            )
+            loop = asyncio.get_running_loop()
+            try:
+                result = await comparator.compare_async(
+                    source_table, dest_table, columns_to_test, source_where, dest_where,
+                    executor=self.executor
+                )
+            except asyncio.CancelledError:
+                # compare_async drops its cache tables once the in-flight phase ends
+                raise
+            except Exception:
+                await loop.run_in_executor(self.executor, comparator.drop_cache_tables)
+                raise
+
+            await loop.run_in_executor(self.executor, comparator.drop_cache_tables)
+            return result
+
+    async def compare_many(
+        self,
+        pairs: List[Dict[str, Any]],
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """
+        Compare many table pairs concurrently.
+
+        Args:
+            pairs: List of dictionaries with compare() keyword arguments
+                   (source_table, dest_table and optionally columns_to_test,
+                   source_where, dest_where)
+            return_exceptions: If True, failed comparisons return their exception
+                               instead of cancelling the whole batch
+
+        Returns:
+            Results in the same order as pairs
+        """
+        logger.info(f"Running {len(pairs)} comparison(s) with concurrency {self.max_concurrency}")
+        return await asyncio.gather(
+            *(self.compare(**pair) for pair in pairs),
+            return_exceptions=return_exceptions
+        )
+
+    def close(self):
+        """Shut down the executor if the runner created it."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
@@ -1,22 +1,51 @@
 """Main table comparison engine with statistical validation."""
 
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from dataclasses import asdict
 import duckdb
 import numpy as np
 import pandas as pd
 import pyarrow as pa
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Executor
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from scipy.stats import false_discovery_control
 from ..connectors.base_connector import BaseConnector
 from ..connectors.hana_connector import HanaConnector
 from ..connectors.dremio_connector import DremioConnector
+from ..connectors.sample_connector import SampleConnector
 from ..utils.logger import get_logger
+from ..utils.fingerprint_store import FingerprintStore
+from ..utils.metadata_catalog import MetadataCatalog
+from ..utils.paired_execution import run_paired, PairedResult
+from ..utils.result_cache import ResultCache
+from ..utils.temporal_filters import TemporalColumn, day_range, days_in_range
 from .statistical_tests import StatisticalTests, TestResult
 from .schema_validator import SchemaValidator
+from .process_backend import ProcessTestBackend
+from .type_coercion import TypeCoercer, ColumnCoercion
 
 
 logger = get_logger('comparator')
 
+# Config sections that do not change what a comparison computes (left out of the result cache key)
+RESULT_CACHE_IGNORED_SECTIONS = (
+    'thresholds', 'execution', 'reporting', 'metadata_catalog', 'incremental', 'result_cache', 'sample_store',
+    'bulk', 'concurrency'
+)
+
+# Auto-detected hash columns with fewer distinct values (per source metadata) are replaced,
+# since MOD(HASH(col), 100) buckets on a low-cardinality column give skewed samples
+MIN_HASH_DISTINCT_COUNT = 1000
+
 
 class TableComparator:
     """
@@ -39,7 +68,8 @@ class TableComparator:
         self,
         source_connector: BaseConnector,
         dest_connector: Optional[BaseConnector] = None,
-        config: Dict[str, Any] = None
+        config: Dict[str, Any] = None,
+        cache_namespace: Optional[str] = None
     ):
         """
         Initialize table comparator.
@@ -49,23 +79,35 @@ class TableComparator:
             dest_connector: Optional separate connector for destination data (e.g., Dremio).
                            If None, uses source_connector for both.
             config: Configuration dictionary from ConfigLoader
+            cache_namespace: Optional suffix for the DuckDB cache tables, so several
+                            comparisons can share connectors without clobbering each other
         """
         self.source_connector = source_connector
         self.dest_connector = dest_connector if dest_connector else source_connector
         self.config = config or {}
+        self.cache_namespace = cache_namespace
+        self.source_cache_table = f"cached_source_{cache_namespace}" if cache_namespace else "cached_source"
+        self.dest_cache_table = f"cached_dest_{cache_namespace}" if cache_namespace else "cached_dest"
         
         # Initialize validators
         thresholds = self.config.get('thresholds', {})
         sampling_config = self.config.get('sampling', {})
         categorical_config = self.config.get('categorical', {})
+        execution_config = self.config.get('execution', {})
+        temporal_config = self.config.get('temporal', {})
+        coercion_config = self.config.get('coercion', {})
+        catalog_config = self.config.get('metadata_catalog', {})
+        result_cache_config = self.config.get('result_cache', {})
+        sample_store_config = self.config.get('sample_store', {})
         
-        self.statistical_tests = StatisticalTests(
-            ks_test_pvalue=thresholds.get('ks_test_pvalue', 0.05),
-            t_test_pvalue=thresholds.get('t_test_pvalue', 0.05),
-            chi_square_pvalue=thresholds.get('chi_square_pvalue', 0.05),
-            psi_threshold=thresholds.get('psi_threshold', 0.1),
-            min_sample_size=sampling_config.get('min_sample_size', 30)
-        )
+        self.test_params = {
+            'ks_test_pvalue': thresholds.get('ks_test_pvalue', 0.05),
+            't_test_pvalue': thresholds.get('t_test_pvalue', 0.05),
+            'chi_square_pvalue': thresholds.get('chi_square_pvalue', 0.05),
+            'psi_threshold': thresholds.get('psi_threshold', 0.1),
+            'min_sample_size': sampling_config.get('min_sample_size', 30)
+        }
+        self.statistical_tests = StatisticalTests(**self.test_params)
         
         self.schema_validator = SchemaValidator()
         
@@ -82,6 +124,47 @@ class TableComparator:
         self.sampling_hash_column = sampling_config.get('hash_column', None)
         self.max_cardinality_psi = categorical_config.get('max_cardinality_for_psi', 100)
         self.max_cardinality_chi_square = categorical_config.get('max_cardinality_for_chi_square', 50)
+        self.test_backend = execution_config.get('test_backend', 'serial')
+        self.test_max_workers = execution_config.get('max_workers', None)
+        self.temporal_daily_distribution = temporal_config.get('daily_distribution', False)
+        self.coercion_enabled = coercion_config.get('enabled', False)
+        self.type_coercer = TypeCoercer(probe_rows=coercion_config.get('probe_rows', 200))
+        self.coerced_columns: Dict[str, str] = {}
+        catalog_path = catalog_config.get('path')
+        self.metadata_catalog = MetadataCatalog(catalog_path) if catalog_path else None
+        result_cache_path = result_cache_config.get('path')
+        self.result_cache = ResultCache(result_cache_path) if result_cache_path else None
+        self.source_probe_column = result_cache_config.get('source_probe_column')
+        self.dest_probe_column = result_cache_config.get('dest_probe_column')
+        self.sample_store_path = sample_store_config.get('path')
+        self.sample_store_keep_runs = sample_store_config.get('keep_runs', 3)
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+        # Held while a comparison phase runs, so cleanup never races an in-flight phase
+        self._phase_lock = threading.Lock()
+
+    def _run_paired(self, source_fn, dest_fn, phase: str) -> PairedResult:
+        """
+        Run a source and a destination operation concurrently and record their timings.
+
+        Falls back to sequential execution when both sides share one connector.
+
+        Args:
+            source_fn: Zero-argument callable for the source side
+            dest_fn: Zero-argument callable for the destination side
+            phase: Name under which timings are recorded
+
+        Returns:
+            PairedResult with both results
+        """
+        paired = run_paired(
+            source_fn,
+            dest_fn,
+            label=phase,
+            concurrent=self.source_connector is not self.dest_connector
+        )
+        self.timings[phase] = paired.timings()
+        return paired
 
     def _is_binary_type(self, field: pa.Field) -> bool:
         """
@@ -156,6 +239,113 @@ class TableComparator:
         logger.warning("No suitable hash column found (all candidates are binary or excluded) - falling back to random sampling")
         return None
 
+    def _resolve_hash_column(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        schema: pa.Schema,
+        exclude_columns: set,
+        catalog_facts: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Choose the hash sampling column: configured, cataloged, or auto-detected.
+
+        When the connector exposes distinct counts, a detected column with too few
+        distinct values is replaced by the most distinct eligible column. A
+        detected column is written to catalog_facts, so later runs keep sampling
+        on the same column while the schema is unchanged.
+
+        Args:
+            connector: Connector that owns the table
+            table_name: Table name
+            schema: PyArrow schema of the table
+            exclude_columns: Set of uppercase column names to exclude (e.g., binary columns)
+            catalog_facts: Cataloged facts for the table (updated in place)
+
+        Returns:
+            Column name, or None if no suitable column exists
+        """
+        if self.sampling_hash_column:
+            return self.sampling_hash_column
+
+        if 'hash_column' in catalog_facts:
+            cached = catalog_facts['hash_column']
+            if cached is None or cached.upper() not in exclude_columns:
+                logger.debug(f"Using cataloged hash column: {cached}")
+                return cached
+
+        hash_col = self._detect_hash_column(schema, exclude_columns)
+
+        if self.sampling_strategy == 'hash':
+            distinct_counts = connector.estimate_distinct_counts(table_name)
+            if distinct_counts and (hash_col is None or distinct_counts.get(hash_col, MIN_HASH_DISTINCT_COUNT) < MIN_HASH_DISTINCT_COUNT):
+                eligible = [
+                    field.name for field in schema
+                    if field.name.upper() not in exclude_columns
+                    and not self._is_binary_type(field)
+                    and (pa.types.is_integer(field.type) or pa.types.is_string(field.type))
+                    and field.name in distinct_counts
+                ]
+                if eligible:
+                    best = max(eligible, key=lambda name: distinct_counts[name])
+                    if hash_col is None or distinct_counts[best] > distinct_counts[hash_col]:
+                        logger.info(f"Using hash column {best} ({distinct_counts[best]:,} distinct values) "
+                                    f"instead of {hash_col}")
+                        hash_col = best
+
+        catalog_facts['hash_column'] = hash_col
+        return hash_col
+
+    def _get_sizing_row_count(self, connector: BaseConnector, table_name: str) -> int:
+        """
+        Row count used to size a sample: the connector's metadata estimate if it
+        has one, otherwise an exact COUNT(*).
+        """
+        row_count = connector.estimate_row_count(table_name)
+        if row_count is not None:
+            logger.info(f"Using estimated row count for {table_name}: {row_count:,}")
+            return row_count
+
+        return connector.get_row_count(table_name)
+
+    def _catalog_key(self, connector: BaseConnector, table_name: str) -> str:
+        """Metadata catalog key of a table (connector type + table name)."""
+        return f"{type(connector).__name__}:{table_name}"
+
+    def _catalog_lookup(self, connector: BaseConnector, table_name: str, schema: pa.Schema) -> Dict[str, Any]:
+        """
+        Get the cataloged facts for a table, valid for its current schema.
+
+        Returns:
+            Facts dictionary (empty when the catalog is disabled, the table is
+            unknown, or its schema changed)
+        """
+        if self.metadata_catalog is None:
+            return {}
+
+        facts = self.metadata_catalog.get(
+            self._catalog_key(connector, table_name),
+            MetadataCatalog.schema_fingerprint(schema)
+        )
+        return facts or {}
+
+    def _catalog_record(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        schema: pa.Schema,
+        facts: Dict[str, Any]
+    ):
+        """Record facts for a table under the fingerprint of its current schema."""
+        if self.metadata_catalog is None or not facts:
+            return
+
+        self.metadata_catalog.record(
+            self._catalog_key(connector, table_name),
+            MetadataCatalog.schema_fingerprint(schema),
+            facts
+        )
+
     def _calculate_sample_size(self, total_rows: int) -> int:
         """
         Calculate optimal sample size based on table size and configuration.
@@ -186,7 +376,8 @@ class TableComparator:
         self,
         columns: List[str],
         schema: pa.Schema,
-        connector: BaseConnector
+        connector: BaseConnector,
+        coercions: Optional[Dict[str, ColumnCoercion]] = None
     ) -> str:
         """
         Build column list with null-equivalent transformations if applicable.
@@ -195,6 +386,7 @@ class TableComparator:
             columns: List of column names to include
             schema: PyArrow schema with column types
             connector: Connector instance (to check if it supports transformations)
+            coercions: Optional typed rewrites for string columns (uppercase name -> coercion)
 
         Returns:
             Comma-separated column list, with NULLIF transformations if supported
@@ -215,6 +407,11 @@ class TableComparator:
                         quoted_col,
                         schema_map[col]
                     )
+                    coercion = (coercions or {}).get(col.upper())
+                    if coercion and TypeCoercer.is_string_type(schema_map[col]):
+                        transformed_col = TypeCoercer.coerce_expression(
+                            transformed_col, col, coercion, isinstance(connector, HanaConnector)
+                        )
                     transformed_cols.append(transformed_col)
                 else:
                     # Column not in schema, use as-is
@@ -231,7 +428,10 @@ class TableComparator:
         schema: pa.Schema,
         is_hana: bool,
         exclude_binary_cols: set = None,
-        where_clause: str = None
+        where_clause: str = None,
+        catalog_facts: Optional[Dict[str, Any]] = None,
+        connector: Optional[BaseConnector] = None,
+        presampled: bool = False
     ) -> str:
         """
         Build sampling query based on configured strategy.
@@ -242,26 +442,31 @@ class TableComparator:
             schema: Table schema for hash column detection
             is_hana: True if HANA connector, False for Dremio
             exclude_binary_cols: Set of binary column names to exclude from hash selection
-            where_clause: Optional WHERE clause for filtering (e.g., "TO_DATE(REFRESH_DT) = TO_DATE('2025-11-04')")
+            where_clause: Optional WHERE clause for filtering (e.g., "REFRESH_DT >= TIMESTAMP '2025-11-04 00:00:00' AND REFRESH_DT < TIMESTAMP '2025-11-05 00:00:00'")
+            catalog_facts: Cataloged facts for the table, used and updated by hash column resolution
+            connector: Connector that owns the table (default: source connector)
+            presampled: True if where_clause already samples the rows (no further sampling)
 
         Returns:
             SQL query string with sampling
         """
         if exclude_binary_cols is None:
             exclude_binary_cols = set()
+        if connector is None:
+            connector = self.source_connector
 
         # Build base WHERE clause
         base_where = f"WHERE {where_clause}" if where_clause else ""
 
-        if not self.sampling_enabled:
+        if not self.sampling_enabled or presampled:
             return f"SELECT {column_list} FROM {table_name} {base_where}".strip()
 
         # Determine sample size strategy
-        # Only fetch row count if target_pct is explicitly set (to avoid slow COUNT(*) on large tables)
+        # Only fetch row count if target_pct is explicitly set (metadata estimate first, COUNT(*) otherwise)
         if self.sampling_pct is not None:
             try:
                 logger.info(f"Fetching row count for percentage-based sampling...")
-                row_count = self.source_connector.get_row_count(table_name)
+                row_count = self._get_sizing_row_count(connector, table_name)
                 sample_size = self._calculate_sample_size(row_count)
 
                 # If sample size >= total rows, don't sample
@@ -280,13 +485,16 @@ class TableComparator:
 
         if self.sampling_strategy == 'hash':
             # Hash-based deterministic sampling
-            hash_col = self.sampling_hash_column or self._detect_hash_column(schema, exclude_binary_cols)
+            hash_col = self._resolve_hash_column(
+                connector, table_name, schema, exclude_binary_cols,
+                catalog_facts if catalog_facts is not None else {}
+            )
 
             if hash_col:
                 sample_pct = int(sample_size / row_count * 100) + 1  # +1 to ensure we get enough rows
 
                 # Combine hash WHERE with user WHERE clause using AND
-                hash_where = f"MOD(ABS(HASH_SHA256(TO_VARCHAR(\"{hash_col}\"))), 100) < {sample_pct}" if is_hana else f"MOD(ABS(HASH(\"{hash_col}\")), 100) < {sample_pct}"
+                hash_where = self._hash_predicate(hash_col, sample_pct, is_hana)
                 combined_where = f"{where_clause} AND {hash_where}" if where_clause else hash_where
 
                 if is_hana:
@@ -321,6 +529,20 @@ class TableComparator:
 
         return query
 
+    @staticmethod
+    def _hash_expression(hash_col: str, is_hana: bool) -> str:
+        """Non-negative deterministic hash of a column."""
+        if is_hana:
+            # HANA: ABS(HASH_SHA256(column))
+            return f"ABS(HASH_SHA256(TO_VARCHAR(\"{hash_col}\")))"
+        # Dremio: ABS(HASH(column))
+        return f"ABS(HASH(\"{hash_col}\"))"
+
+    @classmethod
+    def _hash_predicate(cls, hash_col: str, sample_pct: int, is_hana: bool) -> str:
+        """Deterministic predicate keeping about sample_pct percent of rows."""
+        return f"MOD({cls._hash_expression(hash_col, is_hana)}, 100) < {sample_pct}"
+
     def _build_fallback_query(
         self,
         column_list: str,
@@ -363,21 +585,911 @@ class TableComparator:
         dest_table: str,
         columns_to_test: Optional[List[str]] = None,
         source_where: Optional[str] = None,
-        dest_where: Optional[str] = None
+        dest_where: Optional[str] = None,
+        use_cache: bool = True,
+        checkpoint_dir: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Main comparison function.
 
+        With result_cache.path configured, both sides are probed first (filtered
+        row count and latest probe column value); if the probes and the config
+        match a stored result, it is returned without sampling or testing.
+
+        With a checkpoint directory, each finished phase (basic validation,
+        cached samples) is saved there, and an interrupted comparison of the
+        same tables and config resumes after its last finished phase. The
+        directory is removed once the comparison completes.
+
+        Equivalent to finish(prepare(...)).
+
         Args:
             source_table: Fully qualified source table name
             dest_table: Fully qualified destination table name
             columns_to_test: Optional list of specific columns to test
-            source_where: Optional WHERE clause for source table (e.g., "TO_DATE(REFRESH_DT) = TO_DATE('2025-11-04')")
+            source_where: Optional WHERE clause for source table (e.g., "REFRESH_DT >= TIMESTAMP '2025-11-04 00:00:00' AND REFRESH_DT < TIMESTAMP '2025-11-05 00:00:00'")
             dest_where: Optional WHERE clause for destination table (e.g., "CAST(system_ts AS DATE) = DATE '2025-11-04'")
+            use_cache: Set to False to ignore (but still refresh) the result cache
+            checkpoint_dir: Optional directory for phase checkpoints
+
+        Returns:
+            Dictionary with comparison results ('cached' and 'cached_at' are set
+            when the result comes from the result cache)
+        """
+        return self.finish(self.prepare(
+            source_table, dest_table, columns_to_test, source_where, dest_where, use_cache, checkpoint_dir
+        ))
+
+    def prepare(
+        self,
+        source_table: str,
+        dest_table: str,
+        columns_to_test: Optional[List[str]] = None,
+        source_where: Optional[str] = None,
+        dest_where: Optional[str] = None,
+        use_cache: bool = True,
+        checkpoint_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        First half of compare(): everything that queries the sources.
+
+        Runs the result cache lookup, basic validation (Phase 1) and caching
+        (Phase 2), leaving the samples in this comparator's cache tables.
+        finish() only works on those samples, so bulk runs can fetch the next
+        table (with another comparator and cache namespace) while the current
+        one is tested.
+
+        Args:
+            See compare()
+
+        Returns:
+            State to pass to finish()
+        """
+        pins = self._pin_cache_databases()
+        try:
+            cache_entry = self._lookup_result_cache(
+                source_table, dest_table, columns_to_test, source_where, dest_where, use_cache
+            )
+            if cache_entry and cache_entry.get('result'):
+                return {'result': cache_entry['result'], 'cached': True, 'pins': pins}
+
+            result, columns = self._run_source_phases(
+                source_table, dest_table, columns_to_test, source_where, dest_where,
+                self._probed_row_counts(cache_entry), checkpoint_dir
+            )
+        except Exception:
+            self._release_cache_databases(pins)
+            raise
+
+        return {
+            'result': result,
+            'columns': columns,
+            'cache_entry': cache_entry,
+            'checkpoint_dir': checkpoint_dir,
+            'pins': pins
+        }
+
+    def finish(self, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Second half of compare(): column tests (Phase 3) on the cached samples and the final result.
+
+        Args:
+            prepared: Output of prepare()
+
+        Returns:
+            Dictionary with comparison results
+        """
+        try:
+            result = prepared['result']
+            if prepared.get('cached'):
+                return result
+
+            columns = prepared['columns']
+            if columns is not None:
+                self._run_column_test_phase(result, result['source_table'], result['dest_table'], columns)
+            self._finalize_result(result)
+            if columns is not None:
+                self._print_summary(result)
+
+            self._store_result_cache(prepared['cache_entry'], result)
+            if prepared['checkpoint_dir']:
+                shutil.rmtree(prepared['checkpoint_dir'], ignore_errors=True)
+            return result
+        finally:
+            self._release_cache_databases(prepared['pins'])
+
+    def discard(self, prepared: Dict[str, Any]):
+        """Drop the cached samples of a prepared comparison that will not be finished."""
+        self.drop_cache_tables()
+        self._release_cache_databases(prepared['pins'])
+
+    def _run_source_phases(
+        self,
+        source_table: str,
+        dest_table: str,
+        columns_to_test: Optional[List[str]] = None,
+        source_where: Optional[str] = None,
+        dest_where: Optional[str] = None,
+        row_counts: Optional[Tuple[int, int]] = None,
+        checkpoint_dir: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """
+        Run Phases 1 and 2, resuming from checkpoints if given.
+
+        Returns:
+            Tuple of (result so far, columns to test or None when the column
+            tests cannot run)
+        """
+        result = self._start_comparison(source_table, dest_table)
+
+        phases: Dict[str, Any] = {}
+        if checkpoint_dir:
+            checkpoint_key = ResultCache.digest({
+                'source_table': source_table,
+                'dest_table': dest_table,
+                'source_where': source_where,
+                'dest_where': dest_where,
+                'columns': sorted(columns_to_test) if columns_to_test else None,
+                'config': self.settings_digest(self.config)
+            })
+            phases = self._load_checkpoint(checkpoint_dir, checkpoint_key)
+
+        if 'basic' in phases:
+            print("\n[Phase 1] Basic Validation... (restored from checkpoint)")
+            result['tests'].extend(phases['basic']['tests'])
+            proceed, common_column_names = phases['basic']['proceed'], phases['basic']['common_column_names']
+        else:
+            proceed, common_column_names = self._run_basic_validation(
+                result, source_table, dest_table, source_where, dest_where, row_counts
+            )
+            if checkpoint_dir:
+                phases['basic'] = {
+                    'tests': list(result['tests']),
+                    'proceed': proceed,
+                    'common_column_names': common_column_names
+                }
+                self._save_checkpoint(checkpoint_dir, checkpoint_key, phases)
+        if not proceed:
+            return result, None
+
+        # Use common columns if schema failed, otherwise use user-specified or all
+        cols_to_cache = common_column_names if common_column_names else columns_to_test
+
+        if 'cache' in phases and self._import_cache_tables(checkpoint_dir):
+            print("\n[Phase 2] Caching Tables... (restored from checkpoint)")
+            cols_to_test_filtered = phases['cache']['columns']
+            self.coerced_columns = dict(phases['cache']['coerced_columns'])
+        else:
+            cols_to_test_filtered = self._run_caching_phase(
+                source_table, dest_table, cols_to_cache, source_where, dest_where
+            )
+            if cols_to_test_filtered is not None and checkpoint_dir:
+                try:
+                    self._export_cache_tables(checkpoint_dir)
+                    phases['cache'] = {'columns': cols_to_test_filtered, 'coerced_columns': self.coerced_columns}
+                    self._save_checkpoint(checkpoint_dir, checkpoint_key, phases)
+                except Exception as e:
+                    logger.warning(f"Could not checkpoint cached samples to {checkpoint_dir}: {str(e)}")
+
+        return result, cols_to_test_filtered
+
+    def compare_date_range(
+        self,
+        source_table: str,
+        dest_table: str,
+        start_date: str,
+        end_date: str,
+        source_temporal: TemporalColumn,
+        dest_temporal: TemporalColumn,
+        columns_to_test: Optional[List[str]] = None,
+        incremental: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Compare every day of a date range in one pass per side.
+
+        Row counts for all days come from one grouped query per side, and one
+        sample per side is cached, stratified by day with a per-day hash
+        threshold. Each day is then tested on its slice of the cached samples,
+        so a backfill costs about as much as a single-day comparison.
+
+        In incremental mode the grouped query also fingerprints every day (row
+        count, null counts, checksum, temporal bounds). Days whose fingerprints
+        and comparison settings match their last validation carry that result
+        forward; only changed days are sampled and tested.
+
+        Args:
+            source_table: Fully qualified source table name
+            dest_table: Fully qualified destination table name
+            start_date: First day (YYYY-MM-DD)
+            end_date: Last day, inclusive (YYYY-MM-DD)
+            source_temporal: Temporal column used to split the source table by day
+            dest_temporal: Temporal column used to split the destination table by day
+            columns_to_test: Optional list of specific columns to test
+            incremental: Skip days unchanged since their last validation
+                         (requires incremental.path in the config)
+
+        Returns:
+            Dictionary with range results; 'days' holds one result per day, in the
+            same format as compare() plus 'filter_date' (and 'carried_forward' /
+            'validated_at' for days that were not compared again)
+        """
+        pins = self._pin_cache_databases()
+        try:
+            return self._compare_date_range(
+                source_table, dest_table, start_date, end_date,
+                source_temporal, dest_temporal, columns_to_test, incremental
+            )
+        finally:
+            self._release_cache_databases(pins)
+
+    def _compare_date_range(
+        self,
+        source_table: str,
+        dest_table: str,
+        start_date: str,
+        end_date: str,
+        source_temporal: TemporalColumn,
+        dest_temporal: TemporalColumn,
+        columns_to_test: Optional[List[str]] = None,
+        incremental: bool = False
+    ) -> Dict[str, Any]:
+        """Run the date range comparison synchronously."""
+        days = days_in_range(start_date, end_date)
+        if not days:
+            raise ValueError(f"Empty date range: {start_date} to {end_date}")
+
+        fingerprint_store = self._get_fingerprint_store() if incremental else None
+
+        result = self._start_comparison(source_table, dest_table)
+        result.update({'start_date': days[0].isoformat(), 'end_date': days[-1].isoformat(), 'days': []})
+
+        # Phase 1: schema once, row counts (and fingerprints) for all days in one grouped query per side
+        logger.info(f"Phase 1: Basic validation for {len(days)} days")
+        print(f"\n[Phase 1] Basic Validation ({days[0]} to {days[-1]}, {len(days)} days)...")
+
+        proceed, common_column_names = self._run_schema_validation(result, source_table, dest_table)
+        schema_test = result['tests'][-1]
+
+        fingerprints = self._run_paired(
+            lambda: self._get_day_fingerprints(
+                self.source_connector, source_table, source_temporal, days, detailed=incremental
+            ),
+            lambda: self._get_day_fingerprints(
+                self.dest_connector, dest_table, dest_temporal, days, detailed=incremental
+            ),
+            'day_fingerprints'
+        )
+        source_fingerprints, dest_fingerprints = fingerprints.source, fingerprints.dest
+        source_counts = {day: fp['row_count'] for day, fp in source_fingerprints.items()}
+        dest_counts = {day: fp['row_count'] for day, fp in dest_fingerprints.items()}
+        print(f"  Row Counts: source {sum(source_counts.values()):,}, destination {sum(dest_counts.values()):,}")
+
+        day_results = []
+        for day in days:
+            row_test = self._row_count_result(source_counts[day], dest_counts[day])
+            day_results.append({
+                'source_table': source_table,
+                'dest_table': dest_table,
+                'filter_date': day.isoformat(),
+                'timestamp': result['timestamp'],
+                'overall_status': 'PASS',
+                'summary': {},
+                'tests': [row_test.to_dict(), dict(schema_test)],
+                'timings': dict(self.timings)
+            })
+
+        # Carry forward days that did not change since their last validation
+        days_to_test = list(days)
+        if fingerprint_store is not None:
+            pair_key = f"{source_table} -> {dest_table}"
+            settings_hash = self._settings_hash(columns_to_test, source_temporal, dest_temporal)
+
+            days_to_test = []
+            for idx, day in enumerate(days):
+                previous = fingerprint_store.get_unchanged(
+                    pair_key, day.isoformat(), settings_hash, source_fingerprints[day], dest_fingerprints[day]
+                )
+                if previous is None:
+                    days_to_test.append(day)
+                else:
+                    previous['carried_forward'] = True
+                    day_results[idx] = previous
+
+            print(f"  Incremental: {len(days) - len(days_to_test)} unchanged days carried forward, "
+                  f"{len(days_to_test)} to validate")
+
+        # Phase 2: one sample per side covering all days to test
+        cols_to_test_filtered = None
+        if proceed and days_to_test:
+            cols_to_cache = common_column_names if common_column_names else columns_to_test
+            if cols_to_cache:
+                # The temporal columns are needed to split the samples by day
+                cols_to_cache = list(cols_to_cache)
+                for temporal in (source_temporal, dest_temporal):
+                    if temporal.column.upper() not in {c.upper() for c in cols_to_cache}:
+                        cols_to_cache.append(temporal.column)
+
+            source_where, dest_where, presampled = self._build_range_sample_filters(
+                source_table, dest_table, source_temporal, dest_temporal, days_to_test, source_counts, dest_counts
+            )
+            cols_to_test_filtered = self._run_caching_phase(
+                source_table, dest_table, cols_to_cache, source_where, dest_where, presampled
+            )
+
+        # Phase 3: column tests per day on slices of the cached samples
+        tested_results = {day: day_results[days.index(day)] for day in days_to_test}
+        if cols_to_test_filtered is not None:
+            self._rename_cache_tables('_range')
+            try:
+                for day, day_result in tested_results.items():
+                    print(f"\n📅 {day}")
+                    source_rows = self._slice_cached_day(
+                        self.source_connector, self.source_cache_table, source_temporal, day, presampled
+                    )
+                    dest_rows = self._slice_cached_day(
+                        self.dest_connector, self.dest_cache_table, dest_temporal, day, presampled
+                    )
+
+                    if source_rows and dest_rows:
+                        self._run_column_test_phase(day_result, source_table, dest_table, cols_to_test_filtered)
+                    else:
+                        print(f"  No sampled rows (source {source_rows}, destination {dest_rows}) - column tests skipped")
+            finally:
+                self._drop_range_cache_tables('_range')
+
+        for day, day_result in tested_results.items():
+            # Each day gets its own copy of the shared range phases (fingerprints, caching)
+            day_result['timings'] = dict(self.timings)
+            self._finalize_result(day_result)
+            if fingerprint_store is not None:
+                fingerprint_store.put(
+                    pair_key, day.isoformat(), settings_hash,
+                    source_fingerprints[day], dest_fingerprints[day], day_result
+                )
+
+        self._finalize_range_result(result, day_results)
+        return result
+
+    def _get_fingerprint_store(self) -> FingerprintStore:
+        """Open the fingerprint store configured under incremental.path."""
+        path = self.config.get('incremental', {}).get('path')
+        if not path:
+            raise ValueError("Incremental validation needs incremental.path in the config")
+        return FingerprintStore(path)
+
+    def _settings_hash(self, columns_to_test: Optional[List[str]], *temporal_columns: TemporalColumn) -> str:
+        """Hash of everything besides the data that a day's result depends on (operational config excluded)."""
+        settings = {
+            'config': self.settings_digest(self.config),
+            'columns': sorted(columns_to_test) if columns_to_test else None,
+            'temporal': [asdict(temporal) for temporal in temporal_columns]
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+
+    def _get_day_fingerprints(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        temporal: TemporalColumn,
+        days: List[date],
+        detailed: bool = False
+    ) -> Dict[date, Dict[str, Any]]:
+        """
+        Count rows per day, optionally with a fingerprint of each day, in one grouped query.
+
+        Args:
+            connector: Connector that owns the table
+            table_name: Table name
+            temporal: Temporal column used to split the table by day
+            days: Days to count
+            detailed: Also compute per-column null counts, a checksum of the hash
+                      sampling column and the temporal column's bounds
+
+        Returns:
+            Dictionary mapping day -> fingerprint with at least 'row_count'
+            (0 for days without rows)
+        """
+        cases = ' '.join(f"WHEN {temporal.day_predicate(day)} THEN '{day.isoformat()}'" for day in days)
+        overall = temporal.range_predicate(day_range(days[0])[0], day_range(days[-1])[1])
+
+        inner = [f"CASE {cases} END AS validation_day"]
+        outer = ["validation_day", "COUNT(*) AS row_count"]
+        null_columns = []
+
+        if detailed:
+            schema = connector.get_table_schema(table_name)
+            null_columns = [field.name for field in schema if not self._is_binary_type(field)]
+
+            inner.append(f"{temporal.column} AS temporal_value")
+            outer += ["MIN(temporal_value) AS min_temporal", "MAX(temporal_value) AS max_temporal"]
+
+            binary_cols = {field.name.upper() for field in schema if self._is_binary_type(field)}
+            facts = self._catalog_lookup(connector, table_name, schema)
+            hash_col = self._resolve_hash_column(connector, table_name, schema, binary_cols, facts)
+            if hash_col:
+                is_hana = isinstance(connector, HanaConnector)
+                inner.append(f"MOD({self._hash_expression(hash_col, is_hana)}, 1000003) AS row_hash")
+                outer.append("SUM(row_hash) AS checksum")
+
+            for idx, col in enumerate(null_columns):
+                inner.append(f'CASE WHEN "{col}" IS NULL THEN 1 ELSE 0 END AS null_{idx}')
+                outer.append(f"SUM(null_{idx}) AS nulls_{idx}")
+
+        query = f"""
+        SELECT {', '.join(outer)}
+        FROM (
+            SELECT {', '.join(inner)}
+            FROM {table_name}
+            WHERE {overall}
+        ) t
+        GROUP BY validation_day
+        """
+
+        fingerprints = {day: {'row_count': 0} for day in days}
+        for row in connector.execute_query(" ".join(query.split())).to_pylist():
+            values = {key.lower(): value for key, value in row.items()}
+            if not values['validation_day']:
+                continue
+
+            fingerprint = {'row_count': int(values['row_count'])}
+            if detailed:
+                fingerprint['min_temporal'] = str(values['min_temporal'])
+                fingerprint['max_temporal'] = str(values['max_temporal'])
+                if 'checksum' in values:
+                    fingerprint['checksum'] = int(values['checksum'] or 0)
+                fingerprint['null_counts'] = {
+                    col: int(values[f'nulls_{idx}'] or 0) for idx, col in enumerate(null_columns)
+                }
+            fingerprints[date.fromisoformat(str(values['validation_day']))] = fingerprint
+
+        return fingerprints
+
+    def _build_range_sample_filters(
+        self,
+        source_table: str,
+        dest_table: str,
+        source_temporal: TemporalColumn,
+        dest_temporal: TemporalColumn,
+        days: List[date],
+        source_counts: Dict[date, int],
+        dest_counts: Dict[date, int]
+    ) -> tuple:
+        """
+        Build WHERE clauses that sample about max_sample_size rows of every day.
+
+        Each day gets its own hash threshold from its row count, so small and
+        large days are sampled alike. Without sampling or a hash column on either
+        side, the whole range is cached with the regular sampling instead.
+
+        Returns:
+            Tuple of (source_where, dest_where, presampled)
+        """
+        source_overall = source_temporal.range_predicate(day_range(days[0])[0], day_range(days[-1])[1])
+        dest_overall = dest_temporal.range_predicate(day_range(days[0])[0], day_range(days[-1])[1])
+
+        if not self.sampling_enabled or self.sampling_strategy != 'hash':
+            return source_overall, dest_overall, False
+
+        hash_columns = []
+        for connector, table_name in ((self.source_connector, source_table), (self.dest_connector, dest_table)):
+            schema = connector.get_table_schema(table_name)
+            binary_cols = {field.name.upper() for field in schema if self._is_binary_type(field)}
+            facts = self._catalog_lookup(connector, table_name, schema)
+            hash_columns.append(self._resolve_hash_column(connector, table_name, schema, binary_cols, facts))
+
+        if not all(hash_columns):
+            logger.warning("No hash column for stratified sampling - days share one sample of the range")
+            return source_overall, dest_overall, False
+
+        def stratified(connector: BaseConnector, temporal: TemporalColumn, hash_col: str,
+                       day_counts: Dict[date, int], overall: str) -> str:
+            is_hana = isinstance(connector, HanaConnector)
+            day_filters = []
+            for day in days:
+                if not day_counts[day]:
+                    continue
+                sample_pct = int(self.sample_size / day_counts[day] * 100) + 1
+                if sample_pct >= 100:
+                    day_filters.append(f"({temporal.day_predicate(day)})")
+                else:
+                    day_filters.append(
+                        f"({temporal.day_predicate(day)} AND {self._hash_predicate(hash_col, sample_pct, is_hana)})"
+                    )
+            return f"{overall} AND ({' OR '.join(day_filters) if day_filters else '1 = 0'})"
+
+        source_where = stratified(self.source_connector, source_temporal, hash_columns[0], source_counts, source_overall)
+        dest_where = stratified(self.dest_connector, dest_temporal, hash_columns[1], dest_counts, dest_overall)
+        logger.info(f"Stratified sampling by day on '{hash_columns[0]}' / '{hash_columns[1]}'")
+        return source_where, dest_where, True
+
+    def _rename_cache_tables(self, suffix: str):
+        """Move both cache tables aside (e.g. cached_source -> cached_source_range)."""
+        for connector, table_name in (
+            (self.source_connector, self.source_cache_table),
+            (self.dest_connector, self.dest_cache_table)
+        ):
+            with connector.get_cache_connection() as conn:
+                conn.execute(f"DROP TABLE IF EXISTS {table_name}{suffix}")
+                conn.execute(f"ALTER TABLE {table_name} RENAME TO {table_name}{suffix}")
+
+    def _drop_range_cache_tables(self, suffix: str):
+        """Drop the tables moved aside by _rename_cache_tables()."""
+        for connector, table_name in (
+            (self.source_connector, self.source_cache_table),
+            (self.dest_connector, self.dest_cache_table)
+        ):
+            try:
+                with connector.get_cache_connection() as conn:
+                    conn.execute(f"DROP TABLE IF EXISTS {table_name}{suffix}")
+            except Exception as e:
+                logger.warning(f"Could not drop cache table {table_name}{suffix}: {str(e)}")
+
+    def _slice_cached_day(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        temporal: TemporalColumn,
+        day: date,
+        presampled: bool
+    ) -> int:
+        """
+        Rebuild a cache table from the rows of one day of its range sample.
+
+        Returns:
+            Number of rows in the day's cache table
+        """
+        day_expression = temporal.duckdb_day_expression(f'"{temporal.column.lower()}"')
+        limit = f"LIMIT {self.sample_size}" if presampled else ""
+
+        with connector.get_cache_connection() as conn:
+            conn.execute(f"""
+                CREATE OR REPLACE TABLE {table_name} AS
+                SELECT * FROM {table_name}_range
+                WHERE {day_expression} = DATE '{day.isoformat()}'
+                {limit}
+            """)
+            return conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+
+    def _finalize_range_result(self, result: Dict[str, Any], day_results: List[Dict[str, Any]]):
+        """Summarize per-day results into the range result."""
+        result['days'] = day_results
+
+        statuses = [day_result['overall_status'] for day_result in day_results]
+        result['summary'] = {
+            'total_days': len(day_results),
+            'passed_days': statuses.count('PASS'),
+            'warning_days': statuses.count('WARNING'),
+            'failed_days': statuses.count('FAIL'),
+            'total_tests': sum(d['summary']['total_tests'] for d in day_results),
+            'passed': sum(d['summary']['passed'] for d in day_results),
+            'failed': sum(d['summary']['failed'] for d in day_results)
+        }
+
+        if 'FAIL' in statuses:
+            result['overall_status'] = 'FAIL'
+        elif 'WARNING' in statuses:
+            result['overall_status'] = 'WARNING'
+        else:
+            result['overall_status'] = 'PASS'
+
+        print(f"\n{'='*60}")
+        print(f"RESULT: {result['overall_status']} "
+              f"({result['summary']['passed_days']}/{len(day_results)} days passed)")
+        for day_result in day_results:
+            carried = " - carried forward" if day_result.get('carried_forward') else ""
+            print(f"  {day_result['filter_date']}: {day_result['overall_status']} "
+                  f"({day_result['summary']['passed']}/{day_result['summary']['total_tests']} tests passed{carried})")
+        print(f"{'='*60}\n")
+
+    async def compare_async(
+        self,
+        source_table: str,
+        dest_table: str,
+        columns_to_test: Optional[List[str]] = None,
+        source_where: Optional[str] = None,
+        dest_where: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Asyncio variant of compare().
+
+        Each phase runs in an executor so the event loop is never blocked. The
+        comparison can be cancelled between phases; on cancellation the cache
+        tables are dropped once the in-flight phase has finished.
+
+        Args:
+            source_table: Fully qualified source table name
+            dest_table: Fully qualified destination table name
+            columns_to_test: Optional list of specific columns to test
+            source_where: Optional WHERE clause for source table
+            dest_where: Optional WHERE clause for destination table
+            executor: Executor for the blocking phases (default: the loop's default executor)
+            use_cache: Set to False to ignore (but still refresh) the result cache
 
         Returns:
             Dictionary with comparison results
         """
+        loop = asyncio.get_running_loop()
+
+        def run_phase(fn: Callable, *args) -> asyncio.Future:
+            return loop.run_in_executor(executor, functools.partial(self._locked, fn, *args))
+
+        pins = self._pin_cache_databases()
+        tested = False
+
+        try:
+            cache_entry = await run_phase(
+                self._lookup_result_cache, source_table, dest_table, columns_to_test, source_where, dest_where,
+                use_cache
+            )
+            if cache_entry and cache_entry.get('result'):
+                return cache_entry['result']
+
+            result = self._start_comparison(source_table, dest_table)
+
+            proceed, common_column_names = await run_phase(
+                self._run_basic_validation, result, source_table, dest_table, source_where, dest_where,
+                self._probed_row_counts(cache_entry)
+            )
+            if proceed:
+                cols_to_cache = common_column_names if common_column_names else columns_to_test
+
+                cols_to_test_filtered = await run_phase(
+                    self._run_caching_phase, source_table, dest_table, cols_to_cache, source_where, dest_where
+                )
+                if cols_to_test_filtered is not None:
+                    await run_phase(
+                        self._run_column_test_phase, result, source_table, dest_table, cols_to_test_filtered
+                    )
+                    tested = True
+        except asyncio.CancelledError:
+            logger.warning(f"Comparison cancelled: {source_table} → {dest_table}")
+            loop.run_in_executor(executor, functools.partial(self._locked, self.drop_cache_tables))
+            raise
+        finally:
+            self._release_cache_databases(pins)
+
+        self._finalize_result(result)
+        if tested:
+            self._print_summary(result)
+        self._store_result_cache(cache_entry, result)
+
+        return result
+
+    def _lookup_result_cache(
+        self,
+        source_table: str,
+        dest_table: str,
+        columns_to_test: Optional[List[str]],
+        source_where: Optional[str],
+        dest_where: Optional[str],
+        use_cache: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Probe both sides and look the comparison up in the result cache.
+
+        Args:
+            source_table: Source table name
+            dest_table: Destination table name
+            columns_to_test: Columns requested for the comparison
+            source_where: Optional WHERE clause for source
+            dest_where: Optional WHERE clause for destination
+            use_cache: If False, probe for storing only and never return a cached result
+
+        Returns:
+            None without a result cache (or if probing failed); otherwise the
+            lookup context for _store_result_cache(), whose 'result' is the
+            cached result on a hit and None on a miss. Without the probe column
+            on both sides, the context only carries the probed row counts and
+            nothing is looked up or stored
+        """
+        if self.result_cache is None:
+            return None
+
+        try:
+            probes = self._run_paired(
+                lambda: self._freshness_probe(
+                    self.source_connector, source_table, source_where, self.source_probe_column
+                ),
+                lambda: self._freshness_probe(
+                    self.dest_connector, dest_table, dest_where, self.dest_probe_column
+                ),
+                'freshness_probe'
+            )
+        except Exception as e:
+            logger.warning(f"Freshness probe failed, result cache not used: {str(e)}")
+            return None
+
+        if 'max_value' not in probes.source or 'max_value' not in probes.dest:
+            # A row count alone misses in-place updates: reuse the counts, never the cache
+            logger.info(f"No refresh column to probe on both sides of {source_table} → {dest_table}, "
+                        f"result cache not used")
+            return {'cache_key': None, 'source_probe': probes.source, 'dest_probe': probes.dest, 'result': None}
+
+        config = {
+            section: value for section, value in self.config.items()
+            if section not in RESULT_CACHE_IGNORED_SECTIONS
+        }
+        cache_entry = {
+            'cache_key': ResultCache.digest({
+                'source_table': source_table,
+                'dest_table': dest_table,
+                'source_where': source_where,
+                'dest_where': dest_where,
+                'columns': sorted(columns_to_test) if columns_to_test else None
+            }),
+            'config_hash': ResultCache.digest(config),
+            'thresholds_hash': ResultCache.digest(self.config.get('thresholds', {})),
+            'source_probe': probes.source,
+            'dest_probe': probes.dest,
+            'result': None
+        }
+        if not use_cache:
+            return cache_entry
+
+        stored = self.result_cache.get(
+            cache_entry['cache_key'], cache_entry['config_hash'], probes.source, probes.dest
+        )
+        if stored is None:
+            return cache_entry
+
+        if stored['thresholds_hash'] != cache_entry['thresholds_hash']:
+            # Same data and sampling, new thresholds: re-score the persisted samples offline
+            result = self._rescore_from_samples(stored['result'])
+            if result is None:
+                logger.info(f"Thresholds changed since {source_table} was cached, comparing again")
+                return cache_entry
+
+            self._store_result_cache(cache_entry, result)
+            cache_entry['result'] = result
+            return cache_entry
+
+        result = stored['result']
+        result['cached'] = True
+        result['cached_at'] = stored['updated_at']
+        logger.info(f"Using cached result for {source_table} → {dest_table} from {stored['updated_at']}")
+        print(f"\n{'='*60}")
+        print(f"Comparing: {source_table} → {dest_table}")
+        print(f"{'='*60}")
+        print(f"  Unchanged since {stored['updated_at']} "
+              f"({probes.source['row_count']:,} / {probes.dest['row_count']:,} rows): "
+              f"cached result {result['overall_status']}")
+
+        cache_entry['result'] = result
+        return cache_entry
+
+    def _rescore_from_samples(self, previous: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Re-score a previous result from its persisted samples with this comparator's config.
+
+        Returns:
+            New result, or None if the samples are unavailable or re-scoring failed
+        """
+        sample_dir = previous.get('sample_dir')
+        if not sample_dir or not os.path.exists(os.path.join(sample_dir, 'sample.json')):
+            return None
+
+        try:
+            offline = TableComparator.from_samples(sample_dir, self.config)
+        except Exception as e:
+            logger.warning(f"Could not load samples from {sample_dir}: {str(e)}")
+            return None
+
+        try:
+            logger.info(f"Thresholds changed, re-scoring samples from {sample_dir}")
+            return offline.rescore(previous)
+        except Exception as e:
+            logger.warning(f"Re-scoring {sample_dir} failed: {str(e)}")
+            return None
+        finally:
+            offline.source_connector.close()
+            offline.dest_connector.close()
+
+    def _freshness_probe(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        where_clause: Optional[str],
+        probe_column: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Cheap summary of a (filtered) table that changes whenever its data is reloaded.
+
+        Args:
+            connector: Connector that owns the table
+            table_name: Table name
+            where_clause: Optional WHERE clause
+            probe_column: Optional refresh timestamp column; its MAX is included
+                          when the table has it
+
+        Returns:
+            Dictionary with 'row_count' and, if probed, 'max_value'
+        """
+        select = ["COUNT(*) AS row_count"]
+        if probe_column:
+            field = next(
+                (f for f in connector.get_table_schema(table_name) if f.name.upper() == probe_column.upper()),
+                None
+            )
+            if field is not None:
+                select.append(f'MAX("{field.name}") AS max_value')
+
+        query = f"SELECT {', '.join(select)} FROM {table_name}"
+        if where_clause:
+            query += f" WHERE {where_clause}"
+
+        row = {key.lower(): value for key, value in connector.execute_query(query).to_pylist()[0].items()}
+        probe = {'row_count': int(row['row_count'])}
+        if 'max_value' in row:
+            probe['max_value'] = str(row['max_value'])
+        return probe
+
+    @staticmethod
+    def _probed_row_counts(cache_entry: Optional[Dict[str, Any]]) -> Optional[Tuple[int, int]]:
+        """Row counts from the freshness probes, so phase 1 does not count again."""
+        if cache_entry is None:
+            return None
+        return cache_entry['source_probe']['row_count'], cache_entry['dest_probe']['row_count']
+
+    def _store_result_cache(self, cache_entry: Optional[Dict[str, Any]], result: Dict[str, Any]):
+        """Store a fresh result under the probes taken before it was computed."""
+        if cache_entry is None or cache_entry['cache_key'] is None:
+            return
+
+        # Errors are usually transient (timeouts, dropped connections): compare again next time
+        if result['summary'].get('errors'):
+            logger.info("Result has errors, not cached")
+            return
+
+        self.result_cache.put(
+            cache_entry['cache_key'], cache_entry['config_hash'], cache_entry['thresholds_hash'],
+            cache_entry['source_probe'], cache_entry['dest_probe'], result
+        )
+
+    def _pin_cache_databases(self) -> List[duckdb.DuckDBPyConnection]:
+        """
+        Open a connection to each DuckDB cache and keep it for the whole comparison.
+
+        Cache helpers use short-lived connections. When the last one closes, DuckDB
+        shuts the database down, and reopening it from the source and destination
+        threads at the same time can race ("pandas_scan does not exist").
+        """
+        pins = []
+        for connector in {id(c): c for c in (self.source_connector, self.dest_connector)}.values():
+            try:
+                pins.append(connector.get_cache_connection())
+            except Exception as e:
+                logger.debug(f"Could not pin cache database: {str(e)}")
+        return pins
+
+    def _release_cache_databases(self, pins: List[duckdb.DuckDBPyConnection]):
+        """Close connections opened by _pin_cache_databases()."""
+        for conn in pins:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _locked(self, fn: Callable, *args):
+        """Run fn while holding the phase lock."""
+        with self._phase_lock:
+            return fn(*args)
+
+    def drop_cache_tables(self):
+        """Drop this comparator's DuckDB cache tables (used after cancellation)."""
+        for connector, table_name in (
+            (self.source_connector, self.source_cache_table),
+            (self.dest_connector, self.dest_cache_table)
+        ):
+            try:
+                with connector.get_cache_connection() as conn:
+                    conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+            except Exception as e:
+                logger.warning(f"Could not drop cache table {table_name}: {str(e)}")
+
+    def _start_comparison(self, source_table: str, dest_table: str) -> Dict[str, Any]:
+        """Create the result skeleton and reset per-comparison state."""
         logger.info(f"Starting comparison: {source_table} → {dest_table}")
         print(f"\n{'='*60}")
         print(f"Comparing: {source_table} → {dest_table}")
@@ -389,21 +1501,62 @@ class TableComparator:
             'timestamp': datetime.now().isoformat(),
             'overall_status': 'PASS',
             'summary': {},
-            'tests': []
+            'tests': [],
+            'timings': {}
         }
+        self.timings = result['timings']
         
         # Store table names for categorical distribution queries
         self.source_table_name = source_table
         self.dest_table_name = dest_table
-        
-        # Phase 1: Basic Validation
+
+        return result
+
+    def _run_basic_validation(
+        self,
+        result: Dict[str, Any],
+        source_table: str,
+        dest_table: str,
+        source_where: Optional[str] = None,
+        dest_where: Optional[str] = None,
+        row_counts: Optional[Tuple[int, int]] = None
+    ) -> tuple:
+        """
+        Phase 1: row count and schema validation.
+
+        Args:
+            row_counts: Optional (source, destination) counts already known for
+                        the filtered tables, e.g. from the result cache probes
+
+        Returns:
+            Tuple of (proceed, common_column_names). proceed is False when there are
+            no common columns to test; common_column_names is None unless the
+            schema test failed.
+        """
         logger.info("Phase 1: Basic validation")
         print("\n[Phase 1] Basic Validation...")
 
-        row_test = self._test_row_count(source_table, dest_table, source_where, dest_where)
+        if row_counts is not None:
+            row_test = self._row_count_result(*row_counts)
+        else:
+            row_test = self._test_row_count(source_table, dest_table, source_where, dest_where)
         result['tests'].append(row_test.to_dict())
         print(f"  Row Count: {row_test.status} ({row_test.details.get('difference', 0)} rows diff)")
-        
+
+        return self._run_schema_validation(result, source_table, dest_table)
+
+    def _run_schema_validation(
+        self,
+        result: Dict[str, Any],
+        source_table: str,
+        dest_table: str
+    ) -> tuple:
+        """
+        Schema validation, appended to result['tests'].
+
+        Returns:
+            Tuple of (proceed, common_column_names), as for _run_basic_validation()
+        """
         schema_test = self._test_schema(source_table, dest_table)
         result['tests'].append(schema_test.to_dict())
         print(f"  Schema: {schema_test.status}")
@@ -415,34 +1568,49 @@ class TableComparator:
             print("\n⚠️  Schema mismatch - testing common columns only")
             
             # Get common columns (case-insensitive)
-            source_schema = self.source_connector.get_table_schema(source_table)
-            dest_schema = self.dest_connector.get_table_schema(dest_table)
+            schemas = self._run_paired(
+                lambda: self.source_connector.get_table_schema(source_table),
+                lambda: self.dest_connector.get_table_schema(dest_table),
+                'common_columns_schema'
+            )
+            source_schema, dest_schema = schemas.source, schemas.dest
             common_column_names = self.schema_validator.get_common_columns(source_schema, dest_schema)
             
             if len(common_column_names) == 0:
                 print("   No common columns to test - skipping column tests")
-                self._finalize_result(result)
-                return result
+                return False, common_column_names
             
             print(f"   Found {len(common_column_names)} common columns to test")
-        
-        # Phase 2: Cache tables for efficient column testing
+
+        return True, common_column_names
+
+    def _run_caching_phase(
+        self,
+        source_table: str,
+        dest_table: str,
+        cols_to_cache: Optional[List[str]] = None,
+        source_where: Optional[str] = None,
+        dest_where: Optional[str] = None,
+        presampled: bool = False
+    ) -> Optional[List[str]]:
+        """
+        Phase 2: cache samples of both tables to DuckDB.
+
+        Returns:
+            Columns that were cached on both sides, or None if caching failed
+        """
         logger.info("Phase 2: Caching tables")
         print("\n[Phase 2] Caching Tables...")
 
-        # Use common columns if schema failed, otherwise use user-specified or all
-        cols_to_cache = common_column_names if common_column_names else columns_to_test
-
         try:
             cached_source_cols, cached_dest_cols = self._cache_tables(
-                source_table, dest_table, cols_to_cache, source_where, dest_where
+                source_table, dest_table, cols_to_cache, source_where, dest_where, presampled
             )
         except Exception as e:
             logger.error(f"Failed to cache tables: {str(e)}")
             print(f"\n❌ Error caching tables: {str(e)}")
             print("   Cannot proceed with column-level tests")
-            self._finalize_result(result)
-            return result
+            return None
         
         # Only test columns that were successfully cached (case-insensitive match)
         cached_source_upper = [c.upper() for c in cached_source_cols]
@@ -465,18 +1633,245 @@ class TableComparator:
                 col for col in cached_source_cols 
                 if col.upper() in cached_dest_upper
             ]
-        
-        # Phase 3: Column-level statistical tests
+
+        return cols_to_test_filtered
+
+    def _run_column_test_phase(
+        self,
+        result: Dict[str, Any],
+        source_table: str,
+        dest_table: str,
+        columns: List[str]
+    ):
+        """
+        Phase 3: column-level statistical tests on the cached samples.
+
+        With sample_store.path configured, the samples are then persisted so the
+        result can be re-scored offline (see rescore()).
+        """
         logger.info("Phase 3: Statistical tests on columns")
         print("\n[Phase 3] Statistical Tests on Columns...")
         
-        column_tests = self._test_columns(source_table, dest_table, cols_to_test_filtered)
+        column_tests = self._test_columns(source_table, dest_table, columns)
         result['tests'].extend([test.to_dict() for test in column_tests])
-        
-        # Finalize results
+
+        if self.sample_store_path:
+            self._persist_samples(result, columns)
+
+    def _persist_samples(self, result: Dict[str, Any], columns: List[str]):
+        """
+        Write the cached samples and what is needed to test them again to sample_store.path.
+
+        Sets result['sample_dir'] on success; failures only log a warning.
+
+        Args:
+            result: Result of the comparison the samples belong to
+            columns: Columns that were tested
+        """
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', f"{result['source_table']}__{result['dest_table']}").strip('_')
+        run_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        if result.get('filter_date'):
+            run_id = f"{result['filter_date']}_{run_id}"
+        sample_dir = os.path.join(self.sample_store_path, slug, run_id)
+
+        try:
+            self._export_cache_tables(sample_dir)
+
+            source_schema = self.source_connector.get_table_schema(result['source_table'])
+            metadata = {
+                'source_table': result['source_table'],
+                'dest_table': result['dest_table'],
+                'columns': columns,
+                'coerced_columns': self.coerced_columns,
+                'source_schema': base64.b64encode(source_schema.serialize().to_pybytes()).decode('ascii')
+            }
+            with open(os.path.join(sample_dir, 'sample.json'), 'w') as f:
+                json.dump(metadata, f)
+        except Exception as e:
+            logger.warning(f"Could not persist samples to {sample_dir}: {str(e)}")
+            return
+
+        result['sample_dir'] = sample_dir
+        logger.info(f"Samples persisted to {sample_dir}")
+
+        if self.sample_store_keep_runs:
+            self._prune_sample_runs(os.path.dirname(sample_dir), run_id)
+
+    def _prune_sample_runs(self, table_dir: str, run_id: str):
+        """
+        Delete all but the newest sample_store.keep_runs runs of a table pair for the same filter date.
+
+        Run directories are named [<filter_date>_]<timestamp>, so runs of one
+        filter date sort by age. Reports and cached results whose samples were
+        pruned can no longer be re-scored and are compared again instead.
+
+        Args:
+            table_dir: Sample directory of the table pair
+            run_id: Run just persisted (its filter date selects the runs to prune)
+        """
+        def date_prefix(name: str) -> str:
+            match = re.match(r'\d{4}-\d{2}-\d{2}_', name)
+            return match.group(0) if match else ''
+
+        prefix = date_prefix(run_id)
+        runs = sorted(name for name in os.listdir(table_dir) if date_prefix(name) == prefix)
+        for name in runs[:-self.sample_store_keep_runs]:
+            shutil.rmtree(os.path.join(table_dir, name), ignore_errors=True)
+            logger.debug(f"Pruned sample run {name} of {table_dir}")
+
+    def _export_cache_tables(self, directory: str):
+        """Write both cached samples to source.parquet and dest.parquet in a directory."""
+        os.makedirs(directory, exist_ok=True)
+        for connector, table_name, side in (
+            (self.source_connector, self.source_cache_table, 'source'),
+            (self.dest_connector, self.dest_cache_table, 'dest')
+        ):
+            path = os.path.join(directory, f"{side}.parquet").replace("'", "''")
+            with connector.get_cache_connection() as conn:
+                conn.execute(f"COPY {table_name} TO '{path}' (FORMAT PARQUET)")
+
+    def _import_cache_tables(self, directory: str) -> bool:
+        """
+        Load samples written by _export_cache_tables() back into the cache tables.
+
+        Returns:
+            True if both samples were loaded
+        """
+        try:
+            for connector, table_name, side in (
+                (self.source_connector, self.source_cache_table, 'source'),
+                (self.dest_connector, self.dest_cache_table, 'dest')
+            ):
+                path = os.path.join(directory, f"{side}.parquet").replace("'", "''")
+                with connector.get_cache_connection() as conn:
+                    conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM read_parquet('{path}')")
+        except Exception as e:
+            logger.warning(f"Could not restore checkpointed samples from {directory}: {str(e)}")
+            return False
+        return True
+
+    @staticmethod
+    def settings_digest(config: Dict[str, Any]) -> str:
+        """
+        Digest of the config sections a comparison's outcome depends on.
+
+        Unlike the result cache key, thresholds are included; operational
+        sections (execution, caches, bulk scheduling) are not.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            Hex digest
+        """
+        return ResultCache.digest({
+            section: value for section, value in config.items()
+            if section == 'thresholds' or section not in RESULT_CACHE_IGNORED_SECTIONS
+        })
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_dir: str, checkpoint_key: str) -> Dict[str, Any]:
+        """
+        Get the phases an interrupted attempt of the same comparison finished.
+
+        Returns:
+            Dictionary mapping phase name to its saved state (empty if there is no
+            usable checkpoint)
+        """
+        try:
+            with open(os.path.join(checkpoint_dir, 'checkpoint.json'), 'r') as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint in {checkpoint_dir}: {str(e)}")
+            return {}
+
+        if checkpoint.get('key') != checkpoint_key:
+            logger.info(f"Ignoring checkpoint in {checkpoint_dir}: comparison or config changed")
+            return {}
+
+        logger.info(f"Resuming from checkpoint in {checkpoint_dir} (phases: {', '.join(checkpoint['phases'])})")
+        return checkpoint['phases']
+
+    @staticmethod
+    def _save_checkpoint(checkpoint_dir: str, checkpoint_key: str, phases: Dict[str, Any]):
+        """Atomically write the finished phases; failures only log a warning."""
+        path = os.path.join(checkpoint_dir, 'checkpoint.json')
+        try:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            with open(f"{path}.tmp", 'w') as f:
+                json.dump({'key': checkpoint_key, 'phases': phases}, f, default=str)
+            os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            logger.warning(f"Could not write checkpoint {path}: {str(e)}")
+
+    @classmethod
+    def from_samples(cls, sample_dir: str, config: Dict[str, Any] = None) -> 'TableComparator':
+        """
+        Create an offline comparator over samples persisted by a previous comparison.
+
+        Args:
+            sample_dir: Directory written by a comparison with sample_store.path set
+            config: Configuration to score with (e.g. with new thresholds)
+
+        Returns:
+            TableComparator whose connectors serve the persisted samples only
+        """
+        with open(os.path.join(sample_dir, 'sample.json'), 'r') as f:
+            metadata = json.load(f)
+
+        source_schema = pa.ipc.read_schema(pa.py_buffer(base64.b64decode(metadata['source_schema'])))
+
+        # Connectors need the comparator's cache table names, so they are attached after creation
+        comparator = cls(None, None, config)
+        comparator.source_connector = SampleConnector(
+            os.path.join(sample_dir, 'source.parquet'), source_schema, comparator.source_cache_table
+        )
+        comparator.dest_connector = SampleConnector(
+            os.path.join(sample_dir, 'dest.parquet'), source_schema, comparator.dest_cache_table
+        )
+
+        # Re-scoring reads the samples, it never writes new ones
+        comparator.sample_store_path = None
+        comparator.sample_columns = metadata['columns']
+        comparator.sample_coerced_columns = metadata['coerced_columns']
+        return comparator
+
+    def rescore(self, previous: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Score a previous comparison again with this comparator's config, offline.
+
+        Row counts are re-scored from the counts recorded in the previous result,
+        the schema test is kept as is, and all column tests, FDR correction and
+        the overall status are recomputed from the persisted samples. Neither
+        source is queried.
+
+        Args:
+            previous: Result of the previous comparison (as written to its JSON report)
+
+        Returns:
+            New comparison result ('rescored_from' holds the previous timestamp)
+        """
+        result = self._start_comparison(previous['source_table'], previous['dest_table'])
+        if previous.get('filter_date'):
+            result['filter_date'] = previous['filter_date']
+        result['rescored_from'] = previous['timestamp']
+        result['sample_dir'] = previous.get('sample_dir')
+
+        for test in previous['tests']:
+            details = test.get('details', {})
+            if test['test_name'] == 'row_count' and 'source_count' in details:
+                result['tests'].append(self._row_count_result(details['source_count'], details['dest_count']).to_dict())
+            elif not test.get('column'):
+                # Table-level tests (schema) do not depend on thresholds
+                result['tests'].append(test)
+
+        self.coerced_columns = dict(self.sample_coerced_columns)
+        self._run_column_test_phase(result, result['source_table'], result['dest_table'], self.sample_columns)
+
         self._finalize_result(result)
         self._print_summary(result)
-        
         return result
     
     def _test_row_count(
@@ -514,9 +1909,13 @@ class TableComparator:
                 if dest_where:
                     dest_query += f" WHERE {dest_where}"
 
-                # Execute count queries
-                source_result = self.source_connector.execute_query(source_query)
-                dest_result = self.dest_connector.execute_query(dest_query)
+                # Execute count queries concurrently
+                counts = self._run_paired(
+                    lambda: self.source_connector.execute_query(source_query),
+                    lambda: self.dest_connector.execute_query(dest_query),
+                    'row_count'
+                )
+                source_result, dest_result = counts.source, counts.dest
 
                 # Extract counts from results (handle PyArrow Table format)
                 if hasattr(source_result, 'to_pylist'):
@@ -529,51 +1928,14 @@ class TableComparator:
                     dest_count = dest_result[0][0]
             else:
                 # No WHERE clause - use optimized get_row_count() (existing behavior)
-                source_count = self.source_connector.get_row_count(source_table)
-                dest_count = self.dest_connector.get_row_count(dest_table)
-            
-            diff = dest_count - source_count
-
-            # Threshold as ratio (e.g., 0.1% tolerance = 0.999 ratio)
-            threshold_ratio = 1.0 - (self.row_count_threshold_pct / 100)
-
-            # Handle edge case: both tables are empty (0 rows)
-            if source_count == 0 and dest_count == 0:
-                diff_pct = 0
-                ratio = 1.0  # Perfect match (both empty)
-                status = 'PASS'
-            elif source_count == 0 and dest_count > 0:
-                # Destination has data but source is empty
-                diff_pct = 100
-                ratio = float('inf')  # Infinite ratio
-                status = 'FAIL'
-            else:
-                # Normal case: source has data
-                diff_pct = abs(diff / source_count * 100)
-                ratio = dest_count / source_count
-
-                # Determine status based on ratio
-                if ratio == 1.0:
-                    status = 'PASS'
-                elif ratio >= threshold_ratio:
-                    status = 'WARNING'
-                else:
-                    status = 'FAIL'
+                counts = self._run_paired(
+                    lambda: self.source_connector.get_row_count(source_table),
+                    lambda: self.dest_connector.get_row_count(dest_table),
+                    'row_count'
+                )
+                source_count, dest_count = counts.source, counts.dest
 
-            return TestResult(
-                test_name='row_count',
-                column=None,
-                status=status,
-                details={
-                    'source_count': source_count,
-                    'dest_count': dest_count,
-                    'difference': diff,
-                    'difference_pct': round(diff_pct, 3),
-                    'ratio': round(ratio, 6) if ratio != float('inf') else None,
-                    'threshold_pct': self.row_count_threshold_pct,
-                    'threshold_ratio': round(threshold_ratio, 6)
-                }
-            )
+            return self._row_count_result(source_count, dest_count)
         except Exception as e:
             logger.error(f"Row count test failed: {str(e)}")
             return TestResult(
@@ -582,14 +1944,72 @@ class TableComparator:
                 status='ERROR',
                 details={'error': str(e)}
             )
+
+    def _row_count_result(self, source_count: int, dest_count: int) -> TestResult:
+        """
+        Score source and destination row counts against the tolerance.
+
+        Args:
+            source_count: Source row count
+            dest_count: Destination row count
+
+        Returns:
+            TestResult for the row count test
+        """
+        diff = dest_count - source_count
+
+        # Threshold as ratio (e.g., 0.1% tolerance = 0.999 ratio)
+        threshold_ratio = 1.0 - (self.row_count_threshold_pct / 100)
+
+        # Handle edge case: both tables are empty (0 rows)
+        if source_count == 0 and dest_count == 0:
+            diff_pct = 0
+            ratio = 1.0  # Perfect match (both empty)
+            status = 'PASS'
+        elif source_count == 0 and dest_count > 0:
+            # Destination has data but source is empty
+            diff_pct = 100
+            ratio = float('inf')  # Infinite ratio
+            status = 'FAIL'
+        else:
+            # Normal case: source has data
+            diff_pct = abs(diff / source_count * 100)
+            ratio = dest_count / source_count
+
+            # Determine status based on ratio
+            if ratio == 1.0:
+                status = 'PASS'
+            elif ratio >= threshold_ratio:
+                status = 'WARNING'
+            else:
+                status = 'FAIL'
+
+        return TestResult(
+            test_name='row_count',
+            column=None,
+            status=status,
+            details={
+                'source_count': source_count,
+                'dest_count': dest_count,
+                'difference': diff,
+                'difference_pct': round(diff_pct, 3),
+                'ratio': round(ratio, 6) if ratio != float('inf') else None,
+                'threshold_pct': self.row_count_threshold_pct,
+                'threshold_ratio': round(threshold_ratio, 6)
+            }
+        )
     
     def _test_schema(self, source_table: str, dest_table: str) -> TestResult:
         """Test schema validation."""
         logger.debug(f"Testing schema for {source_table} vs {dest_table}")
         
         try:
-            source_schema = self.source_connector.get_table_schema(source_table)
-            dest_schema = self.dest_connector.get_table_schema(dest_table)
+            schemas = self._run_paired(
+                lambda: self.source_connector.get_table_schema(source_table),
+                lambda: self.dest_connector.get_table_schema(dest_table),
+                'schema'
+            )
+            source_schema, dest_schema = schemas.source, schemas.dest
             
             return self.schema_validator.compare_schemas(
                 source_schema,
@@ -651,7 +2071,8 @@ class TableComparator:
         dest_table: str,
         columns: Optional[List[str]] = None,
         source_where: Optional[str] = None,
-        dest_where: Optional[str] = None
+        dest_where: Optional[str] = None,
+        presampled: bool = False
     ) -> tuple:
         """
         Cache source and destination tables to DuckDB.
@@ -662,6 +2083,7 @@ class TableComparator:
             columns: Optional list of columns to cache
             source_where: Optional WHERE clause for source table
             dest_where: Optional WHERE clause for destination table
+            presampled: True if the WHERE clauses already sample the rows
 
         Returns:
             Tuple of (source_cached_columns, dest_cached_columns)
@@ -669,8 +2091,12 @@ class TableComparator:
         logger.info("Caching source and destination tables")
         
         # Get schemas to map column names correctly
-        source_schema = self.source_connector.get_table_schema(source_table)
-        dest_schema = self.dest_connector.get_table_schema(dest_table)
+        schemas = self._run_paired(
+            lambda: self.source_connector.get_table_schema(source_table),
+            lambda: self.dest_connector.get_table_schema(dest_table),
+            'cache_schema'
+        )
+        source_schema, dest_schema = schemas.source, schemas.dest
         
         # Filter out binary columns (they cause encoding issues)
         # Use _is_binary_type() for consistent detection
@@ -720,10 +2146,24 @@ class TableComparator:
             source_cols = source_cacheable
             dest_cols = dest_cacheable
 
+        # A source scan shared with other comparisons reads every column, so that all of them
+        # issue the same query; columns the destination lacks are ignored by the tests
+        scan_share = self.source_connector.scan_share
+        if scan_share and scan_share.covers(source_table):
+            source_cols = source_cacheable
+
         # Build column lists with SAP null transformations if needed
         source_col_list = self._build_column_list(source_cols, source_schema, self.source_connector)
         dest_col_list = self._build_column_list(dest_cols, dest_schema, self.dest_connector)
 
+        # Facts from earlier runs, valid while each table's schema is unchanged
+        source_facts = self._catalog_lookup(self.source_connector, source_table, source_schema)
+        dest_facts = self._catalog_lookup(self.dest_connector, dest_table, dest_schema)
+
+        # Probe for string-encoded dates and numbers to rewrite into typed expressions
+        coercions = self._probe_coercions(source_table, source_cols, source_schema, source_where, source_facts)
+        self.coerced_columns = {}
+
         # Build queries with optimized sampling (exclude binary columns from hash selection)
         source_query = self._build_sample_query(
             source_col_list,
@@ -731,7 +2171,10 @@ class TableComparator:
             source_schema,
             isinstance(self.source_connector, HanaConnector),
             source_binary_cols,
-            source_where
+            source_where,
+            source_facts,
+            self.source_connector,
+            presampled
         )
 
         dest_query = self._build_sample_query(
@@ -740,58 +2183,190 @@ class TableComparator:
             dest_schema,
             isinstance(self.dest_connector, HanaConnector),
             source_binary_cols,  # Use source binary cols for dest too (same columns)
-            dest_where
+            dest_where,
+            dest_facts,
+            self.dest_connector,
+            presampled
         )
-        
-        print(f"  Caching source table (sample: {self.sampling_enabled})...")
-        try:
-            self.source_connector.cache_query(source_query, "cached_source")
-        except Exception as e:
-            logger.warning(f"Hash-based caching failed for source table: {str(e)}")
-            logger.info("Falling back to ORDER BY RAND() sampling...")
 
-            # Fall back to simple random sampling without hash column
-            source_query_fallback = self._build_fallback_query(
+        self._catalog_record(self.source_connector, source_table, source_schema, source_facts)
+        self._catalog_record(self.dest_connector, dest_table, dest_schema, dest_facts)
+
+        source_query_coerced = dest_query_coerced = None
+        if coercions:
+            # Same sampling query, only the SELECT list differs
+            source_query_coerced = source_query.replace(
                 source_col_list,
-                source_table,
-                isinstance(self.source_connector, HanaConnector),
-                source_where
+                self._build_column_list(source_cols, source_schema, self.source_connector, coercions),
+                1
             )
-            self.source_connector.cache_query(source_query_fallback, "cached_source")
-
-        print(f"  Caching destination table (sample: {self.sampling_enabled})...")
-        try:
-            self.dest_connector.cache_query(dest_query, "cached_dest")
-        except Exception as e:
-            logger.warning(f"Hash-based caching failed for destination table: {str(e)}")
-            logger.info("Falling back to ORDER BY RAND() sampling...")
-
-            # Fall back to simple random sampling without hash column
-            dest_query_fallback = self._build_fallback_query(
+            dest_query_coerced = dest_query.replace(
                 dest_col_list,
-                dest_table,
-                isinstance(self.dest_connector, HanaConnector),
-                dest_where
+                self._build_column_list(dest_cols, dest_schema, self.dest_connector, coercions),
+                1
             )
-            self.dest_connector.cache_query(dest_query_fallback, "cached_dest")
+        
+        def cache_source():
+            if source_query_coerced:
+                try:
+                    return self.source_connector.cache_query(source_query_coerced, self.source_cache_table)
+                except Exception as e:
+                    logger.warning(f"Coerced sampling failed for source table, retrying without coercion: {str(e)}")
+
+            try:
+                return self.source_connector.cache_query(source_query, self.source_cache_table)
+            except Exception as e:
+                logger.warning(f"Hash-based caching failed for source table: {str(e)}")
+                logger.info("Falling back to ORDER BY RAND() sampling...")
+
+                # Fall back to simple random sampling without hash column
+                source_query_fallback = self._build_fallback_query(
+                    source_col_list,
+                    source_table,
+                    isinstance(self.source_connector, HanaConnector),
+                    source_where
+                )
+                return self.source_connector.cache_query(source_query_fallback, self.source_cache_table)
+
+        def cache_dest():
+            if dest_query_coerced:
+                try:
+                    return self.dest_connector.cache_query(dest_query_coerced, self.dest_cache_table)
+                except Exception as e:
+                    logger.warning(f"Coerced sampling failed for destination table, retrying without coercion: {str(e)}")
+
+            try:
+                return self.dest_connector.cache_query(dest_query, self.dest_cache_table)
+            except Exception as e:
+                logger.warning(f"Hash-based caching failed for destination table: {str(e)}")
+                logger.info("Falling back to ORDER BY RAND() sampling...")
+
+                # Fall back to simple random sampling without hash column
+                dest_query_fallback = self._build_fallback_query(
+                    dest_col_list,
+                    dest_table,
+                    isinstance(self.dest_connector, HanaConnector),
+                    dest_where
+                )
+                return self.dest_connector.cache_query(dest_query_fallback, self.dest_cache_table)
+
+        print(f"  Caching source and destination tables concurrently (sample: {self.sampling_enabled})...")
+        cached = self._run_paired(cache_source, cache_dest, 'cache')
+
+        # Volume fetched from each side (connectors that do not report it return None)
+        for side, stats in (('source', cached.source), ('dest', cached.dest)):
+            if isinstance(stats, dict):
+                self.timings['cache'][f'{side}_rows'] = stats.get('rows')
+                self.timings['cache'][f'{side}_bytes'] = stats.get('bytes')
+        print(f"  ✓ Source {cached.source_seconds:.1f}s, destination {cached.dest_seconds:.1f}s "
+              f"(wall {cached.wall_seconds:.1f}s)")
 
         # Normalize column names to lowercase for case-insensitive comparison
         # Each table is in its respective connector's cache, so use separate connections
         source_conn = self.source_connector.get_cache_connection()
         dest_conn = self.dest_connector.get_cache_connection()
-        self._normalize_cached_table_columns(source_conn, "cached_source")
-        self._normalize_cached_table_columns(dest_conn, "cached_dest")
+        self._normalize_cached_table_columns(source_conn, self.source_cache_table)
+        self._normalize_cached_table_columns(dest_conn, self.dest_cache_table)
 
         # Get actual cached columns (some may have been dropped during caching)
         # PRAGMA table_info returns: (cid, name, type, notnull, dflt_value, pk)
         # We need index 1 for the column name
-        cached_source_cols = [col[1] for col in source_conn.execute("PRAGMA table_info(cached_source)").fetchall()]
-        cached_dest_cols = [col[1] for col in dest_conn.execute("PRAGMA table_info(cached_dest)").fetchall()]
+        source_info = source_conn.execute(f"PRAGMA table_info({self.source_cache_table})").fetchall()
+        dest_info = dest_conn.execute(f"PRAGMA table_info({self.dest_cache_table})").fetchall()
+        cached_source_cols = [col[1] for col in source_info]
+        cached_dest_cols = [col[1] for col in dest_info]
 
         logger.info(f"Tables cached successfully. Source: {len(cached_source_cols)} cols, Dest: {len(cached_dest_cols)} cols")
 
+        if coercions:
+            self.coerced_columns = self._confirm_coercions(coercions, source_info, dest_info)
+            if self.coerced_columns:
+                print(f"  ✓ Coerced {len(self.coerced_columns)} string columns to typed values")
+
         return cached_source_cols, cached_dest_cols
     
+    def _probe_coercions(
+        self,
+        source_table: str,
+        source_cols: List[str],
+        source_schema: pa.Schema,
+        source_where: Optional[str] = None,
+        catalog_facts: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, ColumnCoercion]:
+        """
+        Probe source string columns for dates and numbers stored as text.
+
+        Coercions cataloged for the same schema are reused without querying the
+        source; fresh probe results are written to catalog_facts.
+
+        Returns:
+            Dictionary mapping uppercase column name -> ColumnCoercion (empty if disabled or on error)
+        """
+        if not self.coercion_enabled:
+            return {}
+
+        schema_map = {field.name: field.type for field in source_schema}
+        string_cols = [
+            col for col in source_cols
+            if col in schema_map and TypeCoercer.is_string_type(schema_map[col])
+        ]
+        if not string_cols:
+            return {}
+
+        if catalog_facts is None:
+            catalog_facts = {}
+
+        cached = catalog_facts.get('coercions')
+        if (cached is not None and catalog_facts.get('coercion_rules') == TypeCoercer.RULES_VERSION
+                and set(string_cols) <= set(catalog_facts.get('coercion_probed', []))):
+            wanted = {col.upper() for col in string_cols}
+            logger.info(f"Using cataloged coercions for {source_table}")
+            return {col: ColumnCoercion(**c) for col, c in cached.items() if col in wanted}
+
+        try:
+            probe_list = self._build_column_list(string_cols, source_schema, self.source_connector)
+            coercions = self.type_coercer.probe(
+                self.source_connector, source_table, probe_list, string_cols, source_where
+            )
+        except Exception as e:
+            logger.warning(f"Coercion probe failed for {source_table}, caching without coercion: {str(e)}")
+            return {}
+
+        catalog_facts['coercions'] = {col: asdict(c) for col, c in coercions.items()}
+        catalog_facts['coercion_probed'] = string_cols
+        catalog_facts['coercion_rules'] = TypeCoercer.RULES_VERSION
+        return coercions
+
+    def _confirm_coercions(
+        self,
+        coercions: Dict[str, ColumnCoercion],
+        source_info: List[tuple],
+        dest_info: List[tuple]
+    ) -> Dict[str, str]:
+        """
+        Keep the coercions that produced comparable typed columns in both caches.
+
+        Numerical columns must be typed on both sides; temporal columns only on the
+        source side, since temporal tests parse string dates in DuckDB.
+
+        Returns:
+            Dictionary mapping uppercase column name -> classification override
+        """
+        # PRAGMA table_info rows: (cid, name, type, notnull, dflt_value, pk)
+        source_types = {row[1].upper(): row[2].upper() for row in source_info}
+        dest_types = {row[1].upper(): row[2].upper() for row in dest_info}
+
+        confirmed = {}
+        for col, coercion in coercions.items():
+            src_type, dst_type = source_types.get(col), dest_types.get(col)
+            if src_type is None or dst_type is None or src_type == 'VARCHAR':
+                continue
+            if coercion.kind == 'numerical' and dst_type == 'VARCHAR':
+                continue
+            confirmed[col] = coercion.kind
+
+        return confirmed
+
     def _test_columns(
         self,
         source_table: str,
@@ -853,6 +2428,27 @@ class TableComparator:
             src_total = 0
             dst_total = 0
 
+        # Classification is keyed by source column case, cached columns are lowercase
+        column_types = {
+            name.upper(): col_type
+            for col_type, names in column_classification.items()
+            for name in names
+        }
+
+        # String columns coerced to dates/numbers while caching are tested by their new type
+        column_types.update(self.coerced_columns)
+
+        # Optionally run numerical tests on a process pool up front
+        offloaded_results = {}
+        if self.test_backend == 'process':
+            offloaded_results = self._run_offloaded_tests(
+                source_conn, dest_conn, all_columns, column_types
+            )
+
+        # Temporal tests for all columns at once (one MIN/MAX query per side)
+        temporal_columns = [c for c in all_columns if column_types.get(c.upper()) == 'temporal']
+        temporal_results = self._test_temporal_columns(source_conn, dest_conn, temporal_columns)
+
         for idx, col_name in enumerate(all_columns, 1):
             print(f"\n  Column [{idx}/{len(all_columns)}]: {col_name}")
             logger.debug(f"Testing column: {col_name}")
@@ -885,12 +2481,17 @@ class TableComparator:
                   f"dst={null_test.details.get('dest_null_pct', 0):.1f}%)")
 
             # Type-specific tests
-            if col_name in column_classification['numerical']:
+            col_type = column_types.get(col_name.upper())
+            if col_name in offloaded_results:
+                results.extend(self._report_precomputed_results(offloaded_results[col_name]))
+            elif col_name in temporal_results:
+                results.extend(self._report_precomputed_results(temporal_results[col_name]))
+            elif col_type == 'numerical':
                 results.extend(self._test_numerical_column(source_conn, dest_conn, col_name_lower, col_name))
-            elif col_name in column_classification['categorical']:
+            elif col_type == 'categorical':
                 results.extend(self._test_categorical_column(source_conn, dest_conn, col_name_lower, col_name))
-            elif col_name in column_classification['temporal']:
-                results.extend(self._test_temporal_column(source_conn, dest_conn, col_name_lower, col_name))
+            elif col_type == 'temporal':
+                print(f"    Date Range: skipped (temporal bounds unavailable)")
             else:
                 print(f"    Unsupported type - skipped")
 
@@ -898,6 +2499,81 @@ class TableComparator:
         dest_conn.close()
         return results
     
+    def _run_offloaded_tests(
+        self,
+        source_conn: duckdb.DuckDBPyConnection,
+        dest_conn: duckdb.DuckDBPyConnection,
+        columns: List[str],
+        column_types: Dict[str, str]
+    ) -> Dict[str, List[TestResult]]:
+        """
+        Run numerical tests for all columns on the process-pool backend.
+
+        Each cached column is fetched once and handed to workers through shared memory.
+        Columns that cannot be represented as fixed-width arrays are left out and
+        tested in-process by the regular per-column path.
+
+        Args:
+            source_conn: DuckDB connection holding the cached source sample
+            dest_conn: DuckDB connection holding the cached destination sample
+            columns: Columns selected for testing (display case)
+            column_types: Mapping of uppercase column name -> classification
+
+        Returns:
+            Dictionary mapping column name -> list of TestResult objects
+        """
+        jobs = []
+        for col_name in columns:
+            kind = column_types.get(col_name.upper())
+            if kind != 'numerical':
+                continue
+
+            col_name_lower = col_name.lower()
+            try:
+                src_values = source_conn.execute(
+                    f'SELECT "{col_name_lower}" FROM {self.source_cache_table} WHERE "{col_name_lower}" IS NOT NULL'
+                ).fetchnumpy()[col_name_lower]
+                dst_values = dest_conn.execute(
+                    f'SELECT "{col_name_lower}" FROM {self.dest_cache_table} WHERE "{col_name_lower}" IS NOT NULL'
+                ).fetchnumpy()[col_name_lower]
+            except Exception as e:
+                logger.warning(f"Could not fetch {col_name} for process-pool tests: {str(e)}")
+                continue
+
+            src_array = ProcessTestBackend.to_shared_array(kind, src_values)
+            dst_array = ProcessTestBackend.to_shared_array(kind, dst_values)
+            if src_array is None or dst_array is None:
+                continue
+
+            jobs.append((kind, col_name, src_array, dst_array))
+
+        if not jobs:
+            return {}
+
+        print(f"\n  Running {len(jobs)} numerical column test(s) on process pool...")
+        backend = ProcessTestBackend(self.test_params, max_workers=self.test_max_workers)
+        return backend.run(jobs)
+
+    def _report_precomputed_results(self, column_results: List[TestResult]) -> List[TestResult]:
+        """Print results computed ahead of the per-column loop in the per-column format."""
+        labels = {
+            'ks_test': 'KS-Test', 't_test': 'T-Test',
+            'date_range': 'Date Range', 'daily_distribution': 'Daily PSI'
+        }
+
+        for test in column_results:
+            label = labels.get(test.test_name, test.test_name)
+            if test.test_name == 'date_range' and test.status not in ('ERROR', 'SKIP'):
+                print(f"    {label}: {test.status} ({test.details.get('source_span_days', 0)} days span)")
+            elif test.test_name == 'daily_distribution' and test.status not in ('ERROR', 'SKIP'):
+                print(f"    {label}: {test.status} (PSI={test.details.get('psi_value', 0):.4f})")
+            elif test.test_name in ('date_range', 'daily_distribution'):
+                print(f"    {label}: {test.status}")
+            else:
+                print(f"    {label}: {test.status} (p={test.details.get('p_value', 0):.4f})")
+
+        return column_results
+
     def _get_all_null_counts(self, columns: List[str]) -> tuple:
         """Get null counts for all columns in a single query for both source and destination.
 
@@ -923,8 +2599,8 @@ class TableComparator:
             dest_conn = self.dest_connector.get_cache_connection()
 
             # Get total row counts from cached tables
-            src_total = source_conn.execute("SELECT COUNT(*) FROM cached_source").fetchone()[0]
-            dst_total = dest_conn.execute("SELECT COUNT(*) FROM cached_dest").fetchone()[0]
+            src_total = source_conn.execute(f"SELECT COUNT(*) FROM {self.source_cache_table}").fetchone()[0]
+            dst_total = dest_conn.execute(f"SELECT COUNT(*) FROM {self.dest_cache_table}").fetchone()[0]
 
             # Build CASE statements for cached tables (columns are lowercase in DuckDB)
             src_case_statements = []
@@ -943,8 +2619,8 @@ class TableComparator:
             src_case_list = ', '.join(src_case_statements)
             dst_case_list = ', '.join(dst_case_statements)
 
-            src_query = f'SELECT {src_case_list} FROM cached_source'
-            dst_query = f'SELECT {dst_case_list} FROM cached_dest'
+            src_query = f'SELECT {src_case_list} FROM {self.source_cache_table}'
+            dst_query = f'SELECT {dst_case_list} FROM {self.dest_cache_table}'
 
             logger.info(f"Fetching null counts for {len(columns)} columns from cached tables (2 queries total)...")
             logger.debug(f"Source null count query (cached): {src_query[:500]}...")
@@ -1015,11 +2691,11 @@ class TableComparator:
         try:
             # Fetch data using lowercase column name from respective caches
             src_data = source_conn.execute(
-                f'SELECT "{col_name_lower}" FROM cached_source WHERE "{col_name_lower}" IS NOT NULL'
+                f'SELECT "{col_name_lower}" FROM {self.source_cache_table} WHERE "{col_name_lower}" IS NOT NULL'
             ).fetchnumpy()[col_name_lower]
 
             dst_data = dest_conn.execute(
-                f'SELECT "{col_name_lower}" FROM cached_dest WHERE "{col_name_lower}" IS NOT NULL'
+                f'SELECT "{col_name_lower}" FROM {self.dest_cache_table} WHERE "{col_name_lower}" IS NOT NULL'
             ).fetchnumpy()[col_name_lower]
             
             # KS-test
@@ -1051,7 +2727,7 @@ class TableComparator:
         try:
             # Get cardinality from cached data
             cardinality = source_conn.execute(
-                f'SELECT COUNT(DISTINCT "{col_name_lower}") FROM cached_source'
+                f'SELECT COUNT(DISTINCT "{col_name_lower}") FROM {self.source_cache_table}'
             ).fetchone()[0]
 
             if cardinality > self.max_cardinality_psi:
@@ -1061,14 +2737,14 @@ class TableComparator:
             # Get distributions from cached data
             src_dist = source_conn.execute(f'''
                 SELECT "{col_name_lower}" as value, COUNT(*) as cnt
-                FROM cached_source
+                FROM {self.source_cache_table}
                 WHERE "{col_name_lower}" IS NOT NULL
                 GROUP BY "{col_name_lower}"
             ''').fetchdf()
 
             dst_dist = dest_conn.execute(f'''
                 SELECT "{col_name_lower}" as value, COUNT(*) as cnt
-                FROM cached_dest
+                FROM {self.dest_cache_table}
                 WHERE "{col_name_lower}" IS NOT NULL
                 GROUP BY "{col_name_lower}"
             ''').fetchdf()
@@ -1093,41 +2769,169 @@ class TableComparator:
         
         return results
     
-    def _test_temporal_column(
+    def _temporal_expression(self, column: str, duckdb_type: str) -> str:
+        """
+        Build a DuckDB expression that yields a TIMESTAMP for a cached temporal column.
+
+        Args:
+            column: Cached (lowercase) column name
+            duckdb_type: Column type reported by DuckDB for the cache table
+
+        Returns:
+            SQL expression (NULL where the value cannot be read as a date)
+        """
+        quoted = f'"{column}"'
+        duckdb_type = duckdb_type.upper()
+
+        if duckdb_type.startswith(('TIMESTAMP', 'DATE')):
+            return f"CAST({quoted} AS TIMESTAMP)"
+        if duckdb_type in ('VARCHAR', 'TEXT', 'STRING'):
+            # SAP stores many dates as 'YYYYMMDD' strings
+            return (f"COALESCE(TRY_CAST({quoted} AS TIMESTAMP), "
+                    f"TRY_STRPTIME({quoted}, '%Y%m%d'))")
+        if duckdb_type in ('TINYINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'HUGEINT',
+                           'UTINYINT', 'USMALLINT', 'UINTEGER', 'UBIGINT'):
+            # 8-digit integers are YYYYMMDD dates; otherwise Unix epoch seconds, or
+            # milliseconds once the value is too large for seconds (year > 5138)
+            return (f"CASE WHEN {quoted} BETWEEN 10000101 AND 99991231 "
+                    f"THEN TRY_STRPTIME(CAST({quoted} AS VARCHAR), '%Y%m%d') "
+                    f"WHEN ABS({quoted}) < 100000000000 "
+                    f"THEN epoch_ms(CAST({quoted} AS BIGINT) * 1000) "
+                    f"ELSE epoch_ms(CAST({quoted} AS BIGINT)) END")
+        return f"TRY_CAST({quoted} AS TIMESTAMP)"
+
+    def _get_temporal_expressions(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table_name: str,
+        columns: List[str]
+    ) -> Dict[str, str]:
+        """Map cached (lowercase) column names to their TIMESTAMP expressions."""
+        # PRAGMA table_info returns: (cid, name, type, notnull, dflt_value, pk)
+        cached_types = {
+            row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table_name})").fetchall()
+        }
+        return {
+            col.lower(): self._temporal_expression(col.lower(), cached_types[col.lower()])
+            for col in columns
+            if col.lower() in cached_types
+        }
+
+    def _get_temporal_bounds(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table_name: str,
+        expressions: Dict[str, str]
+    ) -> Dict[str, tuple]:
+        """
+        Get MIN and MAX of all temporal columns of a cache table in a single query.
+
+        Returns:
+            Dictionary mapping cached column name -> (min, max)
+        """
+        if not expressions:
+            return {}
+
+        select_parts = []
+        for idx, expr in enumerate(expressions.values()):
+            select_parts.append(f"MIN({expr}) AS min_{idx}")
+            select_parts.append(f"MAX({expr}) AS max_{idx}")
+
+        row = conn.execute(f"SELECT {', '.join(select_parts)} FROM {table_name}").fetchone()
+
+        return {
+            col: (row[2 * idx], row[2 * idx + 1])
+            for idx, col in enumerate(expressions)
+        }
+
+    def _get_daily_counts(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table_name: str,
+        expressions: Dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Get per-day row counts of all temporal columns of a cache table in a single scan.
+
+        Returns:
+            DataFrame with columns [column_name, value, cnt]
+        """
+        day_columns = ', '.join(
+            f'CAST({expr} AS DATE) AS "{col}"' for col, expr in expressions.items()
+        )
+        return conn.execute(f'''
+            SELECT column_name, day AS value, COUNT(*) AS cnt
+            FROM (
+                UNPIVOT (SELECT {day_columns} FROM {table_name})
+                ON COLUMNS(*) INTO NAME column_name VALUE day
+            )
+            GROUP BY column_name, day
+        ''').fetchdf()
+
+    def _test_temporal_columns(
         self,
         source_conn: duckdb.DuckDBPyConnection,
         dest_conn: duckdb.DuckDBPyConnection,
-        col_name_lower: str,
-        col_name_display: str
-    ) -> List[TestResult]:
-        """Run temporal tests (date range)."""
-        results = []
+        columns: List[str]
+    ) -> Dict[str, List[TestResult]]:
+        """
+        Run temporal tests (date range, optional daily distribution) for all columns.
 
-        try:
-            # Fetch date data from respective caches
-            src_data = source_conn.execute(
-                f'SELECT "{col_name_lower}" FROM cached_source WHERE "{col_name_lower}" IS NOT NULL'
-            ).fetchdf()[col_name_lower]
+        MIN/MAX are computed in DuckDB with one query per side, so no column is
+        materialized in pandas.
 
-            dst_data = dest_conn.execute(
-                f'SELECT "{col_name_lower}" FROM cached_dest WHERE "{col_name_lower}" IS NOT NULL'
-            ).fetchdf()[col_name_lower]
-            
-            # Date range test
-            range_result = self.statistical_tests.date_range_test(
-                src_data.values, dst_data.values, col_name_display
-            )
-            results.append(range_result)
-            if range_result.status != 'ERROR':
-                print(f"    Date Range: {range_result.status} "
-                      f"({range_result.details.get('source_span_days', 0)} days span)")
-            else:
-                print(f"    Date Range: {range_result.status}")
-            
+        Args:
+            source_conn: DuckDB connection holding the cached source sample
+            dest_conn: DuckDB connection holding the cached destination sample
+            columns: Temporal columns to test (display case)
+
+        Returns:
+            Dictionary mapping column name -> list of TestResult objects
+        """
+        if not columns:
+            return {}
+
+        results: Dict[str, List[TestResult]] = {col: [] for col in columns}
+
+        try:
+            src_exprs = self._get_temporal_expressions(source_conn, self.source_cache_table, columns)
+            dst_exprs = self._get_temporal_expressions(dest_conn, self.dest_cache_table, columns)
+            src_bounds = self._get_temporal_bounds(source_conn, self.source_cache_table, src_exprs)
+            dst_bounds = self._get_temporal_bounds(dest_conn, self.dest_cache_table, dst_exprs)
         except Exception as e:
-            logger.error(f"Temporal tests failed for {col_name_display}: {str(e)}")
-            print(f"    Temporal tests skipped - {str(e)}")
-        
+            logger.error(f"Temporal tests failed: {str(e)}")
+            return {
+                col: [TestResult(
+                    test_name='date_range',
+                    column=col,
+                    status='ERROR',
+                    details={'error': f"Temporal bounds query failed: {str(e)}"}
+                )]
+                for col in columns
+            }
+
+        for col in columns:
+            src_min, src_max = src_bounds.get(col.lower(), (None, None))
+            dst_min, dst_max = dst_bounds.get(col.lower(), (None, None))
+            results[col].append(self.statistical_tests.date_range_test_from_bounds(
+                src_min, src_max, dst_min, dst_max, col
+            ))
+
+        if self.temporal_daily_distribution:
+            try:
+                src_daily = self._get_daily_counts(source_conn, self.source_cache_table, src_exprs)
+                dst_daily = self._get_daily_counts(dest_conn, self.dest_cache_table, dst_exprs)
+            except Exception as e:
+                logger.error(f"Daily distribution query failed: {str(e)}")
+                return results
+
+            for col in columns:
+                src_dist = src_daily[src_daily['column_name'] == col.lower()][['value', 'cnt']]
+                dst_dist = dst_daily[dst_daily['column_name'] == col.lower()][['value', 'cnt']]
+                psi_result = self.statistical_tests.psi_test(src_dist, dst_dist, col)
+                psi_result.test_name = 'daily_distribution'
+                results[col].append(psi_result)
+
         return results
 
     def _apply_fdr_correction(self, tests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -1192,22 +2996,14 @@ class TableComparator:
             p_values = [test.get('details', {}).get('p_value', 1.0) for _, test in group_tests]
 
             # Apply FDR correction
-            # IMPORTANT: FDR only applies to tests that originally FAILED (p < alpha)
-            # We want to correct for false positives among failures, not re-evaluate passes
+            # The p-values of the whole group are adjusted together (adjusting only the
+            # failed subset never lifts one above alpha); only failed tests can change
             try:
-                # Only apply FDR to p-values from tests that originally failed
-                failed_indices = []
-                failed_pvalues = []
-
-                for i, (test_idx, test) in enumerate(group_tests):
-                    # For KS-test, T-test, Chi-square: low p-value = FAIL (reject null)
-                    # We only apply FDR to those that failed (p < alpha)
-                    if p_values[i] < alpha:
-                        failed_indices.append(i)
-                        failed_pvalues.append(p_values[i])
+                # For KS-test, T-test, Chi-square: low p-value = FAIL (reject null)
+                failed_indices = [i for i, p_value in enumerate(p_values) if p_value < alpha]
 
                 # If no tests failed, no FDR correction needed
-                if not failed_pvalues:
+                if not failed_indices:
                     logger.debug(f"Group {group_name}: No failed tests, skipping FDR")
                     # Mark all as FDR-checked but unchanged
                     for test_idx, test in group_tests:
@@ -1216,8 +3012,8 @@ class TableComparator:
                         tests[test_idx]['details']['fdr_alpha'] = alpha
                     continue
 
-                # Apply FDR correction only to failed tests
-                reject = false_discovery_control(failed_pvalues, method=method)
+                # Adjusted p-values of every test in the group
+                adjusted_pvalues = false_discovery_control(p_values, method=method)
 
             except Exception as e:
                 logger.warning(f"FDR correction failed for group {group_name}: {str(e)}")
@@ -1226,19 +3022,18 @@ class TableComparator:
             # Update test statuses based on FDR results
             # Tests that originally passed remain passed
             # Tests that originally failed may be corrected to pass
-            fdr_result_idx = 0
             for i, (test_idx, test) in enumerate(group_tests):
                 original_status = test.get('status')
+                adjusted_pvalue = float(adjusted_pvalues[i])
+                tests[test_idx]['details']['fdr_adjusted_p_value'] = adjusted_pvalue
 
                 # If this test originally failed, check FDR result
                 if i in failed_indices:
-                    should_reject = reject[fdr_result_idx]
-                    fdr_result_idx += 1
 
                     # FDR says: should we reject null hypothesis?
-                    # reject[i] = True → FAIL (distributions differ)
-                    # reject[i] = False → PASS (FDR correction says this was likely false positive)
-                    new_status = 'FAIL' if should_reject else 'PASS'
+                    # adjusted p <= alpha → FAIL (distributions differ)
+                    # adjusted p > alpha → PASS (FDR correction says this was likely false positive)
+                    new_status = 'FAIL' if adjusted_pvalue <= alpha else 'PASS'
                 else:
                     # Test originally passed (p >= alpha), keep it as PASS
                     new_status = 'PASS'
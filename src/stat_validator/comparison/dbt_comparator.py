@@ -4,15 +4,21 @@ DBT-Aware Comparator Module
 Compares SAP source tables (with DBT filters applied) against Dremio refined tables.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
+import pandas as pd
 import pyarrow as pa
 
 from ..connectors.dremio_connector import DremioConnector
 from ..connectors.hana_connector import HanaConnector
 from ..parsers.dbt_sql_parser import DBTSQLParser, ParsedDBTSQL
+from ..utils.paired_execution import run_paired
+from ..utils.temporal_filters import range_predicate, month_range
 
 
 logger = logging.getLogger(__name__)
@@ -81,7 +87,10 @@ class DBTComparator:
     def _detect_status_column(self, schema: str, table: str) -> str:
         """
         Detect which status column exists in the SAP table.
-        Tries EIM_CHANGE_STATUS first, then CHANGE_EIM_STATUS.
+        Prefers EIM_CHANGE_STATUS, then CHANGE_EIM_STATUS.
+
+        The columns are read from the table schema (catalog lookup, memoized per
+        run); probe queries are only issued if the schema cannot be resolved.
 
         Args:
             schema: SAP schema name
@@ -95,6 +104,23 @@ class DBTComparator:
         if cache_key in self._status_column_cache:
             return self._status_column_cache[cache_key]
 
+        try:
+            columns = set(self.sap_connector.get_table_schema(f'"{schema}"."{table}"').names)
+        except Exception as e:
+            logger.debug(f"Schema lookup failed for {table}, probing status columns: {str(e)}")
+            columns = None
+
+        if columns is not None:
+            for status_column in ('EIM_CHANGE_STATUS', 'CHANGE_EIM_STATUS'):
+                if status_column in columns:
+                    logger.debug(f"Table {table} uses {status_column} column")
+                    self._status_column_cache[cache_key] = status_column
+                    return status_column
+
+            logger.warning(f"Neither EIM_CHANGE_STATUS nor CHANGE_EIM_STATUS found in {table}, defaulting to EIM_CHANGE_STATUS")
+            self._status_column_cache[cache_key] = 'EIM_CHANGE_STATUS'
+            return 'EIM_CHANGE_STATUS'
+
         # Try EIM_CHANGE_STATUS first
         try:
             test_query = f'SELECT TOP 1 "EIM_CHANGE_STATUS" FROM "{schema}"."{table}"'
@@ -148,16 +174,24 @@ class DBTComparator:
         # Parse DBT SQL to get filters
         parsed_dbt = self.dbt_parser.parse_file(dremio_table)
 
-        # Build queries
-        dremio_query = self._build_dremio_query(dremio_schema, dremio_table, year, month)
-        sap_query = self._build_sap_query(sap_schema, sap_table, parsed_dbt, year, month)
+        # Build queries (each side looks up its column list, so build both at once)
+        queries = run_paired(
+            lambda: self._build_sap_query(sap_schema, sap_table, parsed_dbt, *month_range(year, month)),
+            lambda: self._build_dremio_query(dremio_schema, dremio_table, *month_range(year, month)),
+            label=f"{dremio_table} build queries"
+        )
+        sap_query, dremio_query = queries.source, queries.dest
 
         logger.debug(f"Dremio query: {dremio_query}")
         logger.debug(f"SAP query: {sap_query}")
 
-        # Execute queries
-        dremio_result = self.dremio_connector.execute_query(dremio_query)
-        sap_result = self.sap_connector.execute_query(sap_query)
+        # Execute queries concurrently
+        executed = run_paired(
+            lambda: self.sap_connector.execute_query(sap_query),
+            lambda: self.dremio_connector.execute_query(dremio_query),
+            label=f"{dremio_table} stats queries"
+        )
+        sap_result, dremio_result = executed.source, executed.dest
 
         # Parse statistics
         dremio_stats = self._parse_stats_result(dremio_result)
@@ -166,18 +200,176 @@ class DBTComparator:
         # Compare results
         return self._compare_stats(dremio_table, year, month, sap_stats, dremio_stats)
 
+    def compare_table_daily(
+        self,
+        dremio_schema: str,
+        dremio_table: str,
+        sap_schema: str,
+        sap_table: str,
+        year: int,
+        month: int
+    ) -> Tuple[ComparisonResult, Dict[str, Any]]:
+        """
+        Compare a table and get its daily breakdown from one scan per side.
+
+        Each side runs the statistics query of compare_table() grouped by day;
+        the monthly statistics are rolled up from the per-day rows, so the
+        result is the same as compare_table() gives, and get_daily_breakdown()
+        needs no second scan (on HANA, no second pass over the DBT joins).
+
+        Args:
+            dremio_schema: Dremio schema (e.g., 'sapisu')
+            dremio_table: Dremio refined table name (e.g., 'rfn_but000')
+            sap_schema: SAP schema (e.g., 'SAP_RISE_1')
+            sap_table: SAP table name (e.g., 'T_RISE_BUT000')
+            year: Year filter
+            month: Month filter
+
+        Returns:
+            Tuple of (ComparisonResult, daily breakdown as returned by
+            get_daily_breakdown(), with each day's null rate drift added)
+        """
+        return self.compare_table_months(dremio_schema, dremio_table, sap_schema, sap_table, [(year, month)])[0]
+
+    def compare_table_months(
+        self,
+        dremio_schema: str,
+        dremio_table: str,
+        sap_schema: str,
+        sap_table: str,
+        months: List[Tuple[int, int]]
+    ) -> List[Tuple[ComparisonResult, Dict[str, Any]]]:
+        """
+        Compare a table month by month, with one scan per side for all the months.
+
+        The daily statistics query of compare_table_daily() runs once over the
+        whole period; every month's statistics and daily breakdown are rolled
+        up from its days, so a backfill of many months repeats neither the
+        column and status-column lookups nor the scans.
+
+        Args:
+            dremio_schema: Dremio schema (e.g., 'sapisu')
+            dremio_table: Dremio refined table name (e.g., 'rfn_but000')
+            sap_schema: SAP schema (e.g., 'SAP_RISE_1')
+            sap_table: SAP table name (e.g., 'T_RISE_BUT000')
+            months: (year, month) tuples, oldest first; the scan covers the
+                    first through the last
+
+        Returns:
+            (ComparisonResult, daily breakdown) of each month, in the order of months
+        """
+        (first_year, first_month), (last_year, last_month) = months[0], months[-1]
+        start, end = month_range(first_year, first_month)[0], month_range(last_year, last_month)[1]
+        period = f"{first_year}-{first_month:02d}" + (f" to {last_year}-{last_month:02d}" if len(months) > 1 else "")
+        logger.info(f"Comparing {dremio_table} for {period} (by day)")
+
+        parsed_dbt = self.dbt_parser.parse_file(dremio_table)
+
+        queries = run_paired(
+            lambda: self._build_sap_query(sap_schema, sap_table, parsed_dbt, start, end, by_day=True),
+            lambda: self._build_dremio_query(dremio_schema, dremio_table, start, end, by_day=True),
+            label=f"{dremio_table} build queries"
+        )
+        sap_query, dremio_query = queries.source, queries.dest
+
+        logger.debug(f"Dremio query: {dremio_query}")
+        logger.debug(f"SAP query: {sap_query}")
+
+        executed = run_paired(
+            lambda: self.sap_connector.execute_query(sap_query),
+            lambda: self.dremio_connector.execute_query(dremio_query),
+            label=f"{dremio_table} daily stats queries"
+        )
+
+        sap_columns, sap_days = self._parse_daily_stats_result(executed.source)
+        dremio_columns, dremio_days = self._parse_daily_stats_result(executed.dest)
+
+        def in_month(days: Dict[pd.Timestamp, TableStats], year: int, month: int) -> Dict[pd.Timestamp, TableStats]:
+            return {day: stats for day, stats in days.items() if (day.year, day.month) == (year, month)}
+
+        compared = []
+        for year, month in months:
+            sap_month, dremio_month = in_month(sap_days, year, month), in_month(dremio_days, year, month)
+            result = self._compare_stats(
+                dremio_table, year, month,
+                self._roll_up_days(sap_month, sap_columns),
+                self._roll_up_days(dremio_month, dremio_columns)
+            )
+            compared.append((result, {
+                'table_name': dremio_table,
+                'year': year,
+                'month': month,
+                'daily_data': self._merge_daily_stats(sap_month, dremio_month)
+            }))
+        return compared
+
+    async def compare_table_async(
+        self,
+        dremio_schema: str,
+        dremio_table: str,
+        sap_schema: str,
+        sap_table: str,
+        year: int,
+        month: int,
+        executor: Optional[Executor] = None
+    ) -> ComparisonResult:
+        """
+        Asyncio variant of compare_table().
+
+        Query building and execution run in an executor, with the SAP and Dremio
+        sides awaited together, so the event loop is never blocked and the
+        comparison can be cancelled between steps.
+
+        Args:
+            dremio_schema: Dremio schema (e.g., 'sapisu')
+            dremio_table: Dremio refined table name (e.g., 'rfn_but000')
+            sap_schema: SAP schema (e.g., 'SAP_RISE_1')
+            sap_table: SAP table name (e.g., 'T_RISE_BUT000')
+            year: Year filter
+            month: Month filter
+            executor: Executor for blocking calls (default: the loop's default executor)
+
+        Returns:
+            ComparisonResult object
+        """
+        loop = asyncio.get_running_loop()
+
+        def run(fn, *args) -> asyncio.Future:
+            return loop.run_in_executor(executor, functools.partial(fn, *args))
+
+        logger.info(f"Comparing {dremio_table} for {year}-{month:02d} (async)")
+
+        parsed_dbt = await run(self.dbt_parser.parse_file, dremio_table)
+
+        sap_query, dremio_query = await asyncio.gather(
+            run(self._build_sap_query, sap_schema, sap_table, parsed_dbt, *month_range(year, month)),
+            run(self._build_dremio_query, dremio_schema, dremio_table, *month_range(year, month))
+        )
+
+        logger.debug(f"Dremio query: {dremio_query}")
+        logger.debug(f"SAP query: {sap_query}")
+
+        sap_result, dremio_result = await asyncio.gather(
+            run(self.sap_connector.execute_query, sap_query),
+            run(self.dremio_connector.execute_query, dremio_query)
+        )
+
+        dremio_stats = self._parse_stats_result(dremio_result)
+        sap_stats = self._parse_stats_result(sap_result)
+
+        return self._compare_stats(dremio_table, year, month, sap_stats, dremio_stats)
+
     def _build_dremio_query(
         self,
         schema: str,
         table: str,
-        year: int,
-        month: int
+        start: datetime,
+        end: datetime,
+        by_day: bool = False
     ) -> str:
-        """Build the statistics query for Dremio refined table."""
-        # First, get column list
-        column_query = f'SELECT * FROM ulysses.{schema}."{table}" LIMIT 1'
-        sample = self.dremio_connector.execute_query(column_query)
-        columns = sample.schema.names
+        """Build the statistics query for Dremio refined table over [start, end) (one row per day if by_day)."""
+        # First, get column list (metadata-only lookup, memoized per run)
+        columns = self.dremio_connector.get_table_schema(f'ulysses.{schema}."{table}"').names
 
         # Exclude system columns from null analysis
         exclude_columns = {'sync_ts', 'system_ts', 'ulysses_ts'}
@@ -194,15 +386,18 @@ class DBTComparator:
 
         query = f"""
         SELECT
+            {'CAST(system_ts AS DATE) AS "date",' if by_day else ''}
             COUNT(*) AS row_count,
             MIN(system_ts) AS min_refresh_dt,
             MAX(system_ts) AS max_refresh_dt,
             {', '.join(null_counts)}
         FROM ulysses.{schema}."{table}"
-        WHERE EXTRACT(YEAR FROM system_ts) = {year}
-          AND EXTRACT(MONTH FROM system_ts) = {month}
+        WHERE {range_predicate('system_ts', start, end)}
         """
 
+        if by_day:
+            query += "GROUP BY CAST(system_ts AS DATE)\n"
+
         return query
 
     def _build_sap_query(
@@ -210,20 +405,19 @@ class DBTComparator:
         schema: str,
         table: str,
         parsed_dbt: ParsedDBTSQL,
-        year: int,
-        month: int
+        start: datetime,
+        end: datetime,
+        by_day: bool = False
     ) -> str:
-        """Build the statistics query for SAP source table with DBT filters."""
+        """Build the statistics query for SAP source table with DBT filters over [start, end) (one row per day if by_day)."""
         # Detect which status column exists in this table
         status_column = self._detect_status_column(schema, table)
 
         # Get filter components (pass the detected status column)
         filters = self.dbt_parser.build_sap_query_filters(parsed_dbt, status_column=status_column)
 
-        # First, get column list from main table
-        column_query = f'SELECT TOP 1 * FROM "{schema}"."{table}"'
-        sample = self.sap_connector.execute_query(column_query)
-        columns = sample.schema.names
+        # First, get column list from main table (catalog lookup, memoized per run)
+        columns = self.sap_connector.get_table_schema(f'"{schema}"."{table}"').names
 
         # Exclude system columns from null analysis (exclude both possible status columns)
         exclude_columns = {'SYNC_TS', 'SYSTEM_TS', 'ULYSSES_TS', 'REFRESH_DT', 'EIM_CHANGE_STATUS', 'CHANGE_EIM_STATUS', 'D_EXTRACT'}
@@ -244,6 +438,7 @@ class DBTComparator:
         # Build the query
         query = f"""
         SELECT
+            {f'TO_DATE({col_prefix}REFRESH_DT) AS "date",' if by_day else ''}
             COUNT(*) AS row_count,
             MIN({col_prefix}REFRESH_DT) AS min_refresh_dt,
             MAX({col_prefix}REFRESH_DT) AS max_refresh_dt,
@@ -258,10 +453,12 @@ class DBTComparator:
         # Add WHERE clause (includes EIM_CHANGE_STATUS filter + DBT filters + date filter)
         query += f"""
         WHERE {filters['where_clause']}
-          AND YEAR({col_prefix}REFRESH_DT) = {year}
-          AND MONTH({col_prefix}REFRESH_DT) = {month}
+          AND {range_predicate(f'{col_prefix}REFRESH_DT', start, end)}
         """
 
+        if by_day:
+            query += f"GROUP BY TO_DATE({col_prefix}REFRESH_DT)\n"
+
         return query
 
     def _parse_stats_result(self, result: pa.Table) -> TableStats:
@@ -274,8 +471,10 @@ class DBTComparator:
                 column_stats=[]
             )
 
-        row = result.to_pydict()
+        return self._parse_stats_row(result.slice(0, 1).to_pylist()[0])
 
+    def _parse_stats_row(self, row: Dict[str, Any]) -> TableStats:
+        """Parse one row of a statistics query (the whole month, or one day)."""
         # Create case-insensitive column name mapping
         col_mapping = {k.lower(): k for k in row.keys()}
 
@@ -284,12 +483,12 @@ class DBTComparator:
         min_key = col_mapping.get('min_refresh_dt', 'min_refresh_dt')
         max_key = col_mapping.get('max_refresh_dt', 'max_refresh_dt')
 
-        row_count = int(row[row_count_key][0]) if row[row_count_key][0] is not None else 0
+        row_count = int(row[row_count_key]) if row[row_count_key] is not None else 0
 
         # Parse dates to datetime objects for proper comparison
         min_refresh_dt = None
-        if row[min_key][0] is not None:
-            min_val = row[min_key][0]
+        if row[min_key] is not None:
+            min_val = row[min_key]
             if isinstance(min_val, datetime):
                 min_refresh_dt = min_val
             else:
@@ -300,8 +499,8 @@ class DBTComparator:
                     min_refresh_dt = None
 
         max_refresh_dt = None
-        if row[max_key][0] is not None:
-            max_val = row[max_key][0]
+        if row[max_key] is not None:
+            max_val = row[max_key]
             if isinstance(max_val, datetime):
                 max_refresh_dt = max_val
             else:
@@ -316,7 +515,7 @@ class DBTComparator:
         for col_name in row.keys():
             if col_name.lower().startswith('null_'):
                 actual_col_name = col_name[5:].lower()  # Remove 'null_' prefix and normalize to lowercase
-                null_count = int(row[col_name][0]) if row[col_name][0] is not None else 0
+                null_count = int(row[col_name]) if row[col_name] is not None else 0
                 null_pct = (null_count / row_count * 100) if row_count > 0 else 0.0
 
                 column_stats.append(ColumnStats(
@@ -333,6 +532,85 @@ class DBTComparator:
             column_stats=column_stats
         )
 
+    def _parse_daily_stats_result(self, result: pa.Table) -> Tuple[List[str], Dict[pd.Timestamp, TableStats]]:
+        """
+        Parse the result of a statistics query grouped by day.
+
+        Returns:
+            Tuple of (columns with null counts, statistics of each day by date)
+        """
+        days = {}
+        for row in result.to_pylist():
+            date_key = next(k for k in row.keys() if k.lower() == 'date')
+            days[pd.Timestamp(row[date_key])] = self._parse_stats_row(row)
+
+        # Columns come from the query, so a period without rows still lists them (with no nulls)
+        null_columns = [name[5:].lower() for name in result.column_names if name.lower().startswith('null_')]
+        return null_columns, days
+
+    def _roll_up_days(self, days: Dict[pd.Timestamp, TableStats], null_columns: List[str]) -> TableStats:
+        """Roll per-day statistics up into those of the whole period (as _parse_stats_result() gives them)."""
+        row_count = sum(day.row_count for day in days.values())
+        null_counts = dict.fromkeys(null_columns, 0)
+        for day in days.values():
+            for col in day.column_stats:
+                null_counts[col.column_name] += col.null_count
+
+        min_dts = [day.min_refresh_dt for day in days.values() if day.min_refresh_dt]
+        max_dts = [day.max_refresh_dt for day in days.values() if day.max_refresh_dt]
+
+        return TableStats(
+            row_count=row_count,
+            min_refresh_dt=min(min_dts) if min_dts else None,
+            max_refresh_dt=max(max_dts) if max_dts else None,
+            column_stats=[
+                ColumnStats(
+                    column_name=col,
+                    null_count=null_count,
+                    total_count=row_count,
+                    null_percentage=(null_count / row_count * 100) if row_count > 0 else 0.0
+                )
+                for col, null_count in null_counts.items()
+            ]
+        )
+
+    def _merge_daily_stats(
+        self,
+        sap_days: Dict[pd.Timestamp, TableStats],
+        dremio_days: Dict[pd.Timestamp, TableStats]
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge the per-day statistics of both sides into daily breakdown rows (latest day first).
+
+        Each row has the 'date', 'sap_count' and 'dremio_count' of the day and
+        its 'null_drift': the columns whose null percentage differs between the
+        sides by more than the 1% the monthly comparison tolerates, as
+        column -> {sap_null_pct, dremio_null_pct} (only for days both sides have).
+        """
+        daily_data = []
+        for day in sorted(set(sap_days) | set(dremio_days), reverse=True):
+            sap = sap_days.get(day)
+            dremio = dremio_days.get(day)
+
+            null_drift = {}
+            if sap and dremio:
+                dremio_nulls = {col.column_name: col.null_percentage for col in dremio.column_stats}
+                for col in sap.column_stats:
+                    dremio_pct = dremio_nulls.get(col.column_name)
+                    if dremio_pct is not None and abs(col.null_percentage - dremio_pct) > 1.0:
+                        null_drift[col.column_name] = {
+                            'sap_null_pct': round(col.null_percentage, 2),
+                            'dremio_null_pct': round(dremio_pct, 2)
+                        }
+
+            daily_data.append({
+                'date': day,
+                'sap_count': sap.row_count if sap else 0,
+                'dremio_count': dremio.row_count if dremio else 0,
+                'null_drift': null_drift
+            })
+        return daily_data
+
     def _compare_stats(
         self,
         table_name: str,
@@ -454,8 +732,6 @@ class DBTComparator:
         Returns:
             Dictionary with 'daily_data' containing merged daily counts
         """
-        import pandas as pd
-
         # Parse DBT SQL to get filters for SAP
         parsed_dbt = self.dbt_parser.parse_file(dremio_table)
 
@@ -466,20 +742,23 @@ class DBTComparator:
         logger.debug(f"Dremio daily query: {dremio_daily_query}")
         logger.debug(f"SAP daily query: {sap_daily_query}")
 
-        # Execute queries
-        try:
-            dremio_result = self.dremio_connector.execute_query(dremio_daily_query)
-            dremio_df = dremio_result.to_pandas()
-        except Exception as e:
-            logger.error(f"Error querying Dremio daily breakdown: {e}")
-            dremio_df = pd.DataFrame(columns=['date', 'dremio_count'])
+        # Execute queries concurrently
+        def fetch_dremio():
+            try:
+                return self.dremio_connector.execute_query(dremio_daily_query).to_pandas()
+            except Exception as e:
+                logger.error(f"Error querying Dremio daily breakdown: {e}")
+                return pd.DataFrame(columns=['date', 'dremio_count'])
 
-        try:
-            sap_result = self.sap_connector.execute_query(sap_daily_query)
-            sap_df = sap_result.to_pandas()
-        except Exception as e:
-            logger.error(f"Error querying SAP daily breakdown: {e}")
-            sap_df = pd.DataFrame(columns=['date', 'sap_count'])
+        def fetch_sap():
+            try:
+                return self.sap_connector.execute_query(sap_daily_query).to_pandas()
+            except Exception as e:
+                logger.error(f"Error querying SAP daily breakdown: {e}")
+                return pd.DataFrame(columns=['date', 'sap_count'])
+
+        daily = run_paired(fetch_sap, fetch_dremio, label=f"{dremio_table} daily queries")
+        sap_df, dremio_df = daily.source, daily.dest
 
         # Merge the dataframes
         if not dremio_df.empty and not sap_df.empty:
@@ -531,8 +810,7 @@ class DBTComparator:
             CAST(system_ts AS DATE) as "date",
             COUNT(*) as row_count
         FROM ulysses.{schema}."{table}"
-        WHERE EXTRACT(YEAR FROM system_ts) = {year}
-          AND EXTRACT(MONTH FROM system_ts) = {month}
+        WHERE {range_predicate('system_ts', *month_range(year, month))}
         GROUP BY CAST(system_ts AS DATE)
         ORDER BY "date" DESC
         """
@@ -572,8 +850,7 @@ class DBTComparator:
         # Add WHERE clause (includes EIM_CHANGE_STATUS filter + DBT filters + date filter)
         query += f"""
         WHERE {filters['where_clause']}
-          AND YEAR({col_prefix}REFRESH_DT) = {year}
-          AND MONTH({col_prefix}REFRESH_DT) = {month}
+          AND {range_predicate(f'{col_prefix}REFRESH_DT', *month_range(year, month))}
         GROUP BY TO_DATE({col_prefix}REFRESH_DT)
         ORDER BY date DESC
         """
@@ -610,3 +887,32 @@ class DBTComparator:
             'null_comparison': result.null_comparison,
             'issues': result.issues
         }
+
+    def from_dict(self, data: Dict[str, Any]) -> ComparisonResult:
+        """Rebuild a ComparisonResult from to_dict() output (e.g., a checkpointed result)."""
+        # Helper function to convert ISO string back to datetime
+        def str_to_dt(value):
+            return datetime.fromisoformat(value) if value else None
+
+        def table_stats(stats: Dict[str, Any]) -> TableStats:
+            return TableStats(
+                row_count=stats['row_count'],
+                min_refresh_dt=str_to_dt(stats['min_refresh_dt']),
+                max_refresh_dt=str_to_dt(stats['max_refresh_dt']),
+                column_stats=[ColumnStats(**col) for col in stats['column_null_stats']]
+            )
+
+        return ComparisonResult(
+            table_name=data['table_name'],
+            year=data['year'],
+            month=data['month'],
+            sap_stats=table_stats(data['sap_stats']),
+            dremio_stats=table_stats(data['dremio_stats']),
+            row_count_match=data['row_count_match'],
+            row_count_diff=data['row_count_diff'],
+            row_count_diff_pct=data['row_count_diff_pct'],
+            refresh_dt_match=data['refresh_dt_match'],
+            null_comparison=data['null_comparison'],
+            overall_status=data['overall_status'],
+            issues=data['issues']
+        )
@@ -0,0 +1,246 @@
+"""Process-pool backend for CPU-heavy column tests over shared-memory samples."""
+
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Any, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.logger import get_logger
+from .statistical_tests import StatisticalTests, TestResult
+
+
+logger = get_logger('process_backend')
+
+
+@dataclass(frozen=True)
+class SharedColumnHandle:
+    """Reference to a 1-D column stored in a shared memory block."""
+    name: str
+    length: int
+    dtype: str
+
+
+class SharedColumnStore:
+    """
+    Owns the shared memory blocks holding cached sample columns.
+
+    Each column is copied into shared memory once; workers attach to the block by
+    name, so the sample data is never pickled per task. Blocks are released when
+    the store is closed.
+    """
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._blocks: List[shared_memory.SharedMemory] = []
+
+    def put(self, values: np.ndarray) -> SharedColumnHandle:
+        """
+        Copy a 1-D array into a new shared memory block.
+
+        Args:
+            values: Column values (numeric or datetime64 dtype)
+
+        Returns:
+            Handle that workers use to attach to the block
+        """
+        values = np.ascontiguousarray(values)
+        # Zero-sized blocks are not allowed, an empty column still gets one byte
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._blocks.append(block)
+
+        view = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        view[:] = values
+
+        return SharedColumnHandle(name=block.name, length=len(values), dtype=values.dtype.str)
+
+    def close(self):
+        """Release and unlink all shared memory blocks."""
+        for block in self._blocks:
+            try:
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+
+    def __enter__(self) -> 'SharedColumnStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _attach(
+    handle: SharedColumnHandle,
+    untrack: bool
+) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach to a shared column from a worker process."""
+    block = shared_memory.SharedMemory(name=handle.name)
+
+    # Before Python 3.13 attaching registers the block with the resource tracker.
+    # A spawned worker has its own tracker, which would unlink the block on exit;
+    # forked workers share the parent's tracker and must leave it alone.
+    if untrack and sys.version_info < (3, 13):
+        try:
+            resource_tracker.unregister(block._name, 'shared_memory')
+        except Exception:
+            pass
+
+    values = np.ndarray((handle.length,), dtype=np.dtype(handle.dtype), buffer=block.buf)
+    return block, values
+
+
+def _column_tests(
+    tests: StatisticalTests,
+    kind: str,
+    column_name: str,
+    src_data: np.ndarray,
+    dst_data: np.ndarray
+) -> List[TestResult]:
+    """Run the tests of one column kind ('numerical' or 'temporal')."""
+    if kind == 'numerical':
+        return [
+            tests.ks_test(src_data, dst_data, column_name),
+            tests.t_test(src_data, dst_data, column_name),
+        ]
+    return [tests.date_range_test(src_data, dst_data, column_name)]
+
+
+def _run_column_tests(
+    kind: str,
+    column_name: str,
+    src_handle: SharedColumnHandle,
+    dst_handle: SharedColumnHandle,
+    test_params: Dict[str, Any],
+    untrack: bool
+) -> List[Dict[str, Any]]:
+    """
+    Worker entry point: run the tests for one column and return result dictionaries.
+
+    Only TestResult dictionaries cross the process boundary on the way back.
+    """
+    src_block, src_data = _attach(src_handle, untrack)
+    dst_block, dst_data = _attach(dst_handle, untrack)
+
+    try:
+        tests = StatisticalTests(**test_params)
+        return [result.to_dict() for result in _column_tests(tests, kind, column_name, src_data, dst_data)]
+    finally:
+        # Drop array views before closing the underlying buffers
+        del src_data, dst_data
+        src_block.close()
+        dst_block.close()
+
+
+class ProcessTestBackend:
+    """
+    Runs numerical and temporal column tests on a process pool.
+
+    Sample columns are fetched once in the parent, placed in shared memory and
+    tested by workers in parallel, which avoids the GIL for scipy-heavy work.
+    """
+
+    def __init__(self, test_params: Dict[str, Any], max_workers: Optional[int] = None):
+        """
+        Initialize the backend.
+
+        Args:
+            test_params: Keyword arguments used to build StatisticalTests in each worker
+            max_workers: Number of worker processes (default: os.cpu_count())
+        """
+        self.test_params = test_params
+        self.max_workers = max_workers
+
+    @staticmethod
+    def to_shared_array(kind: str, values: Any) -> Optional[np.ndarray]:
+        """
+        Convert fetched column values into a fixed-width array for shared memory.
+
+        Args:
+            kind: 'numerical' or 'temporal'
+            values: Column values fetched from the DuckDB cache
+
+        Returns:
+            float64 or datetime64[ns] array, or None if the column cannot be
+            represented with a fixed width (caller should test it in-process)
+        """
+        try:
+            if kind == 'numerical':
+                return np.asarray(values, dtype=np.float64)
+            return pd.to_datetime(pd.Series(values)).to_numpy(dtype='datetime64[ns]')
+        except Exception as e:
+            logger.debug(f"Column not eligible for shared memory ({kind}): {str(e)}")
+            return None
+
+    def run(
+        self,
+        jobs: List[Tuple[str, str, np.ndarray, np.ndarray]]
+    ) -> Dict[str, List[TestResult]]:
+        """
+        Run column tests in worker processes.
+
+        Args:
+            jobs: List of (kind, column_name, source_values, dest_values)
+
+        Returns:
+            Dictionary mapping column name -> list of TestResult objects
+        """
+        results: Dict[str, List[TestResult]] = {}
+        if not jobs:
+            return results
+
+        logger.info(f"Running {len(jobs)} column test job(s) on process pool (workers: {self.max_workers or 'auto'})")
+
+        context = multiprocessing.get_context()
+        untrack = context.get_start_method() != 'fork'
+
+        with SharedColumnStore() as store, \
+                ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as executor:
+            futures = {}
+            for job in jobs:
+                kind, column_name, src_values, dst_values = job
+                src_handle = store.put(src_values)
+                dst_handle = store.put(dst_values)
+                future = executor.submit(
+                    _run_column_tests, kind, column_name, src_handle, dst_handle,
+                    self.test_params, untrack
+                )
+                futures[future] = job
+
+            for future, (kind, column_name, src_values, dst_values) in futures.items():
+                try:
+                    results[column_name] = [TestResult.from_dict(d) for d in future.result()]
+                except Exception as e:
+                    logger.error(f"Process-pool {kind} tests failed for {column_name}, running them in-process: {str(e)}")
+                    results[column_name] = self._run_in_process(kind, column_name, src_values, dst_values)
+
+        return results
+
+    def _run_in_process(
+        self,
+        kind: str,
+        column_name: str,
+        src_values: np.ndarray,
+        dst_values: np.ndarray
+    ) -> List[TestResult]:
+        """
+        Run a column's tests in the calling process, after its worker failed.
+
+        Returns:
+            The tests' results, or ERROR results if they fail here too, so the
+            column's tests never silently drop out of the report
+        """
+        try:
+            return _column_tests(StatisticalTests(**self.test_params), kind, column_name, src_values, dst_values)
+        except Exception as e:
+            logger.error(f"{kind.capitalize()} tests failed for {column_name}: {str(e)}")
+            test_names = ['ks_test', 't_test'] if kind == 'numerical' else ['date_range']
+            return [
+                TestResult(test_name=test_name, column=column_name, status='ERROR', details={'error': str(e)})
+                for test_name in test_names
+            ]
@@ -26,6 +26,16 @@ class TestResult:
             result['column'] = self.column
         return result
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TestResult':
+        """Rebuild a TestResult from the output of to_dict()."""
+        return cls(
+            test_name=data['test_name'],
+            column=data.get('column'),
+            status=data['status'],
+            details=data.get('details', {})
+        )
+
 
 class StatisticalTests:
     """Collection of statistical tests for data comparison."""
@@ -313,16 +323,62 @@ class StatisticalTests:
                     details={'reason': 'No valid dates in one or both columns'}
                 )
             
-            src_min, src_max = src_dates.min(), src_dates.max()
-            dst_min, dst_max = dst_dates.min(), dst_dates.max()
-            
+            return self.date_range_test_from_bounds(
+                src_dates.min(), src_dates.max(),
+                dst_dates.min(), dst_dates.max(),
+                column_name
+            )
+        except Exception as e:
+            return TestResult(
+                test_name='date_range',
+                column=column_name,
+                status='ERROR',
+                details={'error': str(e)}
+            )
+
+    def date_range_test_from_bounds(
+        self,
+        source_min: Any,
+        source_max: Any,
+        dest_min: Any,
+        dest_max: Any,
+        column_name: str
+    ) -> TestResult:
+        """
+        Date range test from precomputed min and max values.
+
+        Lets the caller compute the bounds in the database instead of
+        materializing the column.
+
+        Args:
+            source_min: Earliest source date (None if no valid dates)
+            source_max: Latest source date (None if no valid dates)
+            dest_min: Earliest destination date (None if no valid dates)
+            dest_max: Latest destination date (None if no valid dates)
+            column_name: Column name for reporting
+
+        Returns:
+            TestResult object
+        """
+        try:
+            bounds = [source_min, source_max, dest_min, dest_max]
+            if any(b is None or pd.isna(b) for b in bounds):
+                return TestResult(
+                    test_name='date_range',
+                    column=column_name,
+                    status='SKIP',
+                    details={'reason': 'No valid dates in one or both columns'}
+                )
+
+            src_min, src_max, dst_min, dst_max = (pd.Timestamp(b) for b in bounds)
+
             # Check if ranges are similar (within 1 day tolerance)
             one_day = pd.Timedelta(days=1)
             min_match = abs(src_min - dst_min) <= one_day
             max_match = abs(src_max - dst_max) <= one_day
-            
+
             status = 'PASS' if min_match and max_match else 'FAIL'
-            
+
             return TestResult(
                 test_name='date_range',
                 column=column_name,
@@ -344,6 +400,7 @@ class StatisticalTests:
                 status='ERROR',
                 details={'error': str(e)}
             )
+
     def chi_square_test(
         self,
         source_dist: pd.DataFrame,
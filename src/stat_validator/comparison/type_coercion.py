@@ -0,0 +1,203 @@
+"""Coercion of string-encoded SAP dates and numbers into typed sample columns."""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+
+from ..connectors.base_connector import BaseConnector
+from ..profiling.column_classifier import ColumnClassifier, ColumnType
+from ..utils.logger import get_logger
+
+
+logger = get_logger('type_coercion')
+
+
+@dataclass(frozen=True)
+class ColumnCoercion:
+    """Typed rewrite for one string column."""
+    kind: str  # 'temporal' or 'numerical'
+    date_format: Optional[str] = None  # SQL date format for temporal columns
+
+
+class TypeCoercer:
+    """
+    Detects string columns that hold dates or numbers and rewrites them to typed SQL.
+
+    SAP stores many dates as 'YYYYMMDD' strings and amounts as NVARCHAR. A small
+    probe of the source table is classified with ColumnClassifier, and matching
+    columns are wrapped in TO_DATE / TO_DOUBLE (HANA) or TO_DATE / CAST AS DOUBLE
+    (Dremio) in the pushed-down sample query, so they get temporal and numerical
+    tests instead of categorical ones.
+    """
+
+    # ColumnClassifier format name -> (strptime format, SQL format)
+    DATE_FORMATS = {
+        'YYYYMMDD': ('%Y%m%d', 'YYYYMMDD'),
+        'YYYY-MM-DD': ('%Y-%m-%d', 'YYYY-MM-DD'),
+    }
+
+    # Bumped when classification changes, so cataloged coercions are probed again
+    RULES_VERSION = 2
+
+    # Zero-padded integers (e.g. '0000012345'): SAP keys such as PARTNER or OPBEL
+    LEADING_ZEROS = re.compile(r'^[+-]?0\d')
+    INTEGER = re.compile(r'^\d+$')
+
+    # Integers that all have this many digits or more, and the same number of
+    # digits, are identifiers (document and partner numbers), not amounts
+    KEY_MIN_DIGITS = 6
+
+    def __init__(self, probe_rows: int = 200):
+        """
+        Initialize the coercer.
+
+        Args:
+            probe_rows: Number of source rows read to classify string columns
+        """
+        self.probe_rows = probe_rows
+
+    @staticmethod
+    def is_string_type(arrow_type: pa.DataType) -> bool:
+        """Check if a PyArrow type is a string type (the only types coerced)."""
+        return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+    def probe(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        column_list: str,
+        columns: List[str],
+        where_clause: Optional[str] = None
+    ) -> Dict[str, ColumnCoercion]:
+        """
+        Read a few rows of the given string columns and decide which to coerce.
+
+        Args:
+            connector: Source connector
+            table_name: Source table name
+            column_list: SELECT list for the columns (with null-equivalent handling)
+            columns: Column names in the same order as column_list
+            where_clause: Optional WHERE clause for the source table
+
+        Returns:
+            Dictionary mapping uppercase column name -> ColumnCoercion
+        """
+        if not columns:
+            return {}
+
+        base_where = f"WHERE {where_clause}" if where_clause else ""
+        query = f"SELECT {column_list} FROM {table_name} {base_where} LIMIT {self.probe_rows}"
+
+        probe = connector.execute_query(" ".join(query.split()))
+
+        coercions = {}
+        for idx, col in enumerate(columns):
+            values = probe.column(idx).to_pylist()
+            coercion = self.classify_values(col, values)
+            if coercion:
+                coercions[col.upper()] = coercion
+
+        if coercions:
+            logger.info(f"Coercing {len(coercions)} string columns: "
+                        f"{ {col: c.kind for col, c in coercions.items()} }")
+
+        return coercions
+
+    def classify_values(self, column_name: str, values: List) -> Optional[ColumnCoercion]:
+        """
+        Decide whether probed string values can be coerced.
+
+        Every non-empty value must parse, since a single bad value makes the
+        typed query fail on the server. Numeric strings that look like keys
+        (see looks_like_key()) are left as strings.
+
+        Args:
+            column_name: Column name (for classification)
+            values: Probed values
+
+        Returns:
+            ColumnCoercion, or None to leave the column as a string
+        """
+        non_null = [str(v).strip() for v in values if v is not None and str(v).strip() != '']
+        if not non_null:
+            return None
+
+        col_type, date_format = ColumnClassifier.classify_column(column_name, values)
+
+        if col_type == ColumnType.TEMPORAL and date_format in self.DATE_FORMATS:
+            strptime_format, sql_format = self.DATE_FORMATS[date_format]
+            try:
+                for value in non_null:
+                    datetime.strptime(value, strptime_format)
+                return ColumnCoercion(kind='temporal', date_format=sql_format)
+            except ValueError:
+                # e.g. 8-digit document numbers, rejected as keys below
+                pass
+
+        if all(ColumnClassifier.is_numeric(v) for v in non_null):
+            if self.looks_like_key(non_null):
+                logger.debug(f"Not coercing {column_name}: values look like keys")
+                return None
+            return ColumnCoercion(kind='numerical')
+
+        return None
+
+    @classmethod
+    def looks_like_key(cls, values: List[str]) -> bool:
+        """
+        Check if numeric strings are identifiers rather than quantities.
+
+        Zero-padded values, or integers of one fixed width of KEY_MIN_DIGITS
+        digits or more, are keys: casting them would drop the padding and run
+        distribution tests on identifiers.
+
+        Args:
+            values: Non-empty, stripped string values
+
+        Returns:
+            True if the column should stay a string
+        """
+        if any(cls.LEADING_ZEROS.match(value) for value in values):
+            return True
+
+        if all(cls.INTEGER.match(value) for value in values):
+            widths = {len(value) for value in values}
+            return len(widths) == 1 and widths.pop() >= cls.KEY_MIN_DIGITS
+
+        return False
+
+    @staticmethod
+    def coerce_expression(
+        expression: str,
+        column: str,
+        coercion: ColumnCoercion,
+        is_hana: bool
+    ) -> str:
+        """
+        Wrap a SELECT-list expression in the typed conversion for its column.
+
+        Args:
+            expression: Column expression, optionally ending in 'AS "column"'
+            column: Column name (unquoted)
+            coercion: Coercion to apply
+            is_hana: True for HANA SQL, False for Dremio SQL
+
+        Returns:
+            Typed expression aliased to the original column name
+        """
+        quoted = f'"{column}"'
+        alias_suffix = f" AS {quoted}"
+        if expression.endswith(alias_suffix):
+            expression = expression[:-len(alias_suffix)]
+
+        if coercion.kind == 'temporal':
+            typed = f"TO_DATE({expression}, '{coercion.date_format}')"
+        elif is_hana:
+            typed = f"TO_DOUBLE({expression})"
+        else:
+            typed = f"CAST({expression} AS DOUBLE)"
+
+        return f"{typed} AS {quoted}"
@@ -3,5 +3,6 @@
 from .base_connector import BaseConnector
 from .dremio_connector import DremioConnector
 from .hana_connector import HanaConnector
+from .sample_connector import SampleConnector
 
-__all__ = ['BaseConnector', 'DremioConnector', 'HanaConnector']
\ No newline at end of file
+__all__ = ['BaseConnector', 'DremioConnector', 'HanaConnector', 'SampleConnector']
\ No newline at end of file
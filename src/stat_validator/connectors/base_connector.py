@@ -1,10 +1,13 @@
 """Base connector interface for data sources."""
 
+import contextlib
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, ContextManager, Dict, Optional
 import pyarrow as pa
 import pandas as pd
 import duckdb
+from ..utils.admission import SourceLimiter
+from ..utils.scan_share import ScanShare
 from ..utils.logger import get_logger
 
 logger = get_logger('base_connector')
@@ -17,6 +20,20 @@ class BaseConnector(ABC):
         """Initialize base connector."""
         self._duckdb_conn = None
 
+        # Optional cap on concurrent queries against the source (see SourceLimiter)
+        self.limiter: Optional[SourceLimiter] = None
+
+        # Optional results of queries shared with other comparisons (see ScanShare)
+        self.scan_share: Optional[ScanShare] = None
+
+    def _source_slot(self) -> ContextManager[None]:
+        """Slot for one query against the source (no-op without a limiter)."""
+        return self.limiter.slot() if self.limiter else contextlib.nullcontext()
+
+    def _shared_scan(self, query: str, run: Callable[[], pa.Table]) -> pa.Table:
+        """Run a query, or reuse its result if another comparison already ran it (no-op without a scan share)."""
+        return self.scan_share.fetch(query, run) if self.scan_share else run()
+
     @abstractmethod
     def execute_query(self, query: str) -> pa.Table:
         """
@@ -56,6 +73,30 @@ class BaseConnector(ABC):
         """
         pass
 
+    def estimate_row_count(self, table_name: str) -> Optional[int]:
+        """
+        Estimate the row count of a table from metadata, without scanning it.
+
+        Args:
+            table_name: Fully qualified table name
+
+        Returns:
+            Estimated number of rows, or None if the source has no such metadata
+        """
+        return None
+
+    def estimate_distinct_counts(self, table_name: str) -> Dict[str, int]:
+        """
+        Estimate per-column distinct counts of a table from metadata.
+
+        Args:
+            table_name: Fully qualified table name
+
+        Returns:
+            Dictionary mapping column name -> estimated distinct count (empty if unavailable)
+        """
+        return {}
+
     @abstractmethod
     def get_cache_connection(self) -> duckdb.DuckDBPyConnection:
         """
@@ -188,7 +229,7 @@ class BaseConnector(ABC):
 
             logger.info(f"Successfully cached {len(df)} rows, {len(df.columns)} columns to {table_name}")
 
-    def cache_query(self, query: str, table_name: str = "cached_data"):
+    def cache_query(self, query: str, table_name: str = "cached_data") -> Dict[str, int]:
         """
         Cache query result to DuckDB - shared implementation.
 
@@ -198,6 +239,9 @@ class BaseConnector(ABC):
         Args:
             query: SQL query to execute
             table_name: Target table name in DuckDB cache
+
+        Returns:
+            Dictionary with the 'rows' and Arrow 'bytes' fetched from the source
         """
         try:
             # Execute query (connector-specific)
@@ -212,6 +256,8 @@ class BaseConnector(ABC):
             # Cache to DuckDB (shared logic)
             self._cache_to_duckdb(df, table_name)
 
+            return {'rows': result.num_rows, 'bytes': result.nbytes}
+
         except Exception as e:
             logger.error(f"Failed to cache query: {str(e)}")
             raise
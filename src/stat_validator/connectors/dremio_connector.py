@@ -1,6 +1,7 @@
 """Dremio connector with DuckDB caching for statistical validation."""
 
 import os
+import re
 import certifi
 import duckdb
 from pyarrow import flight
@@ -9,11 +10,32 @@ import polars as pl
 import pandas as pd
 from typing import Optional, List, Tuple, Dict, Any
 from .base_connector import BaseConnector
+from .schema_cache import SchemaCache
 from ..utils.logger import get_logger
 from ..utils.config_loader import ConfigLoader
 
 logger = get_logger('dremio_connector')
 
+# INFORMATION_SCHEMA data type -> PyArrow type, matching what Flight returns
+# (DECIMAL handled separately; tables with other types are resolved via Flight)
+DREMIO_TYPE_MAP = {
+    'BOOLEAN': pa.bool_(),
+    'INTEGER': pa.int32(),
+    'BIGINT': pa.int64(),
+    'FLOAT': pa.float32(),
+    'DOUBLE': pa.float64(),
+    'CHARACTER VARYING': pa.string(),
+    'VARCHAR': pa.string(),
+    'BINARY VARYING': pa.binary(),
+    'VARBINARY': pa.binary(),
+    'DATE': pa.date64(),
+    'TIME': pa.time32('ms'),
+    'TIMESTAMP': pa.timestamp('ms'),
+}
+
+# Tables per INFORMATION_SCHEMA query during prefetch
+CATALOG_CHUNK_SIZE = 500
+
 
 class FlightConnector:
     """Arrow Flight connector for Dremio."""
@@ -73,6 +95,20 @@ class FlightConnector:
         
         return pa.Table.from_batches(batches)
 
+    def get_schema(self, query: str) -> pa.Schema:
+        """
+        Get the result schema of a query without fetching any data.
+
+        Uses Flight GetSchema and falls back to the schema in GetFlightInfo
+        (planning only, no do_get) for servers that do not implement it.
+        """
+        descriptor = flight.FlightDescriptor.for_command(query)
+        try:
+            return self.client.get_schema(descriptor, self.options).schema
+        except Exception as e:
+            logger.debug(f"Flight GetSchema failed, using GetFlightInfo: {str(e)}")
+            return self.client.get_flight_info(descriptor, self.options).schema
+
 
 class DuckDBCache:
     """DuckDB-based local cache for query results."""
@@ -116,7 +152,8 @@ class DremioConnector(BaseConnector):
         trusted_certificates: Optional[str] = None,
         session_properties: Optional[List[Tuple[bytes, bytes]]] = None,
         engine: Optional[str] = None,
-        db: str = "cache.duckdb"
+        db: str = "cache.duckdb",
+        schema_cache_path: Optional[str] = None
     ):
         """
         Initialize Dremio connector.
@@ -133,6 +170,7 @@ class DremioConnector(BaseConnector):
             session_properties: Additional session properties
             engine: Dremio engine name
             db: DuckDB cache file path
+            schema_cache_path: Optional JSON file with prefetched table schemas
         """
         super().__init__()  # Initialize BaseConnector
 
@@ -152,6 +190,7 @@ class DremioConnector(BaseConnector):
             engine=engine
         )
         self.duckdb_cache = DuckDBCache(db)
+        self.schema_cache = SchemaCache(schema_cache_path)
 
         # Load Dremio null-equivalent configuration
         self.config = ConfigLoader()
@@ -223,7 +262,12 @@ class DremioConnector(BaseConnector):
 
     def execute_query(self, query: str) -> pa.Table:
         """Execute query against Dremio and return PyArrow table."""
-        return self.flight_connector.execute_query(query)
+        return self._shared_scan(query, lambda: self._execute(query))
+
+    def _execute(self, query: str) -> pa.Table:
+        """Run a query through Arrow Flight."""
+        with self._source_slot():
+            return self.flight_connector.execute_query(query)
     
     def direct_query(self, sql_query: str, engine: str = "polars") -> Any:
         """
@@ -260,11 +304,116 @@ class DremioConnector(BaseConnector):
         """
         return self.duckdb_cache.query(sql_query)
     
+    @staticmethod
+    def _split_table_path(table_name: str) -> List[str]:
+        """Split a table reference like ulysses1.sapisu."rfn_but000" into path parts."""
+        parts = re.findall(r'"([^"]+)"|([^."\s]+)', table_name.strip())
+        return [quoted if quoted else unquoted for quoted, unquoted in parts]
+
+    @classmethod
+    def _cache_key(cls, table_name: str) -> str:
+        """Schema cache key (Dremio identifiers are case-insensitive)."""
+        return '.'.join(cls._split_table_path(table_name)).lower()
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a string literal for Dremio SQL."""
+        return value.replace("'", "''")
+
+    def prefetch_table_schemas(self, table_names: List[str]) -> int:
+        """
+        Load the schemas of many tables from INFORMATION_SCHEMA."COLUMNS" and cache them.
+
+        Tables with column types that cannot be mapped exactly (e.g., LIST,
+        STRUCT) are left out and resolved through Flight on first use. Saves the
+        cache to disk if the connector has a schema cache path.
+
+        Args:
+            table_names: Table references (e.g., 'ulysses1.sapisu."rfn_but000"')
+
+        Returns:
+            Number of schemas cached
+        """
+        tables = {}
+        for name in table_names:
+            path = self._split_table_path(name)
+            if len(path) >= 2:
+                tables[self._cache_key(name)] = ('.'.join(path[:-1]), path[-1])
+
+        unique_tables = list(tables.values())
+        schemas: Dict[str, pa.Schema] = {}
+
+        for start in range(0, len(unique_tables), CATALOG_CHUNK_SIZE):
+            chunk = unique_tables[start:start + CATALOG_CHUNK_SIZE]
+
+            by_schema: Dict[str, List[str]] = {}
+            for schema, table in chunk:
+                by_schema.setdefault(schema, []).append(table)
+
+            clauses = []
+            for schema, names in by_schema.items():
+                name_list = ', '.join(f"'{self._escape(name)}'" for name in names)
+                clauses.append(f"(TABLE_SCHEMA = '{self._escape(schema)}' AND TABLE_NAME IN ({name_list}))")
+
+            query = f"""
+            SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE,
+                   NUMERIC_PRECISION, NUMERIC_SCALE, ORDINAL_POSITION
+            FROM INFORMATION_SCHEMA."COLUMNS"
+            WHERE {' OR '.join(clauses)}
+            ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+            """
+
+            fields: Dict[str, List[pa.Field]] = {}
+            unmappable = set()
+            for row in self.execute_query(query).to_pylist():
+                key = f"{row['TABLE_SCHEMA']}.{row['TABLE_NAME']}".lower()
+                data_type = (row['DATA_TYPE'] or '').upper()
+
+                if data_type == 'DECIMAL' and row['NUMERIC_PRECISION'] is not None:
+                    arrow_type = pa.decimal128(int(row['NUMERIC_PRECISION']), int(row['NUMERIC_SCALE'] or 0))
+                else:
+                    arrow_type = DREMIO_TYPE_MAP.get(data_type)
+
+                if arrow_type is None:
+                    unmappable.add(key)
+                    continue
+                fields.setdefault(key, []).append(pa.field(row['COLUMN_NAME'], arrow_type))
+
+            schemas.update({
+                key: pa.schema(table_fields)
+                for key, table_fields in fields.items()
+                if key not in unmappable
+            })
+
+        self.schema_cache.update(schemas)
+        self.schema_cache.save()
+
+        logger.info(f"Prefetched {len(schemas)} Dremio table schemas "
+                    f"({len(unique_tables) - len(schemas)} left to Flight lookup)")
+        return len(schemas)
+
     def get_table_schema(self, table_name: str) -> pa.Schema:
-        """Get schema for a Dremio table."""
-        query = f"SELECT * FROM {table_name} LIMIT 1"
-        result = self.execute_query(query)
-        return result.schema
+        """
+        Get schema for a Dremio table.
+
+        Metadata-only: uses the schema cache, then Flight GetSchema on
+        SELECT * without fetching rows. Memoized per connector.
+        """
+        cache_key = self._cache_key(table_name)
+        schema = self.schema_cache.get(cache_key)
+        if schema is not None:
+            return schema
+
+        try:
+            with self._source_slot():
+                schema = self.flight_connector.get_schema(f"SELECT * FROM {table_name}")
+        except Exception as e:
+            logger.warning(f"Flight schema lookup failed for {table_name}, reading one row: {str(e)}")
+            query = f"SELECT * FROM {table_name} LIMIT 1"
+            schema = self.execute_query(query).schema
+
+        self.schema_cache.put(cache_key, schema)
+        return schema
     
     def get_row_count(self, table_name: str) -> int:
         """Get row count for a Dremio table."""
@@ -272,6 +421,27 @@ class DremioConnector(BaseConnector):
         result = self.execute_query(query)
         return result.to_pandas()['cnt'].iloc[0]
     
+    def estimate_row_count(self, table_name: str) -> Optional[int]:
+        """
+        Sum the per-file record counts of an Iceberg table from TABLE(table_files(...)).
+
+        Only table metadata is read. Row-level deletes are not subtracted, so the
+        result can be an overestimate; use get_row_count() for exact counts.
+        Returns None for tables without Iceberg metadata (e.g., views).
+        """
+        path = '.'.join(f'"{part}"' for part in self._split_table_path(table_name))
+        query = f"SELECT SUM(record_count) AS cnt FROM TABLE(table_files('{self._escape(path)}'))"
+
+        try:
+            result = self.execute_query(query)
+        except Exception as e:
+            logger.debug(f"Metadata row count unavailable for {table_name}: {str(e)}")
+            return None
+
+        if result.num_rows and result.column(0)[0].as_py() is not None:
+            return int(result.column(0)[0].as_py())
+        return None
+
     def get_cache_connection(self):
         """Get direct DuckDB connection for advanced queries."""
         return self.duckdb_cache.get_connection()
@@ -299,5 +469,6 @@ class DremioConnector(BaseConnector):
             pat_or_auth_token=os.getenv('DREMIO_PAT'),
             tls=os.getenv('DREMIO_TLS', 'true').lower() == 'true',
             disable_server_verification=os.getenv('DREMIO_DISABLE_SERVER_VERIFICATION', 'true').lower() == 'true',
-            db=db_path or os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb')
+            db=db_path or os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb'),
+            schema_cache_path=os.getenv('DREMIO_SCHEMA_CACHE_PATH')
         )
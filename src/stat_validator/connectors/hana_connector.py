@@ -1,18 +1,59 @@
 """SAP HANA connector with DuckDB caching for statistical validation."""
 
 import os
+import re
+import threading
+from contextlib import contextmanager
 import duckdb
 from hdbcli import dbapi
 import pyarrow as pa
 import polars as pl
 import pandas as pd
-from typing import Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any, Tuple
 from .base_connector import BaseConnector
+from .schema_cache import SchemaCache
 from ..utils.logger import get_logger
 from ..utils.config_loader import ConfigLoader
 
 logger = get_logger('hana_connector')
 
+# HANA SQL type name -> PyArrow type (DECIMAL, TIMESTAMP handled separately)
+HANA_TYPE_MAP = {
+    'TINYINT': pa.int32(),
+    'SMALLINT': pa.int32(),
+    'INTEGER': pa.int32(),
+    'BIGINT': pa.int64(),
+    'SMALLDECIMAL': pa.float64(),
+    'REAL': pa.float32(),
+    'DOUBLE': pa.float64(),
+    'FLOAT': pa.float64(),
+    'BOOLEAN': pa.bool_(),
+    'DATE': pa.date32(),
+    'DAYDATE': pa.date32(),
+    'TIME': pa.time32('s'),
+    'SECONDTIME': pa.time32('s'),
+    'SECONDDATE': pa.timestamp('s'),
+    'TIMESTAMP': pa.timestamp('ns'),
+    'LONGDATE': pa.timestamp('ns'),
+    'VARCHAR': pa.string(),
+    'NVARCHAR': pa.string(),
+    'CHAR': pa.string(),
+    'NCHAR': pa.string(),
+    'ALPHANUM': pa.string(),
+    'SHORTTEXT': pa.string(),
+    'CLOB': pa.string(),
+    'NCLOB': pa.string(),
+    'TEXT': pa.string(),
+    'BINARY': pa.binary(),
+    'VARBINARY': pa.binary(),
+    'BLOB': pa.binary(),
+    'ST_GEOMETRY': pa.binary(),
+    'ST_POINT': pa.binary(),
+}
+
+# Catalog tables are queried in chunks to keep the IN lists reasonable
+CATALOG_CHUNK_SIZE = 500
+
 class DuckDBCache:
     """DuckDB-based local cache for query results."""
     
@@ -52,7 +93,8 @@ class HanaConnector(BaseConnector):
         schema: Optional[str] = None,
         encrypt: bool = True,
         ssl_validate_certificate: bool = False,
-        db: str = "cache.duckdb"
+        db: str = "cache.duckdb",
+        schema_cache_path: Optional[str] = None
     ):
         """
         Initialize SAP HANA connector.
@@ -66,6 +108,7 @@ class HanaConnector(BaseConnector):
             encrypt: Enable SSL/TLS encryption
             ssl_validate_certificate: Validate SSL certificate
             db: DuckDB cache file path
+            schema_cache_path: Optional JSON file with prefetched table schemas
         """
         super().__init__()  # Initialize BaseConnector
 
@@ -77,18 +120,33 @@ class HanaConnector(BaseConnector):
         self.encrypt = encrypt
         self.ssl_validate_certificate = ssl_validate_certificate
 
-        self._connection = None
+        # hdbcli connections must not be used by two threads at once: each query checks
+        # one out of the idle pool and returns it, so short-lived threads reuse logins
+        self._idle_connections = []
+        self._connections_lock = threading.Lock()
         self.duckdb_cache = DuckDBCache(db)
+        self.schema_cache = SchemaCache(schema_cache_path)
 
         # Load SAP null-equivalent configuration
         self.config = ConfigLoader()
         self.transform_nulls = self.config.get('sap_hana.transform_null_equivalents', True)
         self.null_patterns = self.config.get('sap_hana.null_equivalents', {})
     
-    def _get_connection(self):
-        """Get or create HANA connection."""
-        if self._connection is None or not self._connection.isconnected():
-            self._connection = dbapi.connect(
+    @contextmanager
+    def _checkout_connection(self) -> Iterator[Any]:
+        """
+        Hold a HANA connection for the calling thread's query.
+
+        An idle connection is reused if there is one, otherwise a new one is
+        opened; either way it goes back to the idle pool afterwards. The pool
+        never holds more connections than queries ran at once (at most the
+        concurrency cap, as connections are checked out inside the source slot).
+        """
+        with self._connections_lock:
+            connection = self._idle_connections.pop() if self._idle_connections else None
+
+        if connection is None or not connection.isconnected():
+            connection = dbapi.connect(
                 address=self.hostname,
                 port=self.port,
                 user=self.username,
@@ -97,7 +155,12 @@ class HanaConnector(BaseConnector):
                 sslValidateCertificate=self.ssl_validate_certificate,
                 currentSchema=self.schema
             )
-        return self._connection
+
+        try:
+            yield connection
+        finally:
+            with self._connections_lock:
+                self._idle_connections.append(connection)
 
     def transform_column_for_null_equivalents(self, column_name: str, arrow_type: pa.DataType) -> str:
         """
@@ -161,17 +224,21 @@ class HanaConnector(BaseConnector):
     
     def execute_query(self, query: str) -> pa.Table:
         """Execute query against HANA and return PyArrow table."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            df = pd.DataFrame(rows, columns=columns)
-            return pa.Table.from_pandas(df)
-        finally:
-            cursor.close()
+        return self._shared_scan(query, lambda: self._execute(query))
+
+    def _execute(self, query: str) -> pa.Table:
+        """Run a query on a pooled HANA connection."""
+        # The slot and the connection are held until all rows are fetched
+        with self._source_slot(), self._checkout_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query)
+                columns = [desc[0] for desc in cursor.description]
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+        df = pd.DataFrame(rows, columns=columns)
+        return pa.Table.from_pandas(df)
     
     # cache_query is now inherited from BaseConnector - no override needed
     # The shared implementation handles all the caching logic
@@ -180,11 +247,139 @@ class HanaConnector(BaseConnector):
         """Query cached data in DuckDB."""
         return self.duckdb_cache.query(sql_query)
     
+    def _split_table_name(self, table_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Split a table reference into catalog (schema, table) names.
+
+        Quoted identifiers keep their case, unquoted ones are upper-cased as HANA
+        does. Returns None if the reference cannot be resolved (e.g., no schema).
+        """
+        parts = re.findall(r'"([^"]+)"|([^."\s]+)', table_name.strip())
+        names = [quoted if quoted else unquoted.upper() for quoted, unquoted in parts]
+
+        if len(names) == 2:
+            return names[0], names[1]
+        if len(names) == 1 and self.schema:
+            return self.schema, names[0]
+        return None
+
+    @staticmethod
+    def _arrow_type(data_type: str, length: Optional[int], scale: Optional[int]) -> pa.DataType:
+        """Map a HANA catalog column type to a PyArrow type."""
+        data_type = (data_type or '').upper()
+
+        if data_type == 'DECIMAL':
+            # DECIMAL without precision/scale is a floating decimal in HANA
+            if pd.isna(length) or pd.isna(scale) or not 0 < length <= 38:
+                return pa.float64()
+            return pa.decimal128(int(length), int(scale))
+
+        return HANA_TYPE_MAP.get(data_type, pa.string())
+
+    def _fetch_catalog_schemas(self, tables: List[Tuple[str, str]]) -> Dict[Tuple[str, str], pa.Schema]:
+        """
+        Read column metadata for tables and views from SYS.TABLE_COLUMNS / SYS.VIEW_COLUMNS.
+
+        Args:
+            tables: List of (schema, table) names as stored in the catalog
+
+        Returns:
+            Dictionary mapping (schema, table) -> PyArrow schema, for the tables found
+        """
+        schemas: Dict[Tuple[str, str], pa.Schema] = {}
+        unique_tables = list(dict.fromkeys(tables))
+
+        for start in range(0, len(unique_tables), CATALOG_CHUNK_SIZE):
+            chunk = unique_tables[start:start + CATALOG_CHUNK_SIZE]
+
+            by_schema: Dict[str, List[str]] = {}
+            for schema, table in chunk:
+                by_schema.setdefault(schema, []).append(table)
+
+            def condition(name_column: str) -> str:
+                clauses = []
+                for schema, names in by_schema.items():
+                    name_list = ', '.join(f"'{self._escape(name)}'" for name in names)
+                    clauses.append(f"(SCHEMA_NAME = '{self._escape(schema)}' AND {name_column} IN ({name_list}))")
+                return ' OR '.join(clauses)
+
+            query = f"""
+            SELECT SCHEMA_NAME, TABLE_NAME, COLUMN_NAME, DATA_TYPE_NAME, LENGTH, SCALE, POSITION
+            FROM SYS.TABLE_COLUMNS WHERE {condition('TABLE_NAME')}
+            UNION ALL
+            SELECT SCHEMA_NAME, VIEW_NAME, COLUMN_NAME, DATA_TYPE_NAME, LENGTH, SCALE, POSITION
+            FROM SYS.VIEW_COLUMNS WHERE {condition('VIEW_NAME')}
+            ORDER BY 1, 2, 7
+            """
+
+            columns: Dict[Tuple[str, str], List[pa.Field]] = {}
+            for row in self.execute_query(query).to_pylist():
+                values = list(row.values())
+                schema, table, column, data_type, length, scale = values[:6]
+                columns.setdefault((schema, table), []).append(
+                    pa.field(column, self._arrow_type(data_type, length, scale))
+                )
+
+            schemas.update({key: pa.schema(fields) for key, fields in columns.items()})
+
+        return schemas
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        """Escape a string literal for HANA SQL."""
+        return value.replace("'", "''")
+
+    def prefetch_table_schemas(self, table_names: List[str]) -> int:
+        """
+        Load the schemas of many tables with one catalog query and cache them.
+
+        Saves the cache to disk if the connector has a schema cache path.
+
+        Args:
+            table_names: Table references (e.g., '"SAP_RISE_1"."T_RISE_BUT000"')
+
+        Returns:
+            Number of schemas found in the catalog
+        """
+        keys = [key for key in (self._split_table_name(name) for name in table_names) if key]
+        if not keys:
+            return 0
+
+        schemas = self._fetch_catalog_schemas(keys)
+        self.schema_cache.update({f"{schema}.{table}": s for (schema, table), s in schemas.items()})
+        self.schema_cache.save()
+
+        missing = len(set(keys)) - len(schemas)
+        logger.info(f"Prefetched {len(schemas)} HANA table schemas ({missing} not found in catalog)")
+        return len(schemas)
+
     def get_table_schema(self, table_name: str) -> pa.Schema:
-        """Get schema for a HANA table."""
-        query = f"SELECT * FROM {table_name} LIMIT 1"
-        result = self.execute_query(query)
-        return result.schema
+        """
+        Get schema for a HANA table.
+
+        Uses the exact column types from the catalog, memoized per connector.
+        Falls back to reading one row if the table is not in the catalog
+        (e.g., synonyms).
+        """
+        key = self._split_table_name(table_name)
+        cache_key = f"{key[0]}.{key[1]}" if key else table_name
+
+        schema = self.schema_cache.get(cache_key)
+        if schema is not None:
+            return schema
+
+        if key:
+            try:
+                schema = self._fetch_catalog_schemas([key]).get(key)
+            except Exception as e:
+                logger.warning(f"Catalog schema lookup failed for {table_name}: {str(e)}")
+
+        if schema is None:
+            query = f"SELECT * FROM {table_name} LIMIT 1"
+            schema = self.execute_query(query).schema
+
+        self.schema_cache.put(cache_key, schema)
+        return schema
     
     def get_row_count(self, table_name: str) -> int:
         """Get row count for a HANA table."""
@@ -201,14 +396,78 @@ class HanaConnector(BaseConnector):
             # If column name is different, just get first column
             return int(df.iloc[0, 0])
     
+    def estimate_row_count(self, table_name: str) -> Optional[int]:
+        """
+        Read the record count of a HANA table from M_TABLES (falling back to M_CS_TABLES).
+
+        Monitoring views are maintained by HANA, so this costs no table scan.
+        Returns None for views, synonyms and tables not visible in the views.
+        """
+        key = self._split_table_name(table_name)
+        if not key:
+            return None
+
+        condition = f"SCHEMA_NAME = '{self._escape(key[0])}' AND TABLE_NAME = '{self._escape(key[1])}'"
+        queries = [
+            f"SELECT RECORD_COUNT FROM M_TABLES WHERE {condition}",
+            # Column store only; one row per partition
+            f"SELECT SUM(RECORD_COUNT) FROM M_CS_TABLES WHERE {condition}",
+        ]
+
+        for query in queries:
+            try:
+                result = self.execute_query(query)
+            except Exception as e:
+                logger.debug(f"Row count estimate failed for {table_name}: {str(e)}")
+                continue
+
+            if result.num_rows and result.column(0)[0].as_py() is not None:
+                return int(result.column(0)[0].as_py())
+
+        return None
+
+    def estimate_distinct_counts(self, table_name: str) -> Dict[str, int]:
+        """
+        Read per-column distinct counts of a HANA column table from M_CS_COLUMNS.
+
+        Partitioned tables report distinct counts per partition; the largest one
+        is used (a lower bound of the table's distinct count).
+        """
+        key = self._split_table_name(table_name)
+        if not key:
+            return {}
+
+        query = f"""
+        SELECT COLUMN_NAME, MAX(DISTINCT_COUNT) AS DISTINCT_COUNT
+        FROM M_CS_COLUMNS
+        WHERE SCHEMA_NAME = '{self._escape(key[0])}' AND TABLE_NAME = '{self._escape(key[1])}'
+        GROUP BY COLUMN_NAME
+        """
+
+        try:
+            rows = self.execute_query(query).to_pylist()
+        except Exception as e:
+            logger.debug(f"Distinct count estimate failed for {table_name}: {str(e)}")
+            return {}
+
+        counts = {}
+        for row in rows:
+            column, distinct_count = list(row.values())[:2]
+            if distinct_count is not None:
+                counts[column] = int(distinct_count)
+        return counts
+
     def get_cache_connection(self):
         """Get direct DuckDB connection for advanced queries."""
         return self.duckdb_cache.get_connection()
     
     def close(self):
-        """Close HANA connection."""
-        if self._connection and self._connection.isconnected():
-            self._connection.close()
+        """Close all HANA connections opened by this connector (once no query is running)."""
+        with self._connections_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for connection in connections:
+            if connection.isconnected():
+                connection.close()
     
     @classmethod
     def from_env(cls, db_path: Optional[str] = None) -> 'HanaConnector':
@@ -221,5 +480,6 @@ class HanaConnector(BaseConnector):
             schema=os.getenv('HANA_SCHEMA'),
             encrypt=os.getenv('HANA_ENCRYPT', 'true').lower() == 'true',
             ssl_validate_certificate=os.getenv('HANA_SSL_VALIDATE', 'false').lower() == 'true',
-            db=db_path or os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb')
+            db=db_path or os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb'),
+            schema_cache_path=os.getenv('HANA_SCHEMA_CACHE_PATH')
         )
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Offline connector serving a sample persisted by a previous comparison."""
+
+import duckdb
+import pyarrow as pa
+
+from .base_connector import BaseConnector
+from ..utils.logger import get_logger
+
+logger = get_logger('sample_connector')
+
+
+class SampleConnector(BaseConnector):
+    """
+    Read-only connector over a persisted comparison sample.
+
+    The sample is loaded into an in-memory DuckDB database under the cache
+    table name the comparator expects, so column tests can run on it again
+    without touching the original source. Queries against the source itself
+    are not possible.
+    """
+
+    def __init__(self, sample_path: str, schema: pa.Schema, cache_table: str):
+        """
+        Load a persisted sample.
+
+        Args:
+            sample_path: Parquet file written by TableComparator
+            schema: Schema of the original table
+            cache_table: Cache table name to load the sample into
+        """
+        super().__init__()
+        self.sample_path = sample_path
+        self.schema = schema
+
+        self._duckdb_conn = duckdb.connect()
+        escaped_path = sample_path.replace("'", "''")
+        self._duckdb_conn.execute(
+            f"CREATE TABLE {cache_table} AS SELECT * FROM read_parquet('{escaped_path}')"
+        )
+        rows = self._duckdb_conn.execute(f"SELECT COUNT(*) FROM {cache_table}").fetchone()[0]
+        logger.info(f"Loaded {rows} sampled rows from {sample_path} into {cache_table}")
+
+    def execute_query(self, query: str) -> pa.Table:
+        """Not supported: the original source is never queried."""
+        raise RuntimeError(f"Offline sample {self.sample_path} cannot run source queries")
+
+    def get_table_schema(self, table_name: str) -> pa.Schema:
+        """Schema of the original table, as persisted with the sample."""
+        return self.schema
+
+    def get_row_count(self, table_name: str) -> int:
+        """Not supported: the original source is never queried."""
+        raise RuntimeError(f"Offline sample {self.sample_path} has no source row count")
+
+    def get_cache_connection(self) -> duckdb.DuckDBPyConnection:
+        """Cursor on the in-memory database holding the sample."""
+        return self._duckdb_conn.cursor()
+
+    def close(self):
+        """Release the in-memory database."""
+        if self._duckdb_conn:
+            self._duckdb_conn.close()
+            self._duckdb_conn = None
@@ -0,0 +1,102 @@
+"""Per-run cache of table schemas with optional on-disk persistence."""
+
+import base64
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+import pyarrow as pa
+
+from ..utils.logger import get_logger
+
+logger = get_logger('schema_cache')
+
+
+class SchemaCache:
+    """
+    Thread-safe mapping of table key -> PyArrow schema.
+
+    When a path is given, previously saved schemas are loaded on creation and
+    save() writes the cache back as JSON (schemas serialized as base64 Arrow IPC),
+    so a prefetch done once can be reused by other processes of the same run.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Optional JSON file for persistence
+        """
+        self.path = path
+        self._schemas: Dict[str, pa.Schema] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def get(self, key: str) -> Optional[pa.Schema]:
+        """Return the cached schema for key, or None."""
+        with self._lock:
+            return self._schemas.get(key)
+
+    def put(self, key: str, schema: pa.Schema):
+        """Cache a schema."""
+        with self._lock:
+            self._schemas[key] = schema
+
+    def update(self, schemas: Dict[str, pa.Schema]):
+        """Cache several schemas at once."""
+        with self._lock:
+            self._schemas.update(schemas)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._schemas
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._schemas)
+
+    def load(self):
+        """Load schemas from the JSON file (entries that fail to decode are ignored)."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read schema cache {self.path}: {str(e)}")
+            return
+
+        loaded = {}
+        for key, encoded in data.items():
+            try:
+                loaded[key] = pa.ipc.read_schema(pa.py_buffer(base64.b64decode(encoded)))
+            except Exception as e:
+                logger.debug(f"Skipping unreadable cached schema for {key}: {str(e)}")
+
+        self.update(loaded)
+        logger.info(f"Loaded {len(loaded)} cached schemas from {self.path}")
+
+    def save(self):
+        """Write all cached schemas to the JSON file (no-op without a path)."""
+        if not self.path:
+            return
+
+        with self._lock:
+            data = {
+                key: base64.b64encode(schema.serialize().to_pybytes()).decode('ascii')
+                for key, schema in self._schemas.items()
+            }
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temp file first so concurrent readers never see a partial file
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+        logger.info(f"Saved {len(data)} schemas to {self.path}")
@@ -186,12 +186,12 @@ class ExcelGenerator:
         # Add title
         ws['A1'] = f"Daily Breakdown: {table_name}"
         ws['A1'].font = Font(bold=True, size=12)
-        ws.merge_cells('A1:C1')
+        ws.merge_cells('A1:D1')
 
         ws['A2'] = f"Period: {breakdown_data['year']}-{breakdown_data['month']:02d}"
 
         # Add headers (starting at row 4)
-        headers = ['Date', 'SAP Count', 'Dremio Count']
+        headers = ['Date', 'SAP Count', 'Dremio Count', 'Null Rate Drift (SAP % / Dremio %)']
         header_row = 4
         for col_idx, header in enumerate(headers, start=1):
             cell = ws.cell(row=header_row, column=col_idx, value=header)
@@ -212,10 +212,18 @@ class ExcelGenerator:
             else:
                 date_str = str(date_val).split(' ')[0]  # Take just the date part
 
+            # Columns whose null percentage differs between the sides on this day
+            null_drift = data_row.get('null_drift') or {}
+            drift_str = ', '.join(
+                f"{col} ({info['sap_null_pct']:.2f} / {info['dremio_null_pct']:.2f})"
+                for col, info in sorted(null_drift.items())
+            )
+
             row = [
                 date_str,
                 int(data_row.get('sap_count', 0)),
-                int(data_row.get('dremio_count', 0))
+                int(data_row.get('dremio_count', 0)),
+                drift_str
             ]
             ws.append(row)
 
@@ -226,7 +234,7 @@ class ExcelGenerator:
                 cell.border = border
 
                 # Right-align numeric columns
-                if col_idx >= 2:
+                if col_idx in (2, 3):
                     cell.alignment = Alignment(horizontal='right')
 
         # Add total row
@@ -256,6 +264,7 @@ class ExcelGenerator:
         ws.column_dimensions['A'].width = 15
         ws.column_dimensions['B'].width = 15
         ws.column_dimensions['C'].width = 15
+        ws.column_dimensions['D'].width = 60
 
         # Freeze header row
         ws.freeze_panes = ws['A5']
@@ -1,6 +1,12 @@
 """Utility modules for statistical validator."""
 
+from .admission import SourceLimiter
 from .config_loader import ConfigLoader
 from .logger import setup_logging, get_logger
+from .fingerprint_store import FingerprintStore
+from .metadata_catalog import MetadataCatalog
+from .paired_execution import run_paired, PairedResult
+from .result_cache import ResultCache
+from .scan_share import ScanShare
 
-__all__ = ['ConfigLoader', 'setup_logging', 'get_logger']
+__all__ = ['SourceLimiter', 'ConfigLoader', 'setup_logging', 'get_logger', 'FingerprintStore', 'MetadataCatalog', 'run_paired', 'PairedResult', 'ResultCache', 'ScanShare']
@@ -0,0 +1,64 @@
+"""Admission control for queries against a shared source system."""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class SourceLimiter:
+    """
+    Caps the number of concurrent queries against one source and measures queue wait.
+
+    The semaphore decides the scope of the cap: a threading semaphore limits
+    one process, a multiprocessing one (created before the workers start)
+    limits all worker processes of a bulk run together. Time spent waiting for
+    a slot is accumulated, so it can be reported per source.
+    """
+
+    def __init__(self, name: str, semaphore: Any):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Source name used in reports (e.g., 'hana', 'dremio')
+            semaphore: Semaphore holding the source's concurrency budget
+        """
+        self.name = name
+        self.semaphore = semaphore
+
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the source's slots for the duration of a query."""
+        started = time.perf_counter()
+        self.semaphore.acquire()
+        waited = time.perf_counter() - started
+
+        with self._lock:
+            self.queries += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        try:
+            yield
+        finally:
+            self.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the queue-wait statistics so far.
+
+        Returns:
+            Dictionary with 'queries', 'wait_seconds' and 'max_wait_seconds'
+        """
+        with self._lock:
+            return {
+                'queries': self.queries,
+                'wait_seconds': round(self.wait_seconds, 3),
+                'max_wait_seconds': round(self.max_wait_seconds, 3)
+            }
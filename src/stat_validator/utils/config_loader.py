@@ -68,6 +68,35 @@ class ConfigLoader:
         # Sampling overrides
         if os.getenv('SAMPLE_SIZE'):
             self.config.setdefault('sampling', {})['max_sample_size'] = int(os.getenv('SAMPLE_SIZE'))
+
+        # Metadata catalog location (shared by the processes of a bulk run)
+        if os.getenv('METADATA_CATALOG_PATH'):
+            self.config.setdefault('metadata_catalog', {})['path'] = os.getenv('METADATA_CATALOG_PATH')
+
+        # Fingerprint store for incremental revalidation
+        if os.getenv('FINGERPRINT_STORE_PATH'):
+            self.config.setdefault('incremental', {})['path'] = os.getenv('FINGERPRINT_STORE_PATH')
+
+        # Result cache location
+        if os.getenv('RESULT_CACHE_PATH'):
+            self.config.setdefault('result_cache', {})['path'] = os.getenv('RESULT_CACHE_PATH')
+
+        # Per-table cost history of bulk runs
+        if os.getenv('BULK_HISTORY_PATH'):
+            self.config.setdefault('bulk', {})['history_path'] = os.getenv('BULK_HISTORY_PATH')
+        if os.getenv('BULK_PREFETCH_DEPTH'):
+            self.config.setdefault('bulk', {})['prefetch_depth'] = int(os.getenv('BULK_PREFETCH_DEPTH'))
+
+        # Concurrent query caps per source
+        if os.getenv('HANA_MAX_CONCURRENT_QUERIES'):
+            self.config.setdefault('concurrency', {})['hana'] = int(os.getenv('HANA_MAX_CONCURRENT_QUERIES'))
+
+        if os.getenv('DREMIO_MAX_CONCURRENT_QUERIES'):
+            self.config.setdefault('concurrency', {})['dremio'] = int(os.getenv('DREMIO_MAX_CONCURRENT_QUERIES'))
+
+        # Persisted samples for offline re-scoring
+        if os.getenv('SAMPLE_STORE_PATH'):
+            self.config.setdefault('sample_store', {})['path'] = os.getenv('SAMPLE_STORE_PATH')
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -99,7 +128,9 @@ class ConfigLoader:
             'pat_or_auth_token': None,  # Changed: Don't use token parameter
             'tls': os.getenv('DREMIO_TLS', 'true').lower() == 'true',
             'disable_server_verification': os.getenv('DREMIO_DISABLE_SERVER_VERIFICATION', 'true').lower() == 'true',
-            'db': os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb')
+            'db': os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb'),
+            'schema_cache_path': os.getenv('DREMIO_SCHEMA_CACHE_PATH'),
+            'engine': os.getenv('DREMIO_ENGINE')
         }
     
     def get_all(self) -> Dict[str, Any]:
@@ -116,5 +147,6 @@ class ConfigLoader:
             'schema': os.getenv('HANA_SCHEMA'),
             'encrypt': os.getenv('HANA_ENCRYPT', 'true').lower() == 'true',
             'ssl_validate_certificate': os.getenv('HANA_SSL_VALIDATE', 'false').lower() == 'true',
-            'db': os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb')
+            'db': os.getenv('DUCKDB_CACHE_PATH', '_validation_cache.duckdb'),
+            'schema_cache_path': os.getenv('HANA_SCHEMA_CACHE_PATH')
         }
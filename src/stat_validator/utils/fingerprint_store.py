@@ -0,0 +1,136 @@
+"""Persistent per-day fingerprints and results of table pair comparisons."""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .logger import get_logger
+
+logger = get_logger('fingerprint_store')
+
+
+class FingerprintStore:
+    """
+    SQLite store of the data fingerprints a day was last validated with, and its result.
+
+    A day whose source and destination fingerprints (and comparison settings)
+    are unchanged since its last validation can carry that result forward
+    instead of being compared again.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS day_fingerprints (
+                    pair_key TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    settings_hash TEXT NOT NULL,
+                    source_fingerprint TEXT NOT NULL,
+                    dest_fingerprint TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (pair_key, day)
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from any thread or process)."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _encode(fingerprint: Dict[str, Any]) -> str:
+        """Serialize a fingerprint deterministically."""
+        return json.dumps(fingerprint, sort_keys=True, default=str)
+
+    def get_unchanged(
+        self,
+        pair_key: str,
+        day: str,
+        settings_hash: str,
+        source_fingerprint: Dict[str, Any],
+        dest_fingerprint: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored result of a day if nothing changed since it was validated.
+
+        Args:
+            pair_key: Table pair identifier
+            day: Day (YYYY-MM-DD)
+            settings_hash: Hash of the comparison settings
+            source_fingerprint: Fresh source fingerprint of the day
+            dest_fingerprint: Fresh destination fingerprint of the day
+
+        Returns:
+            Stored result (with 'validated_at'), or None if the day must be compared
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT settings_hash, source_fingerprint, dest_fingerprint, result, updated_at "
+                    "FROM day_fingerprints WHERE pair_key = ? AND day = ?",
+                    (pair_key, day)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Fingerprint lookup failed for {pair_key} {day}: {str(e)}")
+            return None
+
+        if row is None:
+            return None
+
+        if (row[0], row[1], row[2]) != (settings_hash, self._encode(source_fingerprint), self._encode(dest_fingerprint)):
+            return None
+
+        result = json.loads(row[3])
+        result['validated_at'] = row[4]
+        return result
+
+    def put(
+        self,
+        pair_key: str,
+        day: str,
+        settings_hash: str,
+        source_fingerprint: Dict[str, Any],
+        dest_fingerprint: Dict[str, Any],
+        result: Dict[str, Any]
+    ):
+        """
+        Store the fingerprints a day was validated with and its result.
+
+        Args:
+            pair_key: Table pair identifier
+            day: Day (YYYY-MM-DD)
+            settings_hash: Hash of the comparison settings
+            source_fingerprint: Source fingerprint of the day
+            dest_fingerprint: Destination fingerprint of the day
+            result: Comparison result of the day
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO day_fingerprints "
+                    "(pair_key, day, settings_hash, source_fingerprint, dest_fingerprint, result, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        pair_key, day, settings_hash,
+                        self._encode(source_fingerprint), self._encode(dest_fingerprint),
+                        json.dumps(result, default=str), datetime.now().isoformat()
+                    )
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not store fingerprints for {pair_key} {day}: {str(e)}")
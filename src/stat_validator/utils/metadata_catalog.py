@@ -0,0 +1,128 @@
+"""Persistent catalog of per-table facts discovered during comparisons."""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pyarrow as pa
+
+from .logger import get_logger
+
+logger = get_logger('metadata_catalog')
+
+
+class MetadataCatalog:
+    """
+    SQLite store of facts about tables (hash column, binary columns, coercions...).
+
+    Every entry is tagged with the fingerprint of the schema it was derived from.
+    A lookup with a different fingerprint is a miss, so facts are rediscovered
+    only when the table's columns or types actually changed. SQLite handles
+    concurrent access from the worker processes of a bulk run.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the catalog, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS table_metadata (
+                    table_key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    facts TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from any thread or process)."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def schema_fingerprint(schema: pa.Schema) -> str:
+        """
+        Fingerprint a schema from its column names and types, in order.
+
+        Args:
+            schema: PyArrow schema
+
+        Returns:
+            Hex digest identifying the schema
+        """
+        columns = "\n".join(f"{field.name}:{field.type}" for field in schema)
+        return hashlib.sha256(columns.encode('utf-8')).hexdigest()[:16]
+
+    def get(self, table_key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the facts recorded for a table.
+
+        Args:
+            table_key: Table identifier (e.g. 'hana:"SAP"."BUT000"')
+            fingerprint: Fingerprint of the table's current schema
+
+        Returns:
+            Facts dictionary, or None if unknown or recorded for a different schema
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT fingerprint, facts FROM table_metadata WHERE table_key = ?",
+                    (table_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Metadata catalog lookup failed for {table_key}: {str(e)}")
+            return None
+
+        if row is None:
+            return None
+
+        if row[0] != fingerprint:
+            logger.info(f"Schema of {table_key} changed since it was cataloged, rediscovering metadata")
+            return None
+
+        return json.loads(row[1])
+
+    def record(self, table_key: str, fingerprint: str, facts: Dict[str, Any]):
+        """
+        Record facts for a table.
+
+        Facts are merged with those already recorded for the same fingerprint and
+        replace them when the fingerprint changed.
+
+        Args:
+            table_key: Table identifier
+            fingerprint: Fingerprint of the schema the facts were derived from
+            facts: JSON-serializable facts
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT fingerprint, facts FROM table_metadata WHERE table_key = ?",
+                    (table_key,)
+                ).fetchone()
+
+                merged = json.loads(row[1]) if row is not None and row[0] == fingerprint else {}
+                merged.update(facts)
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO table_metadata (table_key, fingerprint, facts, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (table_key, fingerprint, json.dumps(merged, sort_keys=True), datetime.now().isoformat())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record metadata for {table_key}: {str(e)}")
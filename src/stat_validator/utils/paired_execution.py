@@ -0,0 +1,92 @@
+"""Concurrent execution of paired source/destination operations."""
+
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .logger import get_logger
+
+logger = get_logger('paired_execution')
+
+
+@dataclass
+class PairedResult:
+    """Results and timings of a source/destination operation pair."""
+    source: Any
+    dest: Any
+    source_seconds: float
+    dest_seconds: float
+    wall_seconds: float
+
+    def timings(self) -> Dict[str, float]:
+        """Return timings rounded for reporting."""
+        return {
+            'source_seconds': round(self.source_seconds, 3),
+            'dest_seconds': round(self.dest_seconds, 3),
+            'wall_seconds': round(self.wall_seconds, 3)
+        }
+
+
+def _timed(fn: Callable[[], Any]) -> tuple:
+    """Run fn and return (result, exception, elapsed_seconds)."""
+    start = time.perf_counter()
+    try:
+        return fn(), None, time.perf_counter() - start
+    except BaseException as e:
+        return None, e, time.perf_counter() - start
+
+
+def run_paired(
+    source_fn: Callable[[], Any],
+    dest_fn: Callable[[], Any],
+    label: str = 'paired',
+    concurrent: bool = True
+) -> PairedResult:
+    """
+    Run a source and a destination operation at the same time and join the results.
+
+    The destination operation runs on a helper thread while the source operation
+    runs on the calling thread, so latency is roughly that of the slower side.
+    Both sides always run to completion; if either raised, the exception is
+    re-raised afterwards (source first).
+
+    Args:
+        source_fn: Zero-argument callable for the source side
+        dest_fn: Zero-argument callable for the destination side
+        label: Name used in timing logs
+        concurrent: If False, run sequentially (e.g., when both sides share one connection)
+
+    Returns:
+        PairedResult with both results and per-side timings
+    """
+    start = time.perf_counter()
+
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='paired-dest') as executor:
+            # The helper thread sees the caller's context variables (e.g. per-table output routing)
+            dest_future = executor.submit(contextvars.copy_context().run, _timed, dest_fn)
+            source, source_error, source_seconds = _timed(source_fn)
+            dest, dest_error, dest_seconds = dest_future.result()
+    else:
+        source, source_error, source_seconds = _timed(source_fn)
+        dest, dest_error, dest_seconds = _timed(dest_fn)
+
+    wall_seconds = time.perf_counter() - start
+    logger.info(
+        f"{label}: source {source_seconds:.2f}s, dest {dest_seconds:.2f}s, "
+        f"wall {wall_seconds:.2f}s ({'concurrent' if concurrent else 'sequential'})"
+    )
+
+    error: Optional[BaseException] = source_error or dest_error
+    if error is not None:
+        raise error
+
+    return PairedResult(
+        source=source,
+        dest=dest,
+        source_seconds=source_seconds,
+        dest_seconds=dest_seconds,
+        wall_seconds=wall_seconds
+    )
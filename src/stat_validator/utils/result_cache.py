@@ -0,0 +1,144 @@
+"""Persistent cache of whole comparison results, validated by freshness probes."""
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .logger import get_logger
+
+logger = get_logger('result_cache')
+
+
+class ResultCache:
+    """
+    SQLite store of comparison results keyed by what they were computed from.
+
+    An entry is identified by the table pair, filters and columns; it is only
+    returned while the hash of the effective config and the freshness probes
+    of both sides (e.g. row count and latest refresh timestamp over the
+    filtered range) still match the ones it was stored with.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS comparison_results (
+                    cache_key TEXT PRIMARY KEY,
+                    config_hash TEXT NOT NULL,
+                    thresholds_hash TEXT NOT NULL,
+                    source_probe TEXT NOT NULL,
+                    dest_probe TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection (safe to use from any thread or process)."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def digest(value: Any) -> str:
+        """
+        Hash a JSON-serializable value deterministically.
+
+        Args:
+            value: Value to hash (dict keys are sorted)
+
+        Returns:
+            Hex digest
+        """
+        encoded = json.dumps(value, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()[:16]
+
+    def get(
+        self,
+        cache_key: str,
+        config_hash: str,
+        source_probe: Dict[str, Any],
+        dest_probe: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored entry if it was computed from the same data and config.
+
+        Args:
+            cache_key: Digest of the table pair, filters and columns
+            config_hash: Digest of the effective config (without thresholds)
+            source_probe: Fresh source freshness probe
+            dest_probe: Fresh destination freshness probe
+
+        Returns:
+            Dictionary with 'result', 'thresholds_hash' and 'updated_at', or None
+            if there is no entry or the config or either side changed
+        """
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT config_hash, source_probe, dest_probe, thresholds_hash, result, updated_at "
+                    "FROM comparison_results WHERE cache_key = ?",
+                    (cache_key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache lookup failed for {cache_key}: {str(e)}")
+            return None
+
+        if row is None:
+            return None
+
+        if (row[0], row[1], row[2]) != (config_hash, self.digest(source_probe), self.digest(dest_probe)):
+            logger.info(f"Cached result {cache_key} is stale (config or data changed)")
+            return None
+
+        return {'result': json.loads(row[4]), 'thresholds_hash': row[3], 'updated_at': row[5]}
+
+    def put(
+        self,
+        cache_key: str,
+        config_hash: str,
+        thresholds_hash: str,
+        source_probe: Dict[str, Any],
+        dest_probe: Dict[str, Any],
+        result: Dict[str, Any]
+    ):
+        """
+        Store a comparison result.
+
+        Args:
+            cache_key: Digest of the table pair, filters and columns
+            config_hash: Digest of the effective config (without thresholds)
+            thresholds_hash: Digest of the thresholds the result was scored with
+            source_probe: Source freshness probe taken before the comparison
+            dest_probe: Destination freshness probe taken before the comparison
+            result: Comparison result
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO comparison_results "
+                    "(cache_key, config_hash, thresholds_hash, source_probe, dest_probe, result, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        cache_key, config_hash, thresholds_hash,
+                        self.digest(source_probe), self.digest(dest_probe),
+                        json.dumps(result, default=str), datetime.now().isoformat()
+                    )
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not cache result {cache_key}: {str(e)}")
@@ -0,0 +1,127 @@
+"""Source query results shared by the comparisons of a bulk run that read the same table."""
+
+import hashlib
+import os
+import re
+import shutil
+import threading
+from typing import Callable, Iterable, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows: scans are still shared, but not serialized
+    fcntl = None
+
+logger = get_logger('scan_share')
+
+
+class ScanShare:
+    """
+    Directory of source query results, reused by comparisons that issue the same query.
+
+    When several comparisons of a bulk run read the same source table (e.g.
+    the raw and refined Dremio layers of one SAP table), the first one to run
+    a query against it stores the Arrow result as Parquet, and the others
+    read it back instead of querying the source again. A lock file per query
+    makes a comparison that arrives while the query is still running wait
+    for it instead of scanning in parallel, across all worker processes.
+
+    Only queries that read one of the shared tables are stored.
+    """
+
+    def __init__(self, directory: str, tables: Iterable[str]):
+        """
+        Initialize the share.
+
+        Args:
+            directory: Directory for the stored results (one subdirectory per table)
+            tables: Source tables (as written in the queries) read by more than one comparison
+        """
+        self.directory = directory
+        self.tables = sorted(set(tables), key=len, reverse=True)
+
+        # Queries of this process served from the share
+        self.reused = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def covers(self, query: str) -> Optional[str]:
+        """
+        Find the shared table a query reads.
+
+        Returns:
+            The table, or None if the query reads no shared table
+        """
+        for table in self.tables:
+            if table in query:
+                return table
+        return None
+
+    def table_dir(self, table: str) -> str:
+        """Directory holding the stored results of one table."""
+        return os.path.join(self.directory, re.sub(r'[^A-Za-z0-9]+', '_', table).strip('_'))
+
+    def fetch(self, query: str, run: Callable[[], pa.Table]) -> pa.Table:
+        """
+        Get the result of a query, running it only if no comparison has yet.
+
+        Args:
+            query: SQL query against the source
+            run: Runs the query against the source
+
+        Returns:
+            Query result
+        """
+        table = self.covers(query)
+        if table is None:
+            return run()
+
+        directory = self.table_dir(table)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{hashlib.sha256(query.encode('utf-8')).hexdigest()[:32]}.parquet")
+
+        with open(f"{path}.lock", 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if os.path.exists(path):
+                    try:
+                        result = pq.read_table(path)
+                        with self._lock:
+                            self.reused += 1
+                        logger.info(f"Reused shared scan of {table} ({result.num_rows} rows)")
+                        return result
+                    except Exception as e:
+                        logger.warning(f"Ignoring unreadable shared scan {path}: {str(e)}")
+
+                result = run()
+                try:
+                    pq.write_table(result, f"{path}.tmp")
+                    os.replace(f"{path}.tmp", path)
+                except Exception as e:
+                    logger.warning(f"Could not share scan of {table}: {str(e)}")
+                return result
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def release(self, table: str):
+        """Remove the stored results of a table once no comparison needs them anymore."""
+        shutil.rmtree(self.table_dir(table), ignore_errors=True)
+
+    def clear(self):
+        """Remove all stored results."""
+        shutil.rmtree(self.directory, ignore_errors=True)
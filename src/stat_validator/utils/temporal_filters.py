@@ -0,0 +1,188 @@
+"""Sargable temporal filters: half-open range predicates on the raw column."""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple, Union
+
+# How a temporal column is stored
+TIMESTAMP = 'timestamp'   # DATE / TIMESTAMP column, compared to TIMESTAMP literals
+EPOCH_MS = 'epoch_ms'     # BIGINT milliseconds since the Unix epoch (UTC)
+
+DateLike = Union[str, date, datetime]
+
+
+def _to_datetime(value: DateLike) -> datetime:
+    """Parse 'YYYY-MM-DD' strings and promote dates to midnight datetimes."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def day_range(day: DateLike) -> Tuple[datetime, datetime]:
+    """
+    Half-open bounds [day, day + 1) of one calendar day.
+
+    Args:
+        day: Day as 'YYYY-MM-DD', date or datetime
+
+    Returns:
+        Tuple of (start, end) datetimes
+    """
+    start = _to_datetime(day).replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, start + timedelta(days=1)
+
+
+def month_range(year: int, month: int) -> Tuple[datetime, datetime]:
+    """
+    Half-open bounds [first day, first day of next month) of one month.
+
+    Args:
+        year: Year
+        month: Month (1-12)
+
+    Returns:
+        Tuple of (start, end) datetimes
+    """
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+
+def months_in_range(first: Tuple[int, int], last: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    List the months from first to last, both inclusive.
+
+    Args:
+        first: First month as (year, month)
+        last: Last month as (year, month)
+
+    Returns:
+        List of (year, month) tuples (empty if last is before first)
+    """
+    first_index, last_index = first[0] * 12 + first[1] - 1, last[0] * 12 + last[1] - 1
+    return [(index // 12, index % 12 + 1) for index in range(first_index, last_index + 1)]
+
+
+def days_in_range(start: DateLike, end: DateLike) -> List[date]:
+    """
+    List the calendar days from start to end, both inclusive.
+
+    Args:
+        start: First day
+        end: Last day
+
+    Returns:
+        List of dates (empty if end is before start)
+    """
+    first, last = _to_datetime(start).date(), _to_datetime(end).date()
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def _literal(value: datetime, encoding: str) -> str:
+    """Render a bound as a literal comparable to a column with the given encoding."""
+    if encoding == EPOCH_MS:
+        return str(int(value.replace(tzinfo=timezone.utc).timestamp() * 1000))
+    if encoding == TIMESTAMP:
+        return f"TIMESTAMP '{value.strftime('%Y-%m-%d %H:%M:%S')}'"
+    raise ValueError(f"Unknown temporal column encoding: {encoding!r} (expected '{TIMESTAMP}' or '{EPOCH_MS}')")
+
+
+def range_predicate(column: str, start: datetime, end: datetime, encoding: str = TIMESTAMP) -> str:
+    """
+    Build 'column >= start AND column < end' with the column left unwrapped.
+
+    Keeping functions off the column lets HANA use its indexes and Dremio
+    prune partitions and files by the column's bounds.
+
+    Args:
+        column: Column expression (e.g. 'REFRESH_DT' or 't."REFRESH_DT"')
+        start: Inclusive lower bound
+        end: Exclusive upper bound
+        encoding: TIMESTAMP or EPOCH_MS
+
+    Returns:
+        SQL predicate
+    """
+    return f"{column} >= {_literal(start, encoding)} AND {column} < {_literal(end, encoding)}"
+
+
+def build_date_filter(
+    filter_config: Dict[str, Any],
+    day: DateLike,
+    default_column: str,
+    default_encoding: str
+) -> str:
+    """
+    Build the WHERE predicate selecting one day from a temporal_filters entry.
+
+    A configured 'sql_template' (with {column} and {date} placeholders) takes
+    precedence, for columns that need custom handling; otherwise a range
+    predicate is built from 'column' and 'encoding'.
+
+    Args:
+        filter_config: temporal_filters.sap or temporal_filters.dremio section
+        day: Day as 'YYYY-MM-DD', date or datetime
+        default_column: Column used when the config has none
+        default_encoding: Encoding used when the config has none
+
+    Returns:
+        SQL predicate
+    """
+    column = filter_config.get('column', default_column)
+
+    template = filter_config.get('sql_template')
+    if template:
+        return template.format(column=column, date=_to_datetime(day).strftime('%Y-%m-%d'))
+
+    start, end = day_range(day)
+    return range_predicate(column, start, end, filter_config.get('encoding', default_encoding))
+
+
+@dataclass(frozen=True)
+class TemporalColumn:
+    """A temporal column and how it is stored, for filtering and grouping by day."""
+    column: str
+    encoding: str = TIMESTAMP
+
+    @classmethod
+    def from_config(
+        cls,
+        filter_config: Dict[str, Any],
+        default_column: str,
+        default_encoding: str
+    ) -> 'TemporalColumn':
+        """
+        Create from a temporal_filters entry.
+
+        Raises:
+            ValueError: If the entry uses an sql_template, which cannot express
+                        day ranges or day grouping
+        """
+        if filter_config.get('sql_template'):
+            raise ValueError("Date ranges need temporal_filters 'column' and 'encoding', not 'sql_template'")
+        return cls(
+            column=filter_config.get('column', default_column),
+            encoding=filter_config.get('encoding', default_encoding)
+        )
+
+    def range_predicate(self, start: datetime, end: datetime) -> str:
+        """Half-open range predicate on the raw column."""
+        return range_predicate(self.column, start, end, self.encoding)
+
+    def day_predicate(self, day: DateLike) -> str:
+        """Predicate selecting one calendar day."""
+        return self.range_predicate(*day_range(day))
+
+    def duckdb_day_expression(self, column: str) -> str:
+        """
+        DuckDB expression giving the calendar day of a cached copy of the column.
+
+        Args:
+            column: Quoted column name in the DuckDB cache table
+        """
+        if self.encoding == EPOCH_MS:
+            # Integer arithmetic, so days are UTC regardless of the session time zone
+            return f"(DATE '1970-01-01' + CAST(FLOOR({column} / 86400000) AS INTEGER))"
+        return f"CAST({column} AS DATE)"